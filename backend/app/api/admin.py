@@ -4,7 +4,7 @@ import secrets
 from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, delete
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import selectinload, joinedload
 from uuid import UUID
 from datetime import datetime, timedelta
 from pydantic import BaseModel, EmailStr
@@ -12,11 +12,12 @@ from pydantic import BaseModel, EmailStr
 from app.db.postgres import get_db
 from app.models.user import User
 from app.models.role import Role, DEFAULT_ROLES
+from app.models.permission_set import PermissionSet
 from app.models.test import Test, Collection
 from app.models.schedule import Schedule
 from app.models.run import Run
 from app.models.invitation import Invitation
-from app.security import get_current_user, require_permission, get_password_hash
+from app.security import get_current_user, require_permission, get_password_hash, hash_token, invalidate_user
 
 router = APIRouter()
 
@@ -32,8 +33,7 @@ class RoleResponse(BaseModel):
     is_system: bool
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = {"from_attributes": True}
 
 
 class RoleCreate(BaseModel):
@@ -59,8 +59,7 @@ class UserAdminResponse(BaseModel):
     role_id: UUID | None
     role_name: str | None
 
-    class Config:
-        from_attributes = True
+    model_config = {"from_attributes": True}
 
 
 class UserRoleUpdate(BaseModel):
@@ -89,8 +88,7 @@ class InvitationResponse(BaseModel):
     created_at: datetime
     magic_link: str | None = None
 
-    class Config:
-        from_attributes = True
+    model_config = {"from_attributes": True}
 
 
 class AdminStats(BaseModel):
@@ -105,6 +103,18 @@ class AdminStats(BaseModel):
 
 # ============== Role Endpoints ==============
 
+async def get_or_create_permission_set(db: AsyncSession, permissions: dict) -> PermissionSet:
+    """Return the shared permission set for a permissions dict, creating it if new."""
+    sha = PermissionSet.digest(permissions)
+    result = await db.execute(select(PermissionSet).where(PermissionSet.sha == sha))
+    permission_set = result.scalar_one_or_none()
+    if permission_set is None:
+        permission_set = PermissionSet(sha=sha, perms=permissions, bits=PermissionSet.encode_bits(permissions))
+        db.add(permission_set)
+        await db.flush()
+    return permission_set
+
+
 @router.get("/roles", response_model=list[RoleResponse])
 async def list_roles(
     current_user: User = Depends(require_permission("manage_roles")),
@@ -146,7 +156,7 @@ async def create_role(
         name=data.name,
         display_name=data.display_name,
         description=data.description,
-        permissions=data.permissions,
+        permission_set=await get_or_create_permission_set(db, data.permissions),
         is_system=False,
     )
     db.add(role)
@@ -182,10 +192,11 @@ async def update_role(
     if data.description is not None:
         role.description = data.description
     if data.permissions is not None:
-        role.permissions = data.permissions
+        role.permission_set = await get_or_create_permission_set(db, data.permissions)
 
     role.updated_at = datetime.utcnow()
     await db.commit()
+    Role.invalidate_cached(role.id)
     await db.refresh(role)
     return role
 
@@ -217,6 +228,7 @@ async def delete_role(
 
     await db.delete(role)
     await db.commit()
+    Role.invalidate_cached(role_id)
     return {"status": "deleted", "role_id": str(role_id)}
 
 
@@ -257,12 +269,7 @@ async def get_user(
     db: AsyncSession = Depends(get_db)
 ):
     """Get a specific user (admin only)."""
-    result = await db.execute(
-        select(User)
-        .options(selectinload(User.role))
-        .where(User.id == user_id)
-    )
-    user = result.scalar_one_or_none()
+    user = await db.get(User, user_id, options=[joinedload(User.role)])
 
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
@@ -292,12 +299,7 @@ async def update_user_role(
     if not role:
         raise HTTPException(status_code=404, detail="Role not found")
 
-    result = await db.execute(
-        select(User)
-        .options(selectinload(User.role))
-        .where(User.id == user_id)
-    )
-    user = result.scalar_one_or_none()
+    user = await db.get(User, user_id, options=[joinedload(User.role)])
 
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
@@ -308,14 +310,10 @@ async def update_user_role(
 
     user.role_id = data.role_id
     await db.commit()
+    invalidate_user(user_id)
 
     # Reload with role
-    result = await db.execute(
-        select(User)
-        .options(selectinload(User.role))
-        .where(User.id == user_id)
-    )
-    user = result.scalar_one()
+    user = await db.get(User, user_id, options=[joinedload(User.role)], populate_existing=True)
 
     return UserAdminResponse(
         id=user.id,
@@ -337,12 +335,7 @@ async def update_user_status(
     db: AsyncSession = Depends(get_db)
 ):
     """Activate or deactivate a user (admin only)."""
-    result = await db.execute(
-        select(User)
-        .options(selectinload(User.role))
-        .where(User.id == user_id)
-    )
-    user = result.scalar_one_or_none()
+    user = await db.get(User, user_id, options=[joinedload(User.role)])
 
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
@@ -353,6 +346,7 @@ async def update_user_status(
 
     user.is_active = data.is_active
     await db.commit()
+    invalidate_user(user_id)
     await db.refresh(user)
 
     return UserAdminResponse(
@@ -385,6 +379,7 @@ async def delete_user(
 
     await db.delete(user)
     await db.commit()
+    invalidate_user(user_id)
     return {"status": "deleted", "user_id": str(user_id)}
 
 
@@ -449,9 +444,9 @@ async def create_invitation(
         raise HTTPException(status_code=400, detail="User with this email already exists")
 
     existing_invite = await db.execute(
-        select(Invitation).where(
+        select(Invitation.id).where(
             Invitation.email == data.email,
-            Invitation.status == "pending"
+            *Invitation.valid_clause()
         )
     )
     if existing_invite.scalar_one_or_none():
@@ -465,7 +460,7 @@ async def create_invitation(
     token = generate_magic_token()
     invitation = Invitation(
         email=data.email,
-        token=token,
+        token_hash=hash_token(token),
         role_id=data.role_id,
         invited_by_id=current_user.id,
         message=data.message,
@@ -522,14 +517,15 @@ async def resend_invitation(
         raise HTTPException(status_code=400, detail="Can only resend pending invitations")
 
     # Generate new token and extend expiry
-    invitation.token = generate_magic_token()
+    token = generate_magic_token()
+    invitation.token_hash = hash_token(token)
     invitation.expires_at = datetime.utcnow() + timedelta(days=7)
     await db.commit()
 
     background_tasks.add_task(
         send_invitation_email,
         invitation.email,
-        invitation.token,
+        token,
         current_user.name,
         invitation.message
     )
@@ -587,7 +583,7 @@ async def get_admin_stats(
 
     # Pending invitations
     pending_invites_result = await db.execute(
-        select(func.count(Invitation.id)).where(Invitation.status == "pending")
+        select(func.count(Invitation.id)).where(*Invitation.valid_clause())
     )
     pending_invitations = pending_invites_result.scalar() or 0
 
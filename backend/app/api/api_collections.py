@@ -3,7 +3,7 @@
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, File
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import selectinload, raiseload
 from uuid import UUID
 import json
 
@@ -35,26 +35,28 @@ async def list_collections(
     query = (
         select(APICollection)
         .where(tenant_filter(APICollection, current_user))
+        .options(raiseload("*"))
         .order_by(APICollection.updated_at.desc())
     )
 
     result = await db.execute(query)
     collections = result.scalars().all()
+    collection_ids = [c.id for c in collections]
+
+    # Request and environment counts for all listed collections, one query each
+    request_counts = dict((await db.execute(
+        select(APIRequest.collection_id, func.count(APIRequest.id))
+        .where(APIRequest.collection_id.in_(collection_ids))
+        .group_by(APIRequest.collection_id)
+    )).all())
+    env_counts = dict((await db.execute(
+        select(APIEnvironment.collection_id, func.count(APIEnvironment.id))
+        .where(APIEnvironment.collection_id.in_(collection_ids))
+        .group_by(APIEnvironment.collection_id)
+    )).all())
 
-    # Get counts for each collection
     summaries = []
     for collection in collections:
-        # Count requests
-        request_count = await db.execute(
-            select(func.count(APIRequest.id))
-            .where(APIRequest.collection_id == collection.id)
-        )
-
-        # Count environments
-        env_count = await db.execute(
-            select(func.count(APIEnvironment.id))
-            .where(APIEnvironment.collection_id == collection.id)
-        )
 
         summaries.append(APICollectionSummary(
             id=collection.id,
@@ -63,8 +65,8 @@ async def list_collections(
             base_url=collection.base_url,
             default_engine=collection.default_engine,
             import_source=collection.import_source,
-            request_count=request_count.scalar() or 0,
-            environment_count=env_count.scalar() or 0,
+            request_count=request_counts.get(collection.id, 0),
+            environment_count=env_counts.get(collection.id, 0),
             created_at=collection.created_at,
             updated_at=collection.updated_at,
         ))
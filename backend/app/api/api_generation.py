@@ -256,20 +256,15 @@ async def generate_from_openapi(
     # If AI enhancement is requested, improve each test
     if generate_negative:
         generator = APITestGenerator()
+        # Generate negative tests for each endpoint
+        results = await generator.generate_negative_tests_batch(requests, max_tests=2)
         enhanced_requests = []
 
-        for req in requests:
-            try:
-                # Generate negative tests for each endpoint
-                negative_tests = await generator.generate_negative_tests(
-                    positive_test=req,
-                    max_tests=2,
-                )
-                enhanced_requests.append(req)
+        for req, negative_tests in zip(requests, results):
+            enhanced_requests.append(req)
+            # If AI fails, just use the original
+            if isinstance(negative_tests, list):
                 enhanced_requests.extend(negative_tests)
-            except Exception:
-                # If AI fails, just use the original
-                enhanced_requests.append(req)
 
         requests = enhanced_requests
 
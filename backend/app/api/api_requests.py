@@ -14,7 +14,9 @@ from app.schemas.api_request import (
     APIRequestUpdate,
     APIRequestResponse,
     ReorderRequestsRequest,
+    REQUEST_LIST_ADAPTER,
 )
+from app.schemas.api_assertions import ASSERTIONS_ADAPTER, EXTRACTIONS_ADAPTER
 from app.security import get_current_user
 from app.utils.tenant import tenant_filter
 
@@ -46,7 +48,7 @@ async def list_requests(
     )
     requests = result.scalars().all()
 
-    return [APIRequestResponse.model_validate(r) for r in requests]
+    return REQUEST_LIST_ADAPTER.validate_python(requests, from_attributes=True)
 
 
 @router.post("", response_model=APIRequestResponse)
@@ -77,8 +79,8 @@ async def create_request(
         headers=data.headers,
         query_params=data.query_params,
         body=data.body.model_dump() if data.body else None,
-        assertions=[a.model_dump() for a in data.assertions] if data.assertions else None,
-        variable_extractions=[v.model_dump() for v in data.variable_extractions] if data.variable_extractions else None,
+        assertions=ASSERTIONS_ADAPTER.dump_python(data.assertions, by_alias=True) if data.assertions else None,
+        variable_extractions=EXTRACTIONS_ADAPTER.dump_python(data.variable_extractions) if data.variable_extractions else None,
         pre_request_script=data.pre_request_script,
         pre_request_script_type=data.pre_request_script_type,
         post_response_script=data.post_response_script,
@@ -157,9 +159,9 @@ async def update_request(
     if data.body is not None:
         request.body = data.body.model_dump()
     if data.assertions is not None:
-        request.assertions = [a.model_dump() for a in data.assertions]
+        request.assertions = ASSERTIONS_ADAPTER.dump_python(data.assertions, by_alias=True)
     if data.variable_extractions is not None:
-        request.variable_extractions = [v.model_dump() for v in data.variable_extractions]
+        request.variable_extractions = EXTRACTIONS_ADAPTER.dump_python(data.variable_extractions)
     if data.pre_request_script is not None:
         request.pre_request_script = data.pre_request_script
     if data.pre_request_script_type is not None:
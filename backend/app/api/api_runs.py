@@ -2,12 +2,12 @@
 
 import json
 import logging
-from datetime import datetime
+from datetime import datetime, timedelta
 from urllib.parse import urljoin
 from fastapi import APIRouter, Depends, HTTPException, WebSocket, WebSocketDisconnect
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import selectinload, joinedload, raiseload
 from uuid import UUID
 
 from app.db.postgres import get_db, AsyncSessionLocal
@@ -16,17 +16,23 @@ from app.models.api_request import APIRequest
 from app.models.api_environment import APIEnvironment
 from app.models.api_test_run import APITestRun
 from app.models.api_request_result import APIRequestResult
+from app.models.response_body import ResponseBody
+from app.models.collection_daily_stats import CollectionDailyStats
 from app.models.user import User
 from app.schemas.api_test_run import (
     ExecuteCollectionRequest,
     ExecuteSingleRequestRequest,
     APITestRunResponse,
     APITestRunSummary,
+    APITestRunSummaryRow,
     APITestRunDetailResponse,
     APIRequestResultResponse,
+    CollectionDailyStatsResponse,
+    RESULT_LIST_ADAPTER,
 )
 from app.security import get_current_user, get_user_from_token
 from app.utils.tenant import tenant_filter, set_tenant
+from app.utils.responses import json_response, struct_response
 from app.services.api_testing import APITestEngine
 from app.services.api_testing.karate import KarateOrchestrator, KarateConverter
 
@@ -43,8 +49,10 @@ async def list_runs(
 ):
     """List test runs, optionally filtered by collection."""
     query = (
-        select(APITestRun)
+        select(APITestRun, APICollection.name)
+        .outerjoin(APICollection, APICollection.id == APITestRun.collection_id)
         .where(tenant_filter(APITestRun, current_user))
+        .options(raiseload("*"))
         .order_by(APITestRun.created_at.desc())
         .limit(limit)
     )
@@ -53,20 +61,10 @@ async def list_runs(
         query = query.where(APITestRun.collection_id == collection_id)
 
     result = await db.execute(query)
-    runs = result.scalars().all()
 
-    # Get collection names
     summaries = []
-    for run in runs:
-        collection_name = None
-        if run.collection_id:
-            coll_result = await db.execute(
-                select(APICollection.name)
-                .where(APICollection.id == run.collection_id)
-            )
-            collection_name = coll_result.scalar()
-
-        summaries.append(APITestRunSummary(
+    for run, collection_name in result.all():
+        summaries.append(APITestRunSummaryRow(
             id=run.id,
             collection_id=run.collection_id,
             collection_name=collection_name,
@@ -83,7 +81,32 @@ async def list_runs(
             created_at=run.created_at,
         ))
 
-    return summaries
+    return struct_response(summaries)
+
+
+@router.get("/stats/daily", response_model=list[CollectionDailyStatsResponse])
+async def get_daily_stats(
+    collection_id: UUID | None = None,
+    days: int = 30,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """Daily pass/fail totals per collection, read from the materialized rollup."""
+    since = datetime.utcnow() - timedelta(days=days)
+    query = (
+        select(CollectionDailyStats)
+        .where(
+            tenant_filter(CollectionDailyStats, current_user),
+            CollectionDailyStats.day >= since,
+        )
+        .order_by(CollectionDailyStats.day)
+    )
+
+    if collection_id:
+        query = query.where(CollectionDailyStats.collection_id == collection_id)
+
+    result = await db.execute(query)
+    return [CollectionDailyStatsResponse.model_validate(s) for s in result.scalars().all()]
 
 
 @router.get("/{run_id}", response_model=APITestRunDetailResponse)
@@ -99,7 +122,7 @@ async def get_run(
             APITestRun.id == run_id,
             tenant_filter(APITestRun, current_user),
         )
-        .options(selectinload(APITestRun.results))
+        .options(selectinload(APITestRun.results).joinedload(APIRequestResult.response_body_blob))
     )
     run = result.scalar_one_or_none()
 
@@ -108,7 +131,7 @@ async def get_run(
 
     # Sort results by execution order and build response list so all fields (e.g. resolved_url) are serialized
     sorted_results = sorted(run.results, key=lambda r: r.execution_order)
-    results_payload = [APIRequestResultResponse.model_validate(r) for r in sorted_results]
+    results_payload = [APIRequestResultResponse.from_orm_trusted(r) for r in sorted_results]
 
     if results_payload and run.engine == "karate":
         first = results_payload[0]
@@ -119,7 +142,7 @@ async def get_run(
             first.response_status,
         )
 
-    return APITestRunDetailResponse(
+    detail = APITestRunDetailResponse(
         id=run.id,
         collection_id=run.collection_id,
         name=run.name,
@@ -145,6 +168,7 @@ async def get_run(
         results=results_payload,
         run_context=run.run_context,
     )
+    return json_response(detail.model_dump_json())
 
 
 @router.get("/{run_id}/results", response_model=list[APIRequestResultResponse])
@@ -156,7 +180,7 @@ async def get_run_results(
     """Get results for a test run."""
     # Verify run access
     run_result = await db.execute(
-        select(APITestRun)
+        select(APITestRun.id)
         .where(
             APITestRun.id == run_id,
             tenant_filter(APITestRun, current_user),
@@ -165,14 +189,17 @@ async def get_run_results(
     if not run_result.scalar_one_or_none():
         raise HTTPException(status_code=404, detail="Test run not found")
 
-    result = await db.execute(
+    # Stream rows in batches so large runs are hydrated and validated incrementally
+    results = await db.stream_scalars(
         select(APIRequestResult)
         .where(APIRequestResult.test_run_id == run_id)
         .order_by(APIRequestResult.execution_order)
+        .options(joinedload(APIRequestResult.response_body_blob))
+        .execution_options(yield_per=500)
     )
-    results = result.scalars().all()
 
-    return [APIRequestResultResponse.model_validate(r) for r in results]
+    rows = [APIRequestResultResponse.from_orm_trusted(r) async for r in results]
+    return json_response(RESULT_LIST_ADAPTER.dump_json(rows))
 
 
 @router.delete("/{run_id}")
@@ -338,8 +365,11 @@ async def _execute_with_python(
             stop_on_failure=data.stop_on_failure,
         )
 
-        # Save results
-        for exec_result in result.results:
+        # Save results; identical bodies are stored once
+        body_shas = await ResponseBody.store(
+            db, [r.response.body[:10000] if r.response else None for r in result.results]
+        )
+        for exec_result, body_sha in zip(result.results, body_shas):
             request_result = APIRequestResult(
                 test_run_id=test_run.id,
                 request_id=exec_result.request_id,
@@ -350,7 +380,7 @@ async def _execute_with_python(
                 resolved_body=exec_result.resolved_body,
                 response_status=exec_result.response.status_code if exec_result.response else None,
                 response_headers=exec_result.response.headers if exec_result.response else None,
-                response_body=exec_result.response.body[:10000] if exec_result.response else None,
+                response_body_sha=body_sha,
                 response_size_bytes=exec_result.response.size_bytes if exec_result.response else None,
                 started_at=exec_result.started_at,
                 finished_at=exec_result.finished_at,
@@ -366,13 +396,7 @@ async def _execute_with_python(
         test_run.status = "passed" if result.all_passed else "failed"
         test_run.finished_at = datetime.utcnow()
         test_run.total_duration_ms = result.duration_ms
-        test_run.total_requests = result.total
-        test_run.passed_requests = result.passed
-        test_run.failed_requests = result.failed
-        test_run.skipped_requests = result.skipped
-        test_run.total_assertions = result.total_assertions
-        test_run.passed_assertions = result.passed_assertions
-        test_run.failed_assertions = result.failed_assertions
+        # Request/assertion counters are bumped by the api_request_results insert trigger
 
     finally:
         await engine.close()
@@ -465,7 +489,7 @@ async def _execute_with_karate(
             env_vars=env_vars,
         )
 
-        test_run.karate_job_id = job_id
+        test_run.karate_job_id = UUID(job_id)
 
         # Wait for result
         job_result = await orchestrator.get_result(job_id, timeout_seconds=300)
@@ -555,35 +579,25 @@ async def _execute_with_karate(
                     unified_results[0].get("resolved_method") if unified_results else None,
                 )
 
-                passed = sum(1 for r in unified_results if r["status"] == "passed")
-                failed = sum(1 for r in unified_results if r["status"] == "failed")
-
-                # Aggregate assertion counts from each result so run summary shows correct totals
-                total_assertions = 0
-                passed_assertions = 0
-                for r in unified_results:
-                    assertion_list = r.get("assertion_results") or []
-                    total_assertions += len(assertion_list)
-                    passed_assertions += sum(1 for a in assertion_list if a.get("passed") is True)
-
-                test_run.status = "passed" if failed == 0 else "failed"
-                test_run.total_requests = len(unified_results)
-                test_run.passed_requests = passed
-                test_run.failed_requests = failed
-                test_run.total_assertions = total_assertions
-                test_run.passed_assertions = passed_assertions
-                test_run.failed_assertions = total_assertions - passed_assertions
+                # Run summary counters are aggregated by the api_request_results insert trigger
+                failed = any(r["status"] == "failed" for r in unified_results)
+                test_run.status = "failed" if failed else "passed"
 
                 # Save results; map each scenario to the corresponding request by index
                 sorted_requests = sorted(collection.requests, key=lambda x: x.order_index) if collection.requests else []
                 base_url = collection_dict.get("base_url") or ""
                 default_headers = collection_dict.get("default_headers") or {}
 
+                # Truncate response bodies if too large; identical bodies are stored once
+                body_shas = await ResponseBody.store(
+                    db,
+                    [
+                        res["response_body"][:10000] if res.get("response_body") is not None else None
+                        for res in unified_results
+                    ],
+                )
+
                 for idx, res in enumerate(unified_results):
-                    # Truncate response body if too large
-                    response_body = res.get("response_body")
-                    if response_body and len(response_body) > 10000:
-                        response_body = response_body[:10000]
 
                     # Start from unified result; then always fill from collection when we have the request
                     # so Karate runs never have missing request details in the UI
@@ -641,7 +655,7 @@ async def _execute_with_karate(
                         # HTTP response details
                         response_status=res.get("response_status"),
                         response_headers=res.get("response_headers"),
-                        response_body=response_body,
+                        response_body_sha=body_shas[idx],
                     )
                     db.add(request_result)
 
@@ -900,7 +914,10 @@ async def execute_websocket(
                 )
                 test_run = run_result.scalar_one()
 
-                for exec_result in result.results:
+                body_shas = await ResponseBody.store(
+                    db, [r.response.body[:10000] if r.response else None for r in result.results]
+                )
+                for exec_result, body_sha in zip(result.results, body_shas):
                     request_result = APIRequestResult(
                         test_run_id=test_run.id,
                         request_id=exec_result.request_id,
@@ -911,7 +928,7 @@ async def execute_websocket(
                         resolved_body=exec_result.resolved_body,
                         response_status=exec_result.response.status_code if exec_result.response else None,
                         response_headers=exec_result.response.headers if exec_result.response else None,
-                        response_body=exec_result.response.body[:10000] if exec_result.response else None,
+                        response_body_sha=body_sha,
                         duration_ms=exec_result.duration_ms,
                         assertion_results=exec_result.assertion_results,
                         extracted_variables=exec_result.extracted_variables,
@@ -922,13 +939,6 @@ async def execute_websocket(
                 test_run.status = "passed" if result.all_passed else "failed"
                 test_run.finished_at = datetime.utcnow()
                 test_run.total_duration_ms = result.duration_ms
-                test_run.total_requests = result.total
-                test_run.passed_requests = result.passed
-                test_run.failed_requests = result.failed
-                test_run.skipped_requests = result.skipped
-                test_run.total_assertions = result.total_assertions
-                test_run.passed_assertions = result.passed_assertions
-                test_run.failed_assertions = result.failed_assertions
 
                 await db.commit()
 
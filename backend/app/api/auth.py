@@ -3,7 +3,7 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload
 
 from app.db.postgres import get_db
 from app.models.user import User
@@ -56,7 +56,7 @@ async def register(data: UserCreate, db: AsyncSession = Depends(get_db)):
 
     user = User(
         email=data.email,
-        hashed_password=get_password_hash(data.password),
+        hashed_password=await get_password_hash(data.password),
         name=data.name,
         role_id=default_role.id if default_role else None,
     )
@@ -64,12 +64,7 @@ async def register(data: UserCreate, db: AsyncSession = Depends(get_db)):
     await db.commit()
 
     # Reload with role relationship
-    result = await db.execute(
-        select(User)
-        .options(selectinload(User.role))
-        .where(User.id == user.id)
-    )
-    user = result.scalar_one()
+    user = await db.get(User, user.id, options=[joinedload(User.role)], populate_existing=True)
 
     access_token = create_access_token(data={"sub": str(user.id)})
 
@@ -87,12 +82,12 @@ async def login(
 ):
     result = await db.execute(
         select(User)
-        .options(selectinload(User.role))
+        .options(joinedload(User.role))
         .where(User.email == form_data.username)
     )
     user = result.scalar_one_or_none()
 
-    if not user or not verify_password(form_data.password, user.hashed_password):
+    if not user or not await verify_password(form_data.password, user.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
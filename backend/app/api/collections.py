@@ -1,6 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func
+from sqlalchemy.orm import raiseload
 from uuid import UUID
 
 from app.db.postgres import get_db
@@ -21,16 +22,20 @@ async def list_collections(
     result = await db.execute(
         select(Collection)
         .where(tenant_filter(Collection, current_user))
+        .options(raiseload("*"))
         .order_by(Collection.name)
     )
     collections = result.scalars().all()
 
+    test_counts = dict((await db.execute(
+        select(Test.collection_id, func.count(Test.id))
+        .where(Test.collection_id.in_([c.id for c in collections]))
+        .group_by(Test.collection_id)
+    )).all())
+
     response = []
     for collection in collections:
-        test_count_result = await db.execute(
-            select(func.count(Test.id)).where(Test.collection_id == collection.id)
-        )
-        test_count = test_count_result.scalar() or 0
+        test_count = test_counts.get(collection.id, 0)
 
         response.append(CollectionResponse(
             id=collection.id,
@@ -230,7 +230,7 @@ async def bulk_action(
     return suggestions
 
 
-@router.get("/settings", response_model=HealingSettingsResponse)
+@router.get("/settings", response_model=HealingSettingsResponse, response_model_exclude_none=True)
 async def get_healing_settings():
     """Get current healing settings."""
     return HealingSettingsResponse(
@@ -3,7 +3,7 @@
 from fastapi import APIRouter, Depends, HTTPException, WebSocket, WebSocketDisconnect
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import selectinload, undefer_group, raiseload
 from uuid import UUID
 from datetime import datetime
 from pydantic import BaseModel
@@ -19,7 +19,8 @@ from app.security import get_current_user
 from app.utils.tenant import tenant_filter
 from app.config import get_settings
 from app.services.variant_generator import VariantGenerator
-from jose import jwt, JWTError
+import jwt
+from jwt import PyJWTError
 
 config = get_settings()
 router = APIRouter()
@@ -61,8 +62,7 @@ class DiscoveredPageResponse(BaseModel):
     graph_z: float | None
     discovered_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = {"from_attributes": True}
 
 
 class PageConnectionResponse(BaseModel):
@@ -72,8 +72,7 @@ class PageConnectionResponse(BaseModel):
     action_type: str
     action_text: str | None
 
-    class Config:
-        from_attributes = True
+    model_config = {"from_attributes": True}
 
 
 class ProjectResponse(BaseModel):
@@ -92,8 +91,7 @@ class ProjectResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = {"from_attributes": True}
 
 
 class ProjectDetailResponse(ProjectResponse):
@@ -134,6 +132,7 @@ async def list_projects(
     result = await db.execute(
         select(Project)
         .where(tenant_filter(Project, current_user))
+        .options(raiseload("*"))
         .order_by(Project.created_at.desc())
     )
     return result.scalars().all()
@@ -149,7 +148,7 @@ async def get_project(
     result = await db.execute(
         select(Project)
         .options(
-            selectinload(Project.pages),
+            selectinload(Project.pages).options(undefer_group("graph")),
             selectinload(Project.connections)
         )
         .where(Project.id == project_id, tenant_filter(Project, current_user))
@@ -218,7 +217,11 @@ async def get_project_graph(
     result = await db.execute(
         select(Project)
         .options(
-            selectinload(Project.pages),
+            selectinload(Project.pages).options(
+                undefer_group("graph"),
+                undefer_group("analysis"),
+                undefer_group("content"),
+            ),
             selectinload(Project.connections)
         )
         .where(Project.id == project_id, tenant_filter(Project, current_user))
@@ -288,7 +291,7 @@ async def get_user_from_token(token: str, db) -> User | None:
 
         result = await db.execute(select(User).where(User.id == user_id))
         return result.scalar_one_or_none()
-    except JWTError:
+    except PyJWTError:
         return None
 
 
@@ -475,9 +478,8 @@ async def discover_project_websocket(websocket: WebSocket, project_id: str, toke
             project = proj_result.scalar_one()
             project.status = "completed" if result.get("success") else "failed"
             project.discovery_completed_at = datetime.utcnow()
-            project.pages_discovered = result.get("pages_discovered", 0)
+            # pages_discovered/patterns_detected are bumped by the discovered_pages insert trigger
             project.features_found = result.get("features_found", 0)
-            project.patterns_detected = result.get("patterns_detected", 0)
             await db.commit()
 
         await websocket.send_json({
@@ -530,8 +532,7 @@ class TestCaseResponse(BaseModel):
     last_run_duration: int | None
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = {"from_attributes": True}
 
 
 @router.get("/{project_id}/tests", response_model=list[TestCaseResponse])
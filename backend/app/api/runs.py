@@ -17,7 +17,8 @@ from app.services.test_runner import PlaywrightTestRunner
 from app.config import get_settings
 from app.security import get_current_user
 from app.utils.tenant import tenant_filter
-from jose import jwt, JWTError
+import jwt
+from jwt import PyJWTError
 
 config = get_settings()
 
@@ -32,8 +33,7 @@ class RunResponse(BaseModel):
     finished_at: datetime | None
     error_message: str | None
 
-    class Config:
-        from_attributes = True
+    model_config = {"from_attributes": True}
 
 
 class RunCreate(BaseModel):
@@ -120,7 +120,7 @@ async def get_user_from_token(token: str, db) -> User | None:
 
         result = await db.execute(select(User).where(User.id == user_id))
         return result.scalar_one_or_none()
-    except JWTError:
+    except PyJWTError:
         return None
 
 
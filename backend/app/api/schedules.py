@@ -1,10 +1,12 @@
 from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import selectinload, raiseload
 from uuid import UUID
 from datetime import datetime, timedelta
-from pydantic import BaseModel, model_validator
+from typing import Literal
+from croniter import croniter
+from pydantic import BaseModel, field_validator, model_validator
 
 from app.db.postgres import get_db
 from app.models.schedule import Schedule
@@ -19,17 +21,33 @@ from app.utils.tenant import tenant_filter, set_tenant
 router = APIRouter()
 
 
+def _check_cron(value: str | None) -> str | None:
+    if value is not None and not croniter.is_valid(value):
+        raise ValueError("Invalid cron expression")
+    return value
+
+
+def _parse_days(value):
+    # The API keeps the "1,2,3,4,5" wire format; the column is smallint[]
+    if isinstance(value, str):
+        return [int(d) for d in value.split(",") if d.strip()]
+    return value
+
+
 class ScheduleCreate(BaseModel):
     name: str
     test_id: UUID | None = None
     collection_id: UUID | None = None
-    frequency: str  # hourly, daily, weekly, custom
+    frequency: Literal["hourly", "daily", "weekly", "custom"]
     cron_expression: str | None = None
     run_at_hour: int | None = None
     run_at_minute: int | None = 0
-    run_on_days: str | None = None  # "1,2,3,4,5" for weekdays
+    run_on_days: list[int] | None = None  # "1,2,3,4,5" for weekdays
     enabled: bool = True
 
+    validate_cron = field_validator('cron_expression')(_check_cron)
+    parse_days = field_validator('run_on_days', mode='before')(_parse_days)
+
     @model_validator(mode='after')
     def validate_target(self):
         if not self.test_id and not self.collection_id:
@@ -41,13 +59,16 @@ class ScheduleCreate(BaseModel):
 
 class ScheduleUpdate(BaseModel):
     name: str | None = None
-    frequency: str | None = None
+    frequency: Literal["hourly", "daily", "weekly", "custom"] | None = None
     cron_expression: str | None = None
     run_at_hour: int | None = None
     run_at_minute: int | None = None
-    run_on_days: str | None = None
+    run_on_days: list[int] | None = None
     enabled: bool | None = None
 
+    validate_cron = field_validator('cron_expression')(_check_cron)
+    parse_days = field_validator('run_on_days', mode='before')(_parse_days)
+
 
 class ScheduleResponse(BaseModel):
     id: UUID
@@ -66,10 +87,12 @@ class ScheduleResponse(BaseModel):
     last_run_at: datetime | None
     next_run_at: datetime | None
     last_run_status: str | None
+    total_runs: int = 0
+    total_passed: int = 0
+    total_failed: int = 0
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = {"from_attributes": True}
 
 
 def build_schedule_response(schedule: Schedule) -> ScheduleResponse:
@@ -86,11 +109,14 @@ def build_schedule_response(schedule: Schedule) -> ScheduleResponse:
         cron_expression=schedule.cron_expression,
         run_at_hour=schedule.run_at_hour,
         run_at_minute=schedule.run_at_minute,
-        run_on_days=schedule.run_on_days,
+        run_on_days=",".join(map(str, schedule.run_on_days)) if schedule.run_on_days else None,
         enabled=schedule.enabled,
         last_run_at=schedule.last_run_at,
         next_run_at=schedule.next_run_at,
         last_run_status=schedule.last_run_status,
+        total_runs=schedule.total_runs,
+        total_passed=schedule.total_passed,
+        total_failed=schedule.total_failed,
         created_at=schedule.created_at,
     )
 
@@ -104,7 +130,7 @@ async def list_schedules(
     result = await db.execute(
         select(Schedule)
         .where(tenant_filter(Schedule, current_user))
-        .options(selectinload(Schedule.test), selectinload(Schedule.collection))
+        .options(selectinload(Schedule.test), selectinload(Schedule.collection), raiseload("*"))
         .order_by(Schedule.created_at.desc())
     )
     schedules = result.scalars().all()
@@ -346,8 +372,7 @@ class TestRunResponse(BaseModel):
     duration_ms: int | None
     error_message: str | None
 
-    class Config:
-        from_attributes = True
+    model_config = {"from_attributes": True}
 
 
 class ScheduleRunResponse(BaseModel):
@@ -366,8 +391,7 @@ class ScheduleRunResponse(BaseModel):
     error_message: str | None
     test_runs: list[TestRunResponse] | None = None
 
-    class Config:
-        from_attributes = True
+    model_config = {"from_attributes": True}
 
 
 @router.get("/{schedule_id}/runs", response_model=list[ScheduleRunResponse])
@@ -46,7 +46,7 @@ async def get_settings_endpoint(
     return settings
 
 
-@router.get("/healing", response_model=HealingSettingsResponse)
+@router.get("/healing", response_model=HealingSettingsResponse, response_model_exclude_none=True)
 async def get_healing_settings(
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
@@ -62,7 +62,7 @@ async def get_healing_settings(
     )
 
 
-@router.patch("/healing", response_model=HealingSettingsResponse)
+@router.patch("/healing", response_model=HealingSettingsResponse, response_model_exclude_none=True)
 async def update_healing_settings(
     data: HealingSettingsUpdate,
     current_user: User = Depends(get_current_user),
@@ -2,7 +2,7 @@ from fastapi import APIRouter, Depends, HTTPException
 from fastapi.responses import PlainTextResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import selectinload, raiseload
 from uuid import UUID
 
 from app.db.postgres import get_db
@@ -11,13 +11,15 @@ from app.models.run import Run
 from app.models.user import User
 from app.schemas.test import (
     TestCreate, TestUpdate, TestResponse, TestListResponse, TestVersionResponse,
-    GenerateVariantsRequest, GenerateVariantsResponse, VariantResponse
+    GenerateVariantsRequest, GenerateVariantsResponse, VariantResponse,
+    TestListRow, CollectionBasicRow
 )
 from app.schemas.step import StepReorder, StepUpdate
 from app.services.playwright_generator import generate_playwright_test, generate_playwright_python
 from app.services.variant_generator import VariantGenerator
 from app.security import get_current_user
 from app.utils.tenant import tenant_filter, set_tenant
+from app.utils.responses import struct_response
 
 router = APIRouter()
 
@@ -31,7 +33,7 @@ async def list_tests(
     query = (
         select(Test)
         .where(tenant_filter(Test, current_user))
-        .options(selectinload(Test.collection))
+        .options(selectinload(Test.collection), raiseload("*"))
         .order_by(Test.updated_at.desc())
     )
 
@@ -40,32 +42,33 @@ async def list_tests(
 
     result = await db.execute(query)
     tests = result.scalars().all()
+    test_ids = [test.id for test in tests]
+
+    # Version counts and latest run status for all listed tests, one query each
+    version_counts = dict((await db.execute(
+        select(TestVersion.test_id, func.count(TestVersion.id))
+        .where(TestVersion.test_id.in_(test_ids))
+        .group_by(TestVersion.test_id)
+    )).all())
+    last_run_statuses = dict((await db.execute(
+        select(TestVersion.test_id, Run.status)
+        .join(Run, Run.version_id == TestVersion.id)
+        .where(TestVersion.test_id.in_(test_ids))
+        .distinct(TestVersion.test_id)
+        .order_by(TestVersion.test_id, Run.started_at.desc())
+    )).all())
 
     response = []
     for test in tests:
-        version_count_result = await db.execute(
-            select(func.count(TestVersion.id)).where(TestVersion.test_id == test.id)
-        )
-        version_count = version_count_result.scalar() or 0
-
-        latest_run_result = await db.execute(
-            select(Run)
-            .join(TestVersion)
-            .where(TestVersion.test_id == test.id)
-            .order_by(Run.started_at.desc())
-            .limit(1)
-        )
-        latest_run = latest_run_result.scalar_one_or_none()
-
         collection_info = None
         if test.collection:
-            collection_info = {
-                "id": test.collection.id,
-                "name": test.collection.name,
-                "color": test.collection.color
-            }
+            collection_info = CollectionBasicRow(
+                id=test.collection.id,
+                name=test.collection.name,
+                color=test.collection.color
+            )
 
-        response.append(TestListResponse(
+        response.append(TestListRow(
             id=test.id,
             name=test.name,
             description=test.description,
@@ -73,11 +76,11 @@ async def list_tests(
             collection_id=test.collection_id,
             collection=collection_info,
             created_at=test.created_at,
-            version_count=version_count,
-            last_run_status=latest_run.status if latest_run else None
+            version_count=version_counts.get(test.id, 0),
+            last_run_status=last_run_statuses.get(test.id)
         ))
 
-    return response
+    return struct_response(response)
 
 
 @router.post("", response_model=TestResponse)
@@ -100,9 +103,8 @@ async def create_test(
     db.add(version)
     await db.flush()
 
-    for step_data in test_data.steps:
-        step = Step(
-            version_id=version.id,
+    await Step.insert_many(db, version.id, (
+        dict(
             order_index=step_data.order_index,
             type=step_data.type,
             selector=step_data.selector,
@@ -110,7 +112,8 @@ async def create_test(
             screenshot_url=step_data.screenshot_url,
             assertion_config=step_data.assertion_config.model_dump() if step_data.assertion_config else None
         )
-        db.add(step)
+        for step_data in test_data.steps
+    ))
 
     await db.commit()
     await db.refresh(test)
@@ -239,9 +242,8 @@ async def create_version(
     db.add(version)
     await db.flush()
 
-    for idx, step_data in enumerate(steps):
-        step = Step(
-            version_id=version.id,
+    await Step.insert_many(db, version.id, (
+        dict(
             order_index=idx,
             type=step_data["type"],
             selector=step_data.get("selector"),
@@ -249,7 +251,8 @@ async def create_version(
             screenshot_url=step_data.get("screenshot_url"),
             assertion_config=step_data.get("assertion_config")
         )
-        db.add(step)
+        for idx, step_data in enumerate(steps)
+    ))
 
     await db.commit()
     await db.refresh(version)
@@ -449,16 +452,17 @@ async def save_variants(
         await db.flush()
 
         steps = variant.get('steps', [])
-        for i, step_data in enumerate(steps):
-            step = Step(
-                version_id=version.id,
+        await Step.insert_many(db, version.id, (
+            dict(
                 order_index=i,
                 type=step_data.get('type', ''),
                 selector=step_data.get('selector'),
                 value=step_data.get('value'),
+                screenshot_url=None,
                 assertion_config=step_data.get('assertion_config'),
             )
-            db.add(step)
+            for i, step_data in enumerate(steps)
+        ))
 
         saved_variants.append({
             "id": str(variant_test.id),
@@ -0,0 +1,52 @@
+"""Postgres LISTEN subscriptions that keep in-process caches coherent."""
+
+from uuid import UUID
+
+import asyncpg
+
+from app.config import get_settings
+from app.models.role import Role
+
+settings = get_settings()
+
+ROLE_CHANNEL = "role_changed"
+
+
+def _on_role_changed(connection, pid, channel, payload: str) -> None:
+    Role.invalidate_cached(UUID(payload))
+
+
+def _on_connection_lost(connection) -> None:
+    # Notifications may have been missed; start cold (the TTL also bounds staleness)
+    Role.invalidate_cached()
+    print("[Listeners] LISTEN connection lost; role cache cleared")
+
+
+class CacheInvalidationListener:
+    """Holds a dedicated asyncpg connection subscribed to cache invalidation channels."""
+
+    def __init__(self):
+        self.connection: asyncpg.Connection | None = None
+
+    async def start(self):
+        """Open the LISTEN connection."""
+        if self.connection:
+            return
+
+        self.connection = await asyncpg.connect(settings.database_url)
+        await self.connection.add_listener(ROLE_CHANNEL, _on_role_changed)
+        self.connection.add_termination_listener(_on_connection_lost)
+        print(f"[Listeners] Listening on {ROLE_CHANNEL}")
+
+    async def stop(self):
+        """Close the LISTEN connection."""
+        if not self.connection:
+            return
+
+        self.connection.remove_termination_listener(_on_connection_lost)
+        await self.connection.close()
+        self.connection = None
+
+
+# Global instance
+cache_listener = CacheInvalidationListener()
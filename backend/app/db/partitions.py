@@ -0,0 +1,48 @@
+"""Monthly range partitions for ``api_request_results``.
+
+Partitions are created ahead of time by ``ensure_request_result_partitions``
+(called on startup and daily by the scheduler); rows that fall outside any
+monthly partition land in the DEFAULT partition.
+"""
+
+from sqlalchemy import DDL, text
+
+from app.db.postgres import engine
+
+ENSURE_ARR_PARTITION_FUNCTION = """
+CREATE OR REPLACE FUNCTION ensure_api_request_results_partition(month_start date) RETURNS void AS $$
+DECLARE
+    range_start date := date_trunc('month', month_start)::date;
+    range_end date := (date_trunc('month', month_start) + interval '1 month')::date;
+BEGIN
+    EXECUTE format(
+        'CREATE TABLE IF NOT EXISTS %I PARTITION OF api_request_results FOR VALUES FROM (%L) TO (%L)',
+        'api_request_results_p' || to_char(range_start, 'YYYYMM'), range_start, range_end
+    );
+END;
+$$ LANGUAGE plpgsql
+"""
+
+ARR_DEFAULT_PARTITION = """
+CREATE TABLE IF NOT EXISTS api_request_results_default PARTITION OF api_request_results DEFAULT
+"""
+
+ENSURE_UPCOMING_PARTITIONS = """
+SELECT ensure_api_request_results_partition(
+    (date_trunc('month', now()) + make_interval(months => g))::date
+)
+FROM generate_series(0, :months_ahead) AS g
+"""
+
+# DDL() applies %-formatting, so format() placeholders must be escaped
+PARTITION_DDL = [
+    DDL(ENSURE_ARR_PARTITION_FUNCTION.replace("%", "%%")),
+    DDL(ARR_DEFAULT_PARTITION),
+    DDL(ENSURE_UPCOMING_PARTITIONS.replace(":months_ahead", "2")),
+]
+
+
+async def ensure_request_result_partitions(months_ahead: int = 2) -> None:
+    """Create this month's and the next ``months_ahead`` monthly partitions if missing."""
+    async with engine.begin() as conn:
+        await conn.execute(text(ENSURE_UPCOMING_PARTITIONS), {"months_ahead": months_ahead})
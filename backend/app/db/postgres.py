@@ -1,12 +1,33 @@
+import orjson
+from sqlalchemy import event, text
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
 from app.config import get_settings
+from app.db.triggers import SET_UPDATED_AT_FUNCTION, updated_at_trigger
 
 settings = get_settings()
 
 database_url = settings.database_url.replace("postgresql://", "postgresql+asyncpg://")
 
-engine = create_async_engine(database_url, echo=True)
+
+
+def _json_dumps(value) -> str:
+    """JSON/JSONB bind serializer; asyncpg's text codec expects str, orjson returns bytes."""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+# Larger compiled-statement cache: the API issues a few hundred distinct statement shapes
+engine = create_async_engine(
+    database_url,
+    echo=True,
+    query_cache_size=1200,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_pre_ping=True,
+    pool_recycle=settings.db_pool_recycle,
+    json_serializer=_json_dumps,
+    json_deserializer=orjson.loads,
+)
 
 AsyncSessionLocal = async_sessionmaker(
     engine,
@@ -15,8 +36,29 @@ AsyncSessionLocal = async_sessionmaker(
 )
 
 
+# Server-side default for the naive-UTC DateTime columns; updated_at columns
+# are maintained by the set_updated_at() trigger
+UTC_NOW = text("timezone('utc', now())")
+
+
 class Base(DeclarativeBase):
-    pass
+    # Read server-generated timestamps back via RETURNING on INSERT and UPDATE,
+    # so they never lazy-load after a flush
+    __mapper_args__ = {"eager_defaults": True}
+
+
+@event.listens_for(Base.metadata, "after_create")
+def _install_updated_at_triggers(target, connection, tables=(), **kw):
+    # ``tables`` holds only the tables this create_all created; existing ones
+    # (including every table on a migrated database) already have the trigger
+    if connection.dialect.name != "postgresql":
+        return
+    created = [table for table in tables if "updated_at" in table.c]
+    if not created:
+        return
+    connection.exec_driver_sql(SET_UPDATED_AT_FUNCTION)
+    for table in created:
+        connection.exec_driver_sql(updated_at_trigger(table.name))
 
 
 async def get_db():
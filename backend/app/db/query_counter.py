@@ -0,0 +1,34 @@
+"""Statement counting for N+1 regression checks.
+
+Usage (tests, scripts, a REPL against a dev database)::
+
+    with count_queries() as statements:
+        await client.get("/api/tests")
+    assert len(statements) <= 3, statements
+
+Counts every statement the engine sends while the block is active, from any
+session, so use it where nothing else is talking to the database.
+"""
+
+from contextlib import contextmanager
+from typing import Iterator
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.db.postgres import engine as default_engine
+
+
+@contextmanager
+def count_queries(engine: AsyncEngine = default_engine) -> Iterator[list[str]]:
+    """Collect the SQL of every statement executed on ``engine`` inside the block."""
+    statements: list[str] = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", before_cursor_execute)
@@ -0,0 +1,127 @@
+"""Postgres trigger DDL for counters and change notifications maintained by the database.
+
+Shared by the model ``after_create`` hooks (fresh ``create_all`` databases)
+and the Alembic migrations, so both paths install identical triggers.
+"""
+
+from sqlalchemy import DDL
+
+# api_request_results -> api_test_runs summary counters
+ARR_BUMP_COUNTERS_FUNCTION = """
+CREATE OR REPLACE FUNCTION arr_bump_counters() RETURNS trigger AS $$
+DECLARE
+    n_assertions integer := 0;
+    n_passed integer := 0;
+BEGIN
+    IF jsonb_typeof(NEW.assertion_results) = 'array' THEN
+        SELECT count(*), count(*) FILTER (WHERE a -> 'passed' = 'true'::jsonb)
+        INTO n_assertions, n_passed
+        FROM jsonb_array_elements(NEW.assertion_results) AS a;
+    END IF;
+
+    UPDATE api_test_runs SET
+        total_requests = total_requests + 1,
+        passed_requests = passed_requests + (NEW.status = 'passed')::int,
+        failed_requests = failed_requests + (NEW.status = 'failed')::int,
+        skipped_requests = skipped_requests + (NEW.status = 'skipped')::int,
+        total_assertions = total_assertions + n_assertions,
+        passed_assertions = passed_assertions + n_passed,
+        failed_assertions = failed_assertions + (n_assertions - n_passed)
+    WHERE id = NEW.test_run_id;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+ARR_BUMP_COUNTERS_TRIGGER = """
+CREATE TRIGGER trg_arr_bump_counters
+AFTER INSERT ON api_request_results
+FOR EACH ROW EXECUTE FUNCTION arr_bump_counters()
+"""
+
+# discovered_pages -> projects discovery counters
+PAGE_BUMP_COUNTERS_FUNCTION = """
+CREATE OR REPLACE FUNCTION page_bump_counters() RETURNS trigger AS $$
+BEGIN
+    UPDATE projects SET
+        pages_discovered = pages_discovered + 1,
+        patterns_detected = patterns_detected
+            + (NEW.pattern_id IS NOT NULL AND NOT NEW.is_pattern_instance)::int
+    WHERE id = NEW.project_id;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+PAGE_BUMP_COUNTERS_TRIGGER = """
+CREATE TRIGGER trg_page_bump_counters
+AFTER INSERT ON discovered_pages
+FOR EACH ROW EXECUTE FUNCTION page_bump_counters()
+"""
+
+# schedule_runs -> schedules run counters
+SCHEDULE_RUN_BUMP_COUNTERS_FUNCTION = """
+CREATE OR REPLACE FUNCTION schedule_run_bump_counters() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        UPDATE schedules SET
+            total_runs = total_runs + 1,
+            total_passed = total_passed + (NEW.status = 'passed')::int,
+            total_failed = total_failed + (NEW.status = 'failed')::int
+        WHERE id = NEW.schedule_id;
+    ELSIF NEW.status IS DISTINCT FROM OLD.status THEN
+        UPDATE schedules SET
+            total_passed = total_passed + (NEW.status = 'passed')::int - (OLD.status = 'passed')::int,
+            total_failed = total_failed + (NEW.status = 'failed')::int - (OLD.status = 'failed')::int
+        WHERE id = NEW.schedule_id;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+SCHEDULE_RUN_BUMP_COUNTERS_TRIGGER = """
+CREATE TRIGGER trg_schedule_run_bump_counters
+AFTER INSERT OR UPDATE OF status ON schedule_runs
+FOR EACH ROW EXECUTE FUNCTION schedule_run_bump_counters()
+"""
+
+# roles -> NOTIFY role_changed with the role id, for in-process cache invalidation
+ROLE_NOTIFY_FUNCTION = """
+CREATE OR REPLACE FUNCTION notify_role_changed() RETURNS trigger AS $$
+BEGIN
+    PERFORM pg_notify('role_changed', OLD.id::text);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+ROLE_NOTIFY_TRIGGER = """
+CREATE TRIGGER trg_notify_role_changed
+AFTER UPDATE OR DELETE ON roles
+FOR EACH ROW EXECUTE FUNCTION notify_role_changed()
+"""
+
+
+# updated_at maintenance for every table that has the column
+SET_UPDATED_AT_FUNCTION = """
+CREATE OR REPLACE FUNCTION set_updated_at() RETURNS trigger AS $$
+BEGIN
+    NEW.updated_at := timezone('utc', now());
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+
+def updated_at_trigger(table: str) -> str:
+    return f"""
+CREATE TRIGGER trg_{table}_set_updated_at
+BEFORE UPDATE ON {table}
+FOR EACH ROW EXECUTE FUNCTION set_updated_at()
+"""
+
+
+def install_ddl(*statements: str) -> list[DDL]:
+    """Wrap raw SQL statements as DDL elements for ``after_create`` listeners."""
+    return [DDL(statement) for statement in statements]
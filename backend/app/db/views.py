@@ -0,0 +1,52 @@
+"""Materialized views backing dashboard aggregates.
+
+Created by the model ``after_create`` hooks (fresh ``create_all`` databases)
+and the Alembic migrations; refreshed periodically by the scheduler via
+``refresh_collection_daily_stats``.
+"""
+
+from sqlalchemy import DDL, text
+
+from app.db.postgres import engine
+
+# Per-collection, per-day run rollup. Tenant columns come from the collection
+# so the view can be filtered with tenant_filter like any other model.
+COLLECTION_DAILY_STATS_VIEW = """
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_collection_daily_stats AS
+SELECT
+    r.collection_id,
+    date_trunc('day', r.started_at) AS day,
+    c.user_id,
+    c.org_id,
+    count(*) AS runs,
+    count(*) FILTER (WHERE r.status = 'passed') AS passed_runs,
+    count(*) FILTER (WHERE r.status IN ('failed', 'error')) AS failed_runs,
+    sum(r.total_requests) AS total_requests,
+    sum(r.passed_requests) AS passed_requests,
+    sum(r.failed_requests) AS failed_requests,
+    avg(r.total_duration_ms)::integer AS avg_duration_ms
+FROM api_test_runs r
+JOIN api_collections c ON c.id = r.collection_id
+WHERE r.started_at IS NOT NULL
+GROUP BY r.collection_id, date_trunc('day', r.started_at), c.id
+WITH DATA
+"""
+
+# Required by REFRESH ... CONCURRENTLY
+COLLECTION_DAILY_STATS_INDEX = """
+CREATE UNIQUE INDEX IF NOT EXISTS uq_mv_collection_daily_stats
+ON mv_collection_daily_stats (collection_id, day)
+"""
+
+REFRESH_COLLECTION_DAILY_STATS = "REFRESH MATERIALIZED VIEW CONCURRENTLY mv_collection_daily_stats"
+
+VIEW_DDL = [
+    DDL(COLLECTION_DAILY_STATS_VIEW),
+    DDL(COLLECTION_DAILY_STATS_INDEX),
+]
+
+
+async def refresh_collection_daily_stats() -> None:
+    """Recompute ``mv_collection_daily_stats`` without blocking readers."""
+    async with engine.begin() as conn:
+        await conn.execute(text(REFRESH_COLLECTION_DAILY_STATS))
@@ -5,6 +5,8 @@ from contextlib import asynccontextmanager
 from app.api import auth, chat, tests, runs, collections, dashboard, schedules, healing, settings, admin, projects, test_execution
 from app.api import api_collections, api_requests, api_environments, api_runs, api_generation
 from app.db.postgres import engine, Base
+from app.db.partitions import ensure_request_result_partitions
+from app.db.listeners import cache_listener
 from app.services.scheduler import scheduler
 
 
@@ -13,13 +15,16 @@ async def lifespan(app: FastAPI):
     # Startup: create tables
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+    await ensure_request_result_partitions()
 
+    await cache_listener.start()
     await scheduler.start()
 
     yield
 
-    # Shutdown: stop scheduler
+    # Shutdown: stop scheduler and cache listener
     await scheduler.stop()
+    await cache_listener.stop()
     await engine.dispose()
 
 
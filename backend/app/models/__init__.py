@@ -1,4 +1,5 @@
 from app.models.organization import Organization
+from app.models.permission_set import PermissionSet
 from app.models.role import Role
 from app.models.test import Test, TestVersion, Step, Collection
 from app.models.run import Run
@@ -17,10 +18,13 @@ from app.models.api_request import APIRequest
 from app.models.api_environment import APIEnvironment
 from app.models.api_test_run import APITestRun
 from app.models.api_request_result import APIRequestResult
-from app.models.karate_feature import KarateFeatureFile
+from app.models.response_body import ResponseBody
+from app.models.karate_feature import KarateFeatureFile, KarateScenario
+from app.models.collection_daily_stats import CollectionDailyStats
 
 __all__ = [
     "Organization",
+    "PermissionSet",
     "Role",
     "Test",
     "TestVersion",
@@ -44,5 +48,8 @@ __all__ = [
     "APIEnvironment",
     "APITestRun",
     "APIRequestResult",
+    "ResponseBody",
     "KarateFeatureFile",
+    "KarateScenario",
+    "CollectionDailyStats",
 ]
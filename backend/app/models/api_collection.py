@@ -2,17 +2,19 @@
 
 import uuid
 from datetime import datetime
-from sqlalchemy import String, Text, ForeignKey, DateTime
+from sqlalchemy import String, Text, ForeignKey, DateTime, FetchedValue
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from app.db.postgres import Base
+from app.db.postgres import Base, UTC_NOW
+from app.utils.ids import uuid7
+from app.models.enums import ExecutionEngine
 
 
 class APICollection(Base):
     """Collection of API requests with shared configuration."""
     __tablename__ = "api_collections"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     name: Mapped[str] = mapped_column(String(255))
     description: Mapped[str | None] = mapped_column(Text, nullable=True)
 
@@ -31,7 +33,7 @@ class APICollection(Base):
     default_headers: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
 
     # Default execution engine: "python" or "karate"
-    default_engine: Mapped[str] = mapped_column(String(20), default="python")
+    default_engine: Mapped[str] = mapped_column(ExecutionEngine, default="python")
 
     # Import source tracking
     import_source: Mapped[str | None] = mapped_column(String(50), nullable=True)  # postman, openapi, karate, manual
@@ -45,19 +47,19 @@ class APICollection(Base):
         UUID(as_uuid=True), ForeignKey("organizations.id"), nullable=True, index=True
     )
 
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
-    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=UTC_NOW)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, server_default=UTC_NOW, server_onupdate=FetchedValue())
 
     # Relationships
     requests: Mapped[list["APIRequest"]] = relationship(
-        "APIRequest", back_populates="collection", cascade="all, delete-orphan"
+        "APIRequest", back_populates="collection", cascade="all, delete-orphan", passive_deletes=True, lazy="raise_on_sql"
     )
     environments: Mapped[list["APIEnvironment"]] = relationship(
-        "APIEnvironment", back_populates="collection", cascade="all, delete-orphan"
+        "APIEnvironment", back_populates="collection", cascade="all, delete-orphan", passive_deletes=True, lazy="raise_on_sql"
     )
     test_runs: Mapped[list["APITestRun"]] = relationship(
-        "APITestRun", back_populates="collection", cascade="all, delete-orphan"
+        "APITestRun", back_populates="collection", cascade="all, delete-orphan", passive_deletes=True, lazy="raise_on_sql"
     )
     karate_features: Mapped[list["KarateFeatureFile"]] = relationship(
-        "KarateFeatureFile", back_populates="collection", cascade="all, delete-orphan"
+        "KarateFeatureFile", back_populates="collection", cascade="all, delete-orphan", passive_deletes=True, lazy="raise_on_sql"
     )
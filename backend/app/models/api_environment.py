@@ -2,19 +2,20 @@
 
 import uuid
 from datetime import datetime
-from sqlalchemy import String, Text, Boolean, ForeignKey, DateTime
+from sqlalchemy import String, Text, Boolean, ForeignKey, DateTime, FetchedValue
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from app.db.postgres import Base
+from app.db.postgres import Base, UTC_NOW
+from app.utils.ids import uuid7
 
 
 class APIEnvironment(Base):
     """Environment-specific variable sets for API testing."""
     __tablename__ = "api_environments"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     collection_id: Mapped[uuid.UUID | None] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("api_collections.id"), nullable=True, index=True
+        UUID(as_uuid=True), ForeignKey("api_collections.id", ondelete="CASCADE"), nullable=True, index=True
     )
 
     name: Mapped[str] = mapped_column(String(255))  # e.g., "Development", "Staging", "Production"
@@ -44,9 +45,9 @@ class APIEnvironment(Base):
         UUID(as_uuid=True), ForeignKey("organizations.id"), nullable=True, index=True
     )
 
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
-    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=UTC_NOW)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, server_default=UTC_NOW, server_onupdate=FetchedValue())
 
     # Relationships
-    collection: Mapped["APICollection | None"] = relationship("APICollection", back_populates="environments")
-    test_runs: Mapped[list["APITestRun"]] = relationship("APITestRun", back_populates="environment")
+    collection: Mapped["APICollection | None"] = relationship("APICollection", back_populates="environments", lazy="raise_on_sql")
+    test_runs: Mapped[list["APITestRun"]] = relationship("APITestRun", back_populates="environment", lazy="raise_on_sql")
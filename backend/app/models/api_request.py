@@ -2,19 +2,21 @@
 
 import uuid
 from datetime import datetime
-from sqlalchemy import String, Text, Integer, ForeignKey, DateTime
+from sqlalchemy import String, Text, Integer, ForeignKey, DateTime, FetchedValue
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from app.db.postgres import Base
+from app.db.postgres import Base, UTC_NOW
+from app.utils.ids import uuid7
+from app.models.enums import ExecutionEngine
 
 
 class APIRequest(Base):
     """Individual API request definition within a collection."""
     __tablename__ = "api_requests"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     collection_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("api_collections.id"), index=True
+        UUID(as_uuid=True), ForeignKey("api_collections.id", ondelete="CASCADE"), index=True
     )
 
     # Request metadata
@@ -44,14 +46,14 @@ class APIRequest(Base):
 
     # Pre-request scripts (Python code or Karate expressions)
     pre_request_script: Mapped[str | None] = mapped_column(Text, nullable=True)
-    pre_request_script_type: Mapped[str | None] = mapped_column(String(20), nullable=True)  # python, karate
+    pre_request_script_type: Mapped[str | None] = mapped_column(ExecutionEngine, nullable=True)  # python, karate
 
     # Post-response scripts
     post_response_script: Mapped[str | None] = mapped_column(Text, nullable=True)
-    post_response_script_type: Mapped[str | None] = mapped_column(String(20), nullable=True)
+    post_response_script_type: Mapped[str | None] = mapped_column(ExecutionEngine, nullable=True)
 
     # Execution engine preference: "python", "karate", or null (use collection default)
-    engine: Mapped[str | None] = mapped_column(String(20), nullable=True)
+    engine: Mapped[str | None] = mapped_column(ExecutionEngine, nullable=True)
 
     # Folder/grouping within collection (for organization)
     folder_path: Mapped[str | None] = mapped_column(String(500), nullable=True)
@@ -59,11 +61,11 @@ class APIRequest(Base):
     # Timeout in milliseconds (per-request override)
     timeout_ms: Mapped[int | None] = mapped_column(Integer, nullable=True)
 
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
-    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=UTC_NOW)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, server_default=UTC_NOW, server_onupdate=FetchedValue())
 
     # Relationships
-    collection: Mapped["APICollection"] = relationship("APICollection", back_populates="requests")
+    collection: Mapped["APICollection"] = relationship("APICollection", back_populates="requests", lazy="raise_on_sql")
     results: Mapped[list["APIRequestResult"]] = relationship(
-        "APIRequestResult", back_populates="request", cascade="all, delete-orphan"
+        "APIRequestResult", back_populates="request", cascade="all, delete-orphan", passive_deletes=True, lazy="raise_on_sql"
     )
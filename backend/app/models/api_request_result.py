@@ -2,29 +2,42 @@
 
 import uuid
 from datetime import datetime
-from sqlalchemy import String, Text, Integer, ForeignKey, DateTime
-from sqlalchemy.dialects.postgresql import UUID, JSONB
+from sqlalchemy import String, Text, Integer, ForeignKey, DateTime, Index, event, text
+from sqlalchemy.dialects.postgresql import UUID, JSONB, BYTEA
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.db.postgres import Base
+from app.utils.ids import uuid7
+from app.models.enums import APIErrorType, ResultStatus
+from app.db.triggers import ARR_BUMP_COUNTERS_FUNCTION, ARR_BUMP_COUNTERS_TRIGGER, install_ddl
+from app.db.partitions import PARTITION_DDL
 
 
 class APIRequestResult(Base):
     """Detailed result for each request in a test run."""
     __tablename__ = "api_request_results"
+    # Monthly range partitions; the partition key must be part of the primary key
+    __table_args__ = (
+        Index(
+            "ix_arr_response_body_sha",
+            "response_body_sha",
+            postgresql_where=text("response_body_sha IS NOT NULL"),
+        ),
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     test_run_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("api_test_runs.id"), index=True
+        UUID(as_uuid=True), ForeignKey("api_test_runs.id", ondelete="CASCADE"), index=True
     )
     request_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("api_requests.id"), index=True
+        UUID(as_uuid=True), ForeignKey("api_requests.id", ondelete="CASCADE"), index=True
     )
 
     # Execution order in the run
     execution_order: Mapped[int] = mapped_column(Integer)
 
     # Status
-    status: Mapped[str] = mapped_column(String(50))  # passed, failed, skipped, error
+    status: Mapped[str] = mapped_column(ResultStatus)  # passed, failed, skipped, error
 
     # Request details (captured at execution time with resolved variables)
     resolved_url: Mapped[str | None] = mapped_column(String(2000), nullable=True)
@@ -35,7 +48,10 @@ class APIRequestResult(Base):
     # Response details
     response_status: Mapped[int | None] = mapped_column(Integer, nullable=True)
     response_headers: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
-    response_body: Mapped[str | None] = mapped_column(Text, nullable=True)  # Truncated if too large
+    # Body (truncated if too large) lives in response_bodies, deduplicated by SHA-256
+    response_body_sha: Mapped[bytes | None] = mapped_column(
+        BYTEA(32), ForeignKey("response_bodies.sha"), nullable=True
+    )
     response_size_bytes: Mapped[int | None] = mapped_column(Integer, nullable=True)
 
     # Timing
@@ -57,7 +73,7 @@ class APIRequestResult(Base):
 
     # Error details
     error_message: Mapped[str | None] = mapped_column(Text, nullable=True)
-    error_type: Mapped[str | None] = mapped_column(String(100), nullable=True)  # timeout, connection, assertion, script
+    error_type: Mapped[str | None] = mapped_column(APIErrorType, nullable=True)  # execution, timeout, connection, assertion, script
 
     # Pre/post script execution info
     pre_script_executed: Mapped[bool | None] = mapped_column(nullable=True)
@@ -65,8 +81,19 @@ class APIRequestResult(Base):
     post_script_executed: Mapped[bool | None] = mapped_column(nullable=True)
     post_script_error: Mapped[str | None] = mapped_column(Text, nullable=True)
 
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, primary_key=True, default=datetime.utcnow)
 
     # Relationships
-    test_run: Mapped["APITestRun"] = relationship("APITestRun", back_populates="results")
-    request: Mapped["APIRequest"] = relationship("APIRequest", back_populates="results")
+    test_run: Mapped["APITestRun"] = relationship("APITestRun", back_populates="results", lazy="raise_on_sql")
+    request: Mapped["APIRequest"] = relationship("APIRequest", back_populates="results", lazy="raise_on_sql")
+    response_body_blob: Mapped["ResponseBody | None"] = relationship("ResponseBody", lazy="raise_on_sql")
+
+    @property
+    def response_body(self) -> str | None:
+        """Response body text; requires ``response_body_blob`` to be loaded."""
+        return self.response_body_blob.body if self.response_body_blob else None
+
+
+# Partitions, then the trigger maintaining run summary counters on api_test_runs
+for _ddl in PARTITION_DDL + install_ddl(ARR_BUMP_COUNTERS_FUNCTION, ARR_BUMP_COUNTERS_TRIGGER):
+    event.listen(APIRequestResult.__table__, "after_create", _ddl.execute_if(dialect="postgresql"))
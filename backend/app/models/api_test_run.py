@@ -5,42 +5,44 @@ from datetime import datetime
 from sqlalchemy import String, Text, Integer, ForeignKey, DateTime
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from app.db.postgres import Base
+from app.db.postgres import Base, UTC_NOW
+from app.utils.ids import uuid7
+from app.models.enums import APIErrorType, ExecutionEngine, RunStatus, TriggerType
 
 
 class APITestRun(Base):
     """Execution record for API test runs."""
     __tablename__ = "api_test_runs"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     collection_id: Mapped[uuid.UUID | None] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("api_collections.id"), nullable=True, index=True
+        UUID(as_uuid=True), ForeignKey("api_collections.id", ondelete="CASCADE"), nullable=True, index=True
     )
 
     # Run metadata
     name: Mapped[str | None] = mapped_column(String(255), nullable=True)
 
     # Trigger source
-    trigger_type: Mapped[str] = mapped_column(String(50))  # manual, scheduled, ci, webhook
+    trigger_type: Mapped[str] = mapped_column(TriggerType)  # manual, scheduled, ci, webhook
     trigger_source: Mapped[str | None] = mapped_column(String(255), nullable=True)  # CI job ID, schedule ID, etc.
 
     # Environment used
     environment_id: Mapped[uuid.UUID | None] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("api_environments.id"), nullable=True
+        UUID(as_uuid=True), ForeignKey("api_environments.id", ondelete="SET NULL"), nullable=True, index=True
     )
 
     # Execution engine used
-    engine: Mapped[str] = mapped_column(String(20), default="python")  # python, karate
+    engine: Mapped[str] = mapped_column(ExecutionEngine, default="python")  # python, karate
 
     # Status
-    status: Mapped[str] = mapped_column(String(50), default="pending")  # pending, running, passed, failed, error, cancelled
+    status: Mapped[str] = mapped_column(RunStatus, default="pending")  # pending, running, passed, failed, error, cancelled
 
     # Timing
     started_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
     finished_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
     total_duration_ms: Mapped[int | None] = mapped_column(Integer, nullable=True)
 
-    # Summary stats
+    # Summary stats (maintained by the api_request_results insert trigger)
     total_requests: Mapped[int] = mapped_column(Integer, default=0)
     passed_requests: Mapped[int] = mapped_column(Integer, default=0)
     failed_requests: Mapped[int] = mapped_column(Integer, default=0)
@@ -53,13 +55,13 @@ class APITestRun(Base):
 
     # Error details (for run-level errors)
     error_message: Mapped[str | None] = mapped_column(Text, nullable=True)
-    error_type: Mapped[str | None] = mapped_column(String(100), nullable=True)
+    error_type: Mapped[str | None] = mapped_column(APIErrorType, nullable=True)
 
     # Runtime context (JSONB for variable snapshots, execution options, etc.)
     run_context: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
 
     # Karate-specific: job ID for tracking in Redis queue
-    karate_job_id: Mapped[str | None] = mapped_column(String(100), nullable=True)
+    karate_job_id: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True), nullable=True)
 
     # Multi-tenancy
     user_id: Mapped[uuid.UUID | None] = mapped_column(
@@ -69,11 +71,11 @@ class APITestRun(Base):
         UUID(as_uuid=True), ForeignKey("organizations.id"), nullable=True, index=True
     )
 
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=UTC_NOW)
 
     # Relationships
-    collection: Mapped["APICollection | None"] = relationship("APICollection", back_populates="test_runs")
-    environment: Mapped["APIEnvironment | None"] = relationship("APIEnvironment", back_populates="test_runs")
+    collection: Mapped["APICollection | None"] = relationship("APICollection", back_populates="test_runs", lazy="raise_on_sql")
+    environment: Mapped["APIEnvironment | None"] = relationship("APIEnvironment", back_populates="test_runs", lazy="raise_on_sql")
     results: Mapped[list["APIRequestResult"]] = relationship(
-        "APIRequestResult", back_populates="test_run", cascade="all, delete-orphan"
+        "APIRequestResult", back_populates="test_run", cascade="all, delete-orphan", passive_deletes=True, lazy="raise_on_sql"
     )
@@ -0,0 +1,34 @@
+"""Read-only model over the mv_collection_daily_stats materialized view."""
+
+from sqlalchemy import Column, DateTime, Integer, MetaData, Table, event
+from sqlalchemy.dialects.postgresql import UUID
+from app.db.postgres import Base
+from app.db.views import VIEW_DDL
+
+# Separate MetaData so create_all never tries to create the view as a table;
+# the view itself is installed by app.db.views.
+_view_metadata = MetaData()
+
+
+class CollectionDailyStats(Base):
+    """Daily API test run rollup per collection (refreshed by the scheduler)."""
+    __table__ = Table(
+        "mv_collection_daily_stats",
+        _view_metadata,
+        Column("collection_id", UUID(as_uuid=True), primary_key=True),
+        Column("day", DateTime, primary_key=True),
+        Column("user_id", UUID(as_uuid=True)),
+        Column("org_id", UUID(as_uuid=True)),
+        Column("runs", Integer),
+        Column("passed_runs", Integer),
+        Column("failed_runs", Integer),
+        Column("total_requests", Integer),
+        Column("passed_requests", Integer),
+        Column("failed_requests", Integer),
+        Column("avg_duration_ms", Integer),
+    )
+
+
+# The view reads api_test_runs and api_collections, so install it once all tables exist
+for _ddl in VIEW_DDL:
+    event.listen(Base.metadata, "after_create", _ddl.execute_if(dialect="postgresql"))
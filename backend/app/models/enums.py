@@ -0,0 +1,30 @@
+"""Postgres ENUM types shared by model columns.
+
+Attributes stay plain ``str`` on the Python side; the database stores each
+value as a 4-byte enum label instead of varchar. Bound to ``Base.metadata`` so
+``create_all`` creates each type once, before the tables that use it.
+"""
+
+from sqlalchemy import Enum as SAEnum
+
+from app.db.postgres import Base
+
+RUN_STATUSES = ("pending", "running", "passed", "failed", "error", "cancelled")
+RESULT_STATUSES = ("passed", "failed", "skipped", "error")
+TRIGGER_TYPES = ("manual", "scheduled", "ci", "webhook")
+EXECUTION_ENGINES = ("python", "karate")
+API_ERROR_TYPES = ("execution", "connection", "timeout", "assertion", "script", "karate")
+TEST_CASE_STATUSES = ("pending", "recording", "ready", "passing", "failing")
+TEST_CASE_SOURCES = ("suggested", "custom", "recorded")
+TEST_RUN_STATUSES = ("queued", "running", "passed", "failed", "error")
+SCHEDULE_FREQUENCIES = ("hourly", "daily", "weekly", "custom")
+
+RunStatus = SAEnum(*RUN_STATUSES, name="run_status", metadata=Base.metadata)
+ResultStatus = SAEnum(*RESULT_STATUSES, name="result_status", metadata=Base.metadata)
+TriggerType = SAEnum(*TRIGGER_TYPES, name="trigger_type", metadata=Base.metadata)
+ExecutionEngine = SAEnum(*EXECUTION_ENGINES, name="execution_engine", metadata=Base.metadata)
+APIErrorType = SAEnum(*API_ERROR_TYPES, name="api_error_type", metadata=Base.metadata)
+TestCaseStatus = SAEnum(*TEST_CASE_STATUSES, name="test_case_status", metadata=Base.metadata)
+TestCaseSource = SAEnum(*TEST_CASE_SOURCES, name="test_case_source", metadata=Base.metadata)
+TestRunStatus = SAEnum(*TEST_RUN_STATUSES, name="test_run_status", metadata=Base.metadata)
+ScheduleFrequency = SAEnum(*SCHEDULE_FREQUENCIES, name="schedule_frequency", metadata=Base.metadata)
@@ -5,16 +5,17 @@ from datetime import datetime
 from sqlalchemy import String, Text, Float, Integer, ForeignKey, DateTime, Boolean
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from app.db.postgres import Base
+from app.db.postgres import Base, UTC_NOW
+from app.utils.ids import uuid7
 
 
 class HealingSuggestion(Base):
     """Stores healing suggestions for failed test steps."""
     __tablename__ = "healing_suggestions"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    run_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("runs.id"))
-    step_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("steps.id"))
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    run_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("runs.id", ondelete="CASCADE"), index=True)
+    step_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("steps.id", ondelete="CASCADE"), index=True)
     step_index: Mapped[int] = mapped_column(Integer)
 
     # Original vs suggested
@@ -36,7 +37,7 @@ class HealingSuggestion(Base):
     auto_approved: Mapped[bool] = mapped_column(Boolean, default=False)
 
     # Timestamps
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=UTC_NOW)
     applied_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
 
     # Result after applying (if retried)
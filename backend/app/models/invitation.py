@@ -1,47 +1,57 @@
 """Invitation model for magic link user invitations."""
 
 import uuid
+import warnings
 from datetime import datetime, timedelta
-from sqlalchemy import String, Boolean, DateTime, ForeignKey, Text
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import String, Boolean, DateTime, ForeignKey, Text, Index, func, text
+from sqlalchemy.dialects.postgresql import UUID, BYTEA
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.db.postgres import Base
+from app.db.postgres import Base, UTC_NOW
+from app.utils.ids import uuid7
 
 
 class Invitation(Base):
     """User invitation with magic link token."""
 
     __tablename__ = "invitations"
+    __table_args__ = (
+        # Partial index so pending-and-unexpired lookups never touch accepted/revoked rows
+        Index("ix_inv_pending_active", "expires_at", postgresql_where=text("status = 'pending'")),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+        UUID(as_uuid=True), primary_key=True, default=uuid7
     )
     email: Mapped[str] = mapped_column(String(255), index=True)
-    token: Mapped[str] = mapped_column(String(64), unique=True, index=True)
+    # HMAC-SHA256 of the magic link token; the plaintext is never stored
+    token_hash: Mapped[bytes] = mapped_column(BYTEA(32), unique=True, index=True)
 
     # Role to assign when invitation is accepted
     role_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("roles.id"),
-        nullable=False
+        nullable=False,
+        index=True
     )
-    role = relationship("Role")
+    role = relationship("Role", lazy="raise_on_sql")
 
     # Organization (optional for future multi-org support)
     org_id: Mapped[uuid.UUID | None] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("organizations.id"),
-        nullable=True
+        nullable=True,
+        index=True
     )
 
     # Who sent the invitation
     invited_by_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("users.id"),
-        nullable=False
+        nullable=False,
+        index=True
     )
-    invited_by = relationship("User", foreign_keys=[invited_by_id])
+    invited_by = relationship("User", foreign_keys=[invited_by_id], lazy="raise_on_sql")
 
     # Optional personal message
     message: Mapped[str | None] = mapped_column(Text, nullable=True)
@@ -56,11 +66,27 @@ class Invitation(Base):
         default=lambda: datetime.utcnow() + timedelta(days=7)
     )
     accepted_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=UTC_NOW)
+
+    @classmethod
+    def valid_clause(cls):
+        """SQL filter matching pending, unexpired invitations (served by ix_inv_pending_active)."""
+        return (
+            cls.status == "pending",
+            cls.expires_at > func.timezone("utc", func.now()),
+        )
 
     @property
     def is_valid(self) -> bool:
-        """Check if invitation is still valid."""
+        """Check if invitation is still valid.
+
+        Deprecated: filter in SQL with ``Invitation.valid_clause()`` instead.
+        """
+        warnings.warn(
+            "Invitation.is_valid is deprecated; use Invitation.valid_clause() in queries",
+            DeprecationWarning,
+            stacklevel=2,
+        )
         return (
             self.status == "pending" and
             datetime.utcnow() < self.expires_at
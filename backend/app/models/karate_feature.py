@@ -2,26 +2,28 @@
 
 import uuid
 from datetime import datetime
-from sqlalchemy import String, Text, ForeignKey, DateTime
-from sqlalchemy.dialects.postgresql import UUID, JSONB
+from sqlalchemy import String, Text, Integer, Boolean, ForeignKey, DateTime, DDL, Index, event, FetchedValue
+from sqlalchemy.dialects.postgresql import UUID, JSONB, ARRAY
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from app.db.postgres import Base
+from app.db.postgres import Base, UTC_NOW
+from app.utils.ids import uuid7
 
 
 class KarateFeatureFile(Base):
     """Stored Karate .feature files for advanced BDD-style API testing."""
     __tablename__ = "karate_feature_files"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     collection_id: Mapped[uuid.UUID | None] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("api_collections.id"), nullable=True, index=True
+        UUID(as_uuid=True), ForeignKey("api_collections.id", ondelete="CASCADE"), nullable=True, index=True
     )
 
     name: Mapped[str] = mapped_column(String(255))
     description: Mapped[str | None] = mapped_column(Text, nullable=True)
 
-    # The actual .feature file content (Gherkin syntax)
-    feature_content: Mapped[str] = mapped_column(Text)
+    # The actual .feature file content (Gherkin syntax).
+    # Deferred so listings skip it; TOAST-compressed with lz4 (see FEATURE_CONTENT_LZ4).
+    feature_content: Mapped[str] = mapped_column(Text, deferred=True, deferred_raiseload=True)
 
     # Parsed metadata (JSONB)
     # {
@@ -30,6 +32,8 @@ class KarateFeatureFile(Base):
     #   scenarios: [{name, tags, line_number}],
     #   background: {steps: [...]},
     # }
+    # Scenarios are also stored as KarateScenario rows; query those for
+    # scenario listings and tag filters.
     parsed_metadata: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
 
     # Associated karate-config.js content (optional)
@@ -50,8 +54,57 @@ class KarateFeatureFile(Base):
         UUID(as_uuid=True), ForeignKey("organizations.id"), nullable=True, index=True
     )
 
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
-    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=UTC_NOW)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, server_default=UTC_NOW, server_onupdate=FetchedValue())
 
     # Relationships
-    collection: Mapped["APICollection | None"] = relationship("APICollection", back_populates="karate_features")
+    collection: Mapped["APICollection | None"] = relationship("APICollection", back_populates="karate_features", lazy="raise_on_sql")
+    scenarios: Mapped[list["KarateScenario"]] = relationship(
+        back_populates="feature", cascade="all, delete-orphan", passive_deletes=True, lazy="raise_on_sql"
+    )
+
+    def set_parsed_metadata(self, metadata: dict) -> None:
+        """Store parser metadata and replace the normalized scenario rows to match."""
+        self.parsed_metadata = metadata
+        self.scenarios = [
+            KarateScenario(
+                name=s["name"],
+                tags=s.get("tags") or [],
+                line_number=s.get("line_number"),
+                step_count=s.get("step_count", 0),
+                is_outline=s.get("is_outline", False),
+            )
+            for s in metadata.get("scenarios", [])
+        ]
+
+
+class KarateScenario(Base):
+    """A scenario within a stored feature file, normalized for tag filtering."""
+    __tablename__ = "karate_scenarios"
+    __table_args__ = (
+        Index("ix_karate_scenarios_tags", "tags", postgresql_using="gin"),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    feature_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("karate_feature_files.id", ondelete="CASCADE"), index=True
+    )
+
+    name: Mapped[str] = mapped_column(String(500))
+    tags: Mapped[list[str]] = mapped_column(ARRAY(Text), default=list)  # ['@smoke', '@api']
+    line_number: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    step_count: Mapped[int] = mapped_column(Integer, default=0)
+    is_outline: Mapped[bool] = mapped_column(Boolean, default=False)
+
+    # Relationships
+    feature: Mapped["KarateFeatureFile"] = relationship(back_populates="scenarios", lazy="raise_on_sql")
+
+
+# Gherkin text compresses well; lz4 is cheaper than the default pglz (Postgres 14+)
+FEATURE_CONTENT_LZ4 = "ALTER TABLE karate_feature_files ALTER COLUMN feature_content SET COMPRESSION lz4"
+
+event.listen(
+    KarateFeatureFile.__table__,
+    "after_create",
+    DDL(FEATURE_CONTENT_LZ4).execute_if(dialect="postgresql"),
+)
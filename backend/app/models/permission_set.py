@@ -0,0 +1,57 @@
+"""Content-addressed permission sets shared between roles."""
+
+import hashlib
+import json
+import uuid
+from sqlalchemy import BigInteger
+from sqlalchemy.dialects.postgresql import UUID, JSONB, BYTEA
+from sqlalchemy.orm import Mapped, mapped_column
+from app.db.postgres import Base
+from app.utils.ids import uuid7
+
+# Bit for each well-known permission; append new names, never reorder
+PERMISSION_BITS: dict[str, int] = {
+    name: 1 << i
+    for i, name in enumerate((
+        "manage_users",
+        "manage_org",
+        "manage_roles",
+        "manage_tests",
+        "run_tests",
+        "view_tests",
+        "manage_schedules",
+        "view_schedules",
+        "manage_settings",
+        "view_dashboard",
+        "view_admin_dashboard",
+    ))
+}
+
+
+class PermissionSet(Base):
+    """A distinct permissions dict, stored once and referenced by every role using it.
+
+    Rows are immutable: changing a role's permissions points it at another set.
+    """
+    __tablename__ = "permission_sets"
+
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    sha: Mapped[bytes] = mapped_column(BYTEA(32), unique=True)
+    perms: Mapped[dict] = mapped_column(JSONB, default=dict)
+    # PERMISSION_BITS of the granted well-known permissions in perms
+    bits: Mapped[int] = mapped_column(BigInteger, default=0)
+
+    @staticmethod
+    def digest(perms: dict) -> bytes:
+        """SHA-256 of the canonical JSON encoding of a permissions dict."""
+        canonical = json.dumps(perms, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(canonical.encode()).digest()
+
+    @staticmethod
+    def encode_bits(perms: dict) -> int:
+        """Bitmap of the well-known permissions granted in a permissions dict."""
+        bits = 0
+        for name, granted in perms.items():
+            if granted and name in PERMISSION_BITS:
+                bits |= PERMISSION_BITS[name]
+        return bits
@@ -2,17 +2,20 @@
 
 import uuid
 from datetime import datetime
-from sqlalchemy import String, Text, Integer, Float, ForeignKey, DateTime, Boolean
-from sqlalchemy.dialects.postgresql import UUID, JSONB
+from sqlalchemy import String, Text, Integer, Float, ForeignKey, DateTime, Boolean, UniqueConstraint, event, func, FetchedValue
+from sqlalchemy.dialects.postgresql import UUID, JSONB, BYTEA, insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from app.db.postgres import Base
+from app.db.postgres import Base, UTC_NOW
+from app.utils.ids import uuid7
+from app.db.triggers import PAGE_BUMP_COUNTERS_FUNCTION, PAGE_BUMP_COUNTERS_TRIGGER, install_ddl
 
 
 class Project(Base):
     """A website project to be explored and tested."""
     __tablename__ = "projects"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     name: Mapped[str] = mapped_column(String(255))
     base_url: Mapped[str] = mapped_column(String(500))
     description: Mapped[str | None] = mapped_column(Text, nullable=True)
@@ -29,13 +32,13 @@ class Project(Base):
     max_depth: Mapped[int] = mapped_column(Integer, default=5)
     max_pages: Mapped[int] = mapped_column(Integer, default=100)
 
-    # Stats (updated during discovery)
+    # Stats (pages_discovered/patterns_detected are bumped by a discovered_pages trigger)
     pages_discovered: Mapped[int] = mapped_column(Integer, default=0)
     features_found: Mapped[int] = mapped_column(Integer, default=0)
     patterns_detected: Mapped[int] = mapped_column(Integer, default=0)
 
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
-    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=UTC_NOW)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, server_default=UTC_NOW, server_onupdate=FetchedValue())
 
     # Multi-tenancy
     user_id: Mapped[uuid.UUID | None] = mapped_column(
@@ -46,16 +49,19 @@ class Project(Base):
     )
 
     # Relationships
-    pages: Mapped[list["DiscoveredPage"]] = relationship(back_populates="project", cascade="all, delete-orphan")
-    connections: Mapped[list["PageConnection"]] = relationship(back_populates="project", cascade="all, delete-orphan")
+    pages: Mapped[list["DiscoveredPage"]] = relationship(back_populates="project", cascade="all, delete-orphan", passive_deletes=True, lazy="raise_on_sql")
+    connections: Mapped[list["PageConnection"]] = relationship(back_populates="project", cascade="all, delete-orphan", passive_deletes=True, lazy="raise_on_sql")
 
 
 class DiscoveredPage(Base):
     """A page/state discovered during exploration."""
     __tablename__ = "discovered_pages"
+    __table_args__ = (
+        UniqueConstraint("project_id", "state_hash", name="uq_page_project_hash"),
+    )
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    project_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("projects.id"))
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    project_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("projects.id", ondelete="CASCADE"))
 
     # Page identity
     url: Mapped[str] = mapped_column(String(1000))
@@ -67,26 +73,28 @@ class DiscoveredPage(Base):
     section: Mapped[str | None] = mapped_column(String(255), nullable=True)  # Main nav section it belongs to
 
     # State hash for deduplication
-    state_hash: Mapped[str | None] = mapped_column(String(64), nullable=True, index=True)
+    state_hash: Mapped[bytes | None] = mapped_column(BYTEA(32), nullable=True, index=True)  # raw SHA-256
 
     # Visual
+    # Wide columns below are deferred (raising if touched unloaded); undefer the
+    # "content", "analysis" or "graph" group where a query needs them.
     screenshot_url: Mapped[str | None] = mapped_column(String(500), nullable=True)
-    thumbnail_url: Mapped[str | None] = mapped_column(String(500), nullable=True)
+    thumbnail_url: Mapped[str | None] = mapped_column(String(500), nullable=True, deferred=True, deferred_raiseload=True)
 
     # Content analysis (basic extraction)
-    forms_found: Mapped[list | None] = mapped_column(JSONB, nullable=True)  # [{name, fields, action}]
-    actions_found: Mapped[list | None] = mapped_column(JSONB, nullable=True)  # [{text, selector, type}]
-    inputs_found: Mapped[list | None] = mapped_column(JSONB, nullable=True)  # [{name, type, placeholder}]
-    tables_found: Mapped[list | None] = mapped_column(JSONB, nullable=True)  # [{columns, row_actions, pagination}]
+    forms_found: Mapped[list | None] = mapped_column(JSONB, nullable=True, deferred=True, deferred_group="content", deferred_raiseload=True)  # [{name, fields, action}]
+    actions_found: Mapped[list | None] = mapped_column(JSONB, nullable=True, deferred=True, deferred_group="content", deferred_raiseload=True)  # [{text, selector, type}]
+    inputs_found: Mapped[list | None] = mapped_column(JSONB, nullable=True, deferred=True, deferred_group="content", deferred_raiseload=True)  # [{name, type, placeholder}]
+    tables_found: Mapped[list | None] = mapped_column(JSONB, nullable=True, deferred=True, deferred_group="content", deferred_raiseload=True)  # [{columns, row_actions, pagination}]
 
     # LLM-powered analysis (rich data for test generation)
-    llm_analysis: Mapped[dict | None] = mapped_column(JSONB, nullable=True)  # Full PageAnalysis from LLM
-    test_scenarios: Mapped[list | None] = mapped_column(JSONB, nullable=True)  # Suggested test scenarios
+    llm_analysis: Mapped[dict | None] = mapped_column(JSONB, nullable=True, deferred=True, deferred_group="analysis", deferred_raiseload=True)  # Full PageAnalysis from LLM
+    test_scenarios: Mapped[list | None] = mapped_column(JSONB, nullable=True, deferred=True, deferred_group="analysis", deferred_raiseload=True)  # Suggested test scenarios
     requires_auth: Mapped[bool] = mapped_column(Boolean, default=False)
-    required_permissions: Mapped[list | None] = mapped_column(JSONB, nullable=True)  # ['admin', 'editor', etc.]
+    required_permissions: Mapped[list | None] = mapped_column(JSONB, nullable=True, deferred=True, deferred_group="analysis", deferred_raiseload=True)  # ['admin', 'editor', etc.]
 
     # Navigation to reach this page (from login)
-    nav_steps: Mapped[list | None] = mapped_column(JSONB, nullable=True)  # Recorded Playwright steps
+    nav_steps: Mapped[list | None] = mapped_column(JSONB, nullable=True, deferred=True, deferred_group="content", deferred_raiseload=True)  # Recorded Playwright steps
     depth: Mapped[int] = mapped_column(Integer, default=0)  # Clicks from login
 
     # Pattern detection
@@ -98,36 +106,57 @@ class DiscoveredPage(Base):
     feature_name: Mapped[str | None] = mapped_column(String(255), nullable=True)
     feature_description: Mapped[str | None] = mapped_column(Text, nullable=True)
 
-    discovered_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    discovered_at: Mapped[datetime] = mapped_column(DateTime, server_default=UTC_NOW)
 
     # Graph positioning (for visualization)
-    graph_x: Mapped[float | None] = mapped_column(Float, nullable=True)
-    graph_y: Mapped[float | None] = mapped_column(Float, nullable=True)
-    graph_z: Mapped[float | None] = mapped_column(Float, nullable=True)
+    graph_x: Mapped[float | None] = mapped_column(Float, nullable=True, deferred=True, deferred_group="graph", deferred_raiseload=True)
+    graph_y: Mapped[float | None] = mapped_column(Float, nullable=True, deferred=True, deferred_group="graph", deferred_raiseload=True)
+    graph_z: Mapped[float | None] = mapped_column(Float, nullable=True, deferred=True, deferred_group="graph", deferred_raiseload=True)
 
     # Relationships
-    project: Mapped["Project"] = relationship(back_populates="pages")
+    project: Mapped["Project"] = relationship(back_populates="pages", lazy="raise_on_sql")
     outgoing_connections: Mapped[list["PageConnection"]] = relationship(
         back_populates="source_page",
         foreign_keys="PageConnection.source_page_id",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise_on_sql"
     )
     incoming_connections: Mapped[list["PageConnection"]] = relationship(
         back_populates="target_page",
         foreign_keys="PageConnection.target_page_id",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise_on_sql"
     )
 
+    @classmethod
+    async def upsert(cls, session: AsyncSession, values: dict) -> uuid.UUID:
+        """Insert a page, or touch the existing row for the same (project_id, state_hash).
+
+        One round-trip either way; returns the id of the inserted or existing row.
+        """
+        stmt = (
+            pg_insert(cls)
+            .values(values)
+            .on_conflict_do_update(
+                index_elements=["project_id", "state_hash"],
+                set_={"discovered_at": func.timezone("utc", func.now())},
+            )
+            .returning(cls.id)
+        )
+        return (await session.execute(stmt)).scalar_one()
+
 
 class PageConnection(Base):
     """An edge in the navigation graph - how to get from one page to another."""
     __tablename__ = "page_connections"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    project_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("projects.id"))
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    project_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("projects.id", ondelete="CASCADE"), index=True)
 
-    source_page_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("discovered_pages.id"))
-    target_page_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("discovered_pages.id"))
+    source_page_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("discovered_pages.id", ondelete="CASCADE"), index=True)
+    target_page_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("discovered_pages.id", ondelete="CASCADE"), index=True)
 
     # How to traverse this edge
     action_type: Mapped[str] = mapped_column(String(50))  # click, navigate, submit
@@ -137,15 +166,22 @@ class PageConnection(Base):
     # The recorded step
     step: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
 
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=UTC_NOW)
 
     # Relationships
-    project: Mapped["Project"] = relationship(back_populates="connections")
+    project: Mapped["Project"] = relationship(back_populates="connections", lazy="raise_on_sql")
     source_page: Mapped["DiscoveredPage"] = relationship(
         back_populates="outgoing_connections",
-        foreign_keys=[source_page_id]
+        foreign_keys=[source_page_id],
+        lazy="raise_on_sql"
     )
     target_page: Mapped["DiscoveredPage"] = relationship(
         back_populates="incoming_connections",
-        foreign_keys=[target_page_id]
+        foreign_keys=[target_page_id],
+        lazy="raise_on_sql"
     )
+
+
+# Project discovery counters are maintained by this trigger
+for _ddl in install_ddl(PAGE_BUMP_COUNTERS_FUNCTION, PAGE_BUMP_COUNTERS_TRIGGER):
+    event.listen(DiscoveredPage.__table__, "after_create", _ddl.execute_if(dialect="postgresql"))
@@ -0,0 +1,64 @@
+"""Content-addressed API response bodies shared between request results."""
+
+import hashlib
+from typing import Iterable
+from sqlalchemy import Text, text
+from sqlalchemy.dialects.postgresql import BYTEA, insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Mapped, mapped_column
+from app.db.postgres import Base
+
+# Bodies no longer referenced by any result (e.g. after runs are deleted)
+DELETE_ORPHAN_BODIES = """
+DELETE FROM response_bodies b
+WHERE NOT EXISTS (
+    SELECT 1 FROM api_request_results r WHERE r.response_body_sha = b.sha
+)
+"""
+
+
+class ResponseBody(Base):
+    """A distinct response body, stored once however many results returned it.
+
+    Rows are immutable and keyed by the SHA-256 of the body.
+    """
+    __tablename__ = "response_bodies"
+
+    sha: Mapped[bytes] = mapped_column(BYTEA(32), primary_key=True)
+    body: Mapped[str] = mapped_column(Text)
+
+    @staticmethod
+    def digest(body: str) -> bytes:
+        """SHA-256 of the UTF-8 encoded body."""
+        return hashlib.sha256(body.encode()).digest()
+
+    @classmethod
+    async def store(cls, session: AsyncSession, bodies: Iterable[str | None]) -> list[bytes | None]:
+        """
+        Insert any bodies not stored yet, in one statement.
+
+        Returns the sha for each input body (None for None), in order.
+        """
+        shas: list[bytes | None] = []
+        rows: dict[bytes, str] = {}
+        for body in bodies:
+            if body is None:
+                shas.append(None)
+                continue
+            sha = cls.digest(body)
+            rows[sha] = body
+            shas.append(sha)
+
+        if rows:
+            await session.execute(
+                pg_insert(cls)
+                .values([{"sha": sha, "body": body} for sha, body in rows.items()])
+                .on_conflict_do_nothing(index_elements=["sha"])
+            )
+        return shas
+
+    @staticmethod
+    async def delete_orphans(session: AsyncSession) -> int:
+        """Delete bodies no result references any more; returns the number removed."""
+        result = await session.execute(text(DELETE_ORPHAN_BODIES))
+        return result.rowcount
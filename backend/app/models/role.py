@@ -2,32 +2,84 @@
 
 import uuid
 from datetime import datetime
-from sqlalchemy import String, DateTime, Boolean
-from sqlalchemy.dialects.postgresql import UUID, JSONB
+from sqlalchemy import String, DateTime, Boolean, ForeignKey, event, FetchedValue
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from app.db.postgres import Base
+from app.db.postgres import Base, AsyncSessionLocal, UTC_NOW
+from app.utils.ids import uuid7
+from app.db.triggers import ROLE_NOTIFY_FUNCTION, ROLE_NOTIFY_TRIGGER, install_ddl
+from app.utils.ttl_cache import TTLCache
+
+# Detached Role snapshots keyed by id. Invalidated on role_changed NOTIFY
+# (see app.db.listeners) and by the admin endpoints; the TTL bounds staleness
+# if a notification is missed.
+_role_cache: TTLCache[uuid.UUID, "Role"] = TTLCache(maxsize=64, ttl=300)
 
 
 class Role(Base):
     """User roles with permissions."""
     __tablename__ = "roles"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     name: Mapped[str] = mapped_column(String(50), unique=True)
     display_name: Mapped[str] = mapped_column(String(100))
     description: Mapped[str | None] = mapped_column(String(255), nullable=True)
 
-    # Permissions as JSON object
+    # Permissions live in a shared, deduplicated permission set
     # e.g., {"manage_users": true, "manage_tests": true, "run_tests": true}
-    permissions: Mapped[dict] = mapped_column(JSONB, default=dict)
+    permission_set_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("permission_sets.id"), index=True
+    )
+    permission_set: Mapped["PermissionSet"] = relationship(lazy="joined", innerjoin=True)
 
     # System roles cannot be deleted
     is_system: Mapped[bool] = mapped_column(Boolean, default=False)
 
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
-    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=UTC_NOW)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, server_default=UTC_NOW, server_onupdate=FetchedValue())
+
+    users = relationship("User", back_populates="role", lazy="raise_on_sql")
+
+    @property
+    def permissions(self) -> dict:
+        """Permissions dict of the role's permission set."""
+        return self.permission_set.perms
+
+    @property
+    def permission_bits(self) -> int:
+        """PERMISSION_BITS bitmap of the role's permission set."""
+        return self.permission_set.bits
+
+    @classmethod
+    async def get_cached(cls, session: AsyncSession, role_id: uuid.UUID) -> "Role | None":
+        """
+        Return the role (with its permission set) attached to ``session``.
+
+        Served from the in-process cache when possible: the cached snapshot is
+        merged without a SELECT, so every session gets its own instance.
+        """
+        cached = _role_cache.get(role_id)
+        if cached is None:
+            # Load in a throwaway session so the cached instance is never attached
+            async with AsyncSessionLocal() as loader:
+                cached = await loader.get(cls, role_id)
+            if cached is None:
+                return None
+            _role_cache.set(role_id, cached)
+        return await session.merge(cached, load=False)
+
+    @staticmethod
+    def invalidate_cached(role_id: uuid.UUID | None = None) -> None:
+        """Drop one cached role, or all of them."""
+        if role_id is None:
+            _role_cache.clear()
+        else:
+            _role_cache.pop(role_id)
+
 
-    users = relationship("User", back_populates="role")
+for _ddl in install_ddl(ROLE_NOTIFY_FUNCTION, ROLE_NOTIFY_TRIGGER):
+    event.listen(Role.__table__, "after_create", _ddl.execute_if(dialect="postgresql"))
 
 
 # Default permissions for each role
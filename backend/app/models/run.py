@@ -3,19 +3,20 @@ from datetime import datetime
 from sqlalchemy import String, Text, ForeignKey, DateTime
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from app.db.postgres import Base
+from app.db.postgres import Base, UTC_NOW
+from app.utils.ids import uuid7
 
 
 class Run(Base):
     __tablename__ = "runs"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    version_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("test_versions.id"))
-    schedule_run_id: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True), ForeignKey("schedule_runs.id"), nullable=True)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    version_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("test_versions.id", ondelete="CASCADE"), index=True)
+    schedule_run_id: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True), ForeignKey("schedule_runs.id"), nullable=True, index=True)
     status: Mapped[str] = mapped_column(String(50))  # running, passed, failed
-    started_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    started_at: Mapped[datetime] = mapped_column(DateTime, server_default=UTC_NOW)
     finished_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
     error_message: Mapped[str | None] = mapped_column(Text, nullable=True)
 
     # Relationships
-    schedule_run: Mapped["ScheduleRun"] = relationship("ScheduleRun", back_populates="test_runs")
+    schedule_run: Mapped["ScheduleRun"] = relationship("ScheduleRun", back_populates="test_runs", lazy="raise_on_sql")
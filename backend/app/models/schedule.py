@@ -1,39 +1,52 @@
 import uuid
 from datetime import datetime
-from sqlalchemy import String, Text, Boolean, ForeignKey, DateTime
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import String, Text, Boolean, Integer, ForeignKey, DateTime, Index, SmallInteger, text, FetchedValue
+from sqlalchemy.dialects.postgresql import UUID, ARRAY
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from app.db.postgres import Base
+from app.db.postgres import Base, UTC_NOW
+from app.utils.ids import uuid7
+from app.models.enums import RunStatus, ScheduleFrequency
 
 
 class Schedule(Base):
     """Scheduled test runs."""
     __tablename__ = "schedules"
+    __table_args__ = (
+        # Scheduler polling: enabled schedules with next_run_at <= now
+        Index("ix_schedules_due", "next_run_at", postgresql_where=text("enabled = true")),
+        # Reverse lookups such as "schedules that run on Monday" (run_on_days @> '{1}')
+        Index("ix_schedules_run_on_days", "run_on_days", postgresql_using="gin"),
+    )
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     name: Mapped[str] = mapped_column(String(255))
 
     # Can schedule either a single test OR all tests in a collection
-    test_id: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True), ForeignKey("tests.id"), nullable=True)
-    collection_id: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True), ForeignKey("collections.id"), nullable=True)
+    test_id: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True), ForeignKey("tests.id"), nullable=True, index=True)
+    collection_id: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True), ForeignKey("collections.id"), nullable=True, index=True)
 
     # Frequency: hourly, daily, weekly, or cron expression
-    frequency: Mapped[str] = mapped_column(String(50))  # hourly, daily, weekly, custom
+    frequency: Mapped[str] = mapped_column(ScheduleFrequency)  # hourly, daily, weekly, custom
     cron_expression: Mapped[str | None] = mapped_column(String(100), nullable=True)  # For custom schedules
 
     # Timing
     run_at_hour: Mapped[int | None] = mapped_column(nullable=True)  # 0-23, for daily/weekly
     run_at_minute: Mapped[int | None] = mapped_column(nullable=True, default=0)  # 0-59
-    run_on_days: Mapped[str | None] = mapped_column(String(50), nullable=True)  # "1,2,3,4,5" for weekdays (0=Sun, 6=Sat)
+    run_on_days: Mapped[list[int] | None] = mapped_column(ARRAY(SmallInteger), nullable=True)  # [1, 2, 3, 4, 5] for weekdays
 
     # State
     enabled: Mapped[bool] = mapped_column(Boolean, default=True)
     last_run_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
     next_run_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
-    last_run_status: Mapped[str | None] = mapped_column(String(20), nullable=True)  # passed, failed
+    last_run_status: Mapped[str | None] = mapped_column(RunStatus, nullable=True)  # passed, failed
+
+    # Stats (bumped by a schedule_runs trigger)
+    total_runs: Mapped[int] = mapped_column(Integer, default=0)
+    total_passed: Mapped[int] = mapped_column(Integer, default=0)
+    total_failed: Mapped[int] = mapped_column(Integer, default=0)
 
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
-    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=UTC_NOW)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, server_default=UTC_NOW, server_onupdate=FetchedValue())
 
     # Multi-tenancy
     user_id: Mapped[uuid.UUID | None] = mapped_column(
@@ -44,6 +57,6 @@ class Schedule(Base):
     )
 
     # Relationships
-    test: Mapped["Test"] = relationship("Test", foreign_keys=[test_id])
-    collection: Mapped["Collection"] = relationship("Collection", foreign_keys=[collection_id])
-    runs: Mapped[list["ScheduleRun"]] = relationship("ScheduleRun", back_populates="schedule")
+    test: Mapped["Test"] = relationship("Test", foreign_keys=[test_id], lazy="raise_on_sql")
+    collection: Mapped["Collection"] = relationship("Collection", foreign_keys=[collection_id], lazy="raise_on_sql")
+    runs: Mapped[list["ScheduleRun"]] = relationship("ScheduleRun", back_populates="schedule", lazy="raise_on_sql")
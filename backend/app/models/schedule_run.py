@@ -1,20 +1,26 @@
 import uuid
 from datetime import datetime
-from sqlalchemy import String, Integer, ForeignKey, DateTime
+from sqlalchemy import String, Integer, ForeignKey, DateTime, Index, event
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from app.db.postgres import Base
+from app.db.postgres import Base, UTC_NOW
+from app.utils.ids import uuid7
+from app.db.triggers import SCHEDULE_RUN_BUMP_COUNTERS_FUNCTION, SCHEDULE_RUN_BUMP_COUNTERS_TRIGGER, install_ddl
 
 
 class ScheduleRun(Base):
     """Tracks each execution of a schedule (collection-level run)."""
     __tablename__ = "schedule_runs"
+    __table_args__ = (
+        # Run history per schedule, newest first
+        Index("ix_schedule_runs_schedule_started", "schedule_id", "started_at"),
+    )
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     schedule_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("schedules.id"))
 
     status: Mapped[str] = mapped_column(String(20))  # running, passed, failed
-    started_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    started_at: Mapped[datetime] = mapped_column(DateTime, server_default=UTC_NOW)
     finished_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
 
     # Stats
@@ -25,5 +31,9 @@ class ScheduleRun(Base):
     error_message: Mapped[str | None] = mapped_column(String(1000), nullable=True)
 
     # Relationships
-    schedule: Mapped["Schedule"] = relationship("Schedule", back_populates="runs")
-    test_runs: Mapped[list["Run"]] = relationship("Run", back_populates="schedule_run")
+    schedule: Mapped["Schedule"] = relationship("Schedule", back_populates="runs", lazy="raise_on_sql")
+    test_runs: Mapped[list["Run"]] = relationship("Run", back_populates="schedule_run", lazy="raise_on_sql")
+
+
+for _ddl in install_ddl(SCHEDULE_RUN_BUMP_COUNTERS_FUNCTION, SCHEDULE_RUN_BUMP_COUNTERS_TRIGGER):
+    event.listen(ScheduleRun.__table__, "after_create", _ddl.execute_if(dialect="postgresql"))
@@ -2,17 +2,18 @@
 
 import uuid
 from datetime import datetime
-from sqlalchemy import String, Float, Boolean, ForeignKey, DateTime
+from sqlalchemy import String, Float, Boolean, ForeignKey, DateTime, FetchedValue
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from app.db.postgres import Base
+from app.db.postgres import Base, UTC_NOW
+from app.utils.ids import uuid7
 
 
 class UserSettings(Base):
     """User-specific settings for healing and other features."""
     __tablename__ = "user_settings"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id"), unique=True)
 
     # Healing settings
@@ -23,5 +24,5 @@ class UserSettings(Base):
     healing_provider: Mapped[str] = mapped_column(String(20), default="gemini")  # gemini, openai, anthropic
 
     # Timestamps
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
-    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=UTC_NOW)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, server_default=UTC_NOW, server_onupdate=FetchedValue())
@@ -2,21 +2,24 @@
 
 import uuid
 from datetime import datetime
-from sqlalchemy import String, Text, Integer, ForeignKey, DateTime
+from typing import Iterable
+from sqlalchemy import String, Text, Integer, ForeignKey, DateTime, insert, FetchedValue
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from app.db.postgres import Base
+from app.db.postgres import Base, UTC_NOW
+from app.utils.ids import uuid7
 
 
 class Collection(Base):
     __tablename__ = "collections"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     name: Mapped[str] = mapped_column(String(255))
     description: Mapped[str | None] = mapped_column(Text, nullable=True)
     color: Mapped[str | None] = mapped_column(String(20), nullable=True, default="#6366f1")
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
-    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=UTC_NOW)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, server_default=UTC_NOW, server_onupdate=FetchedValue())
 
     # Multi-tenancy
     user_id: Mapped[uuid.UUID | None] = mapped_column(
@@ -26,21 +29,21 @@ class Collection(Base):
         UUID(as_uuid=True), ForeignKey("organizations.id"), nullable=True, index=True
     )
 
-    tests: Mapped[list["Test"]] = relationship(back_populates="collection")
+    tests: Mapped[list["Test"]] = relationship(back_populates="collection", lazy="raise_on_sql")
 
 
 class Test(Base):
     __tablename__ = "tests"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     name: Mapped[str] = mapped_column(String(255))
     description: Mapped[str | None] = mapped_column(Text, nullable=True)
     target_url: Mapped[str] = mapped_column(String(500))
     collection_id: Mapped[uuid.UUID | None] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("collections.id"), nullable=True
+        UUID(as_uuid=True), ForeignKey("collections.id"), nullable=True, index=True
     )
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
-    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=UTC_NOW)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, server_default=UTC_NOW, server_onupdate=FetchedValue())
 
     # Variant tracking
     parent_test_id: Mapped[uuid.UUID | None] = mapped_column(
@@ -57,34 +60,60 @@ class Test(Base):
         UUID(as_uuid=True), ForeignKey("organizations.id"), nullable=True, index=True
     )
 
-    collection: Mapped["Collection | None"] = relationship(back_populates="tests")
-    versions: Mapped[list["TestVersion"]] = relationship(back_populates="test", cascade="all, delete-orphan")
-    parent_test: Mapped["Test | None"] = relationship("Test", remote_side=[id], backref="variants")
+    collection: Mapped["Collection | None"] = relationship(back_populates="tests", lazy="raise_on_sql")
+    versions: Mapped[list["TestVersion"]] = relationship(back_populates="test", cascade="all, delete-orphan", passive_deletes=True, lazy="raise_on_sql")
+    # Self-reference: load with joinedload(Test.parent_test) (many-to-one, one
+    # self-join) and selectinload(Test.variants) (one IN query per level)
+    parent_test: Mapped["Test | None"] = relationship(back_populates="variants", remote_side=[id], lazy="raise_on_sql")
+    variants: Mapped[list["Test"]] = relationship(back_populates="parent_test", lazy="raise_on_sql")
 
 
 class TestVersion(Base):
     __tablename__ = "test_versions"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    test_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("tests.id"))
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    test_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("tests.id", ondelete="CASCADE"), index=True)
     version_number: Mapped[int] = mapped_column(Integer)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=UTC_NOW)
 
-    test: Mapped["Test"] = relationship(back_populates="versions")
-    steps: Mapped[list["Step"]] = relationship(back_populates="version", cascade="all, delete-orphan")
+    test: Mapped["Test"] = relationship(back_populates="versions", lazy="raise_on_sql")
+    # A version is nearly always read together with its steps; batch-load them
+    steps: Mapped[list["Step"]] = relationship(
+        back_populates="version", cascade="all, delete-orphan", passive_deletes=True,
+        lazy="selectin", order_by="Step.order_index"
+    )
 
 
 class Step(Base):
     __tablename__ = "steps"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    version_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("test_versions.id"))
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    version_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("test_versions.id", ondelete="CASCADE"), index=True)
     order_index: Mapped[int] = mapped_column(Integer)
     type: Mapped[str] = mapped_column(String(50))
     selector: Mapped[str | None] = mapped_column(String(500), nullable=True)
     value: Mapped[str | None] = mapped_column(Text, nullable=True)
     screenshot_url: Mapped[str | None] = mapped_column(String(500), nullable=True)
     assertion_config: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
-
-    version: Mapped["TestVersion"] = relationship(back_populates="steps")
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=UTC_NOW)
+
+    version: Mapped["TestVersion"] = relationship(back_populates="steps", lazy="raise_on_sql")
+
+    INSERT_BATCH_SIZE = 1000
+
+    @classmethod
+    async def insert_many(cls, session: AsyncSession, version_id: uuid.UUID, rows: Iterable[dict]) -> None:
+        """
+        Insert the steps for one version as executemany batches.
+
+        Each row is a dict of column values without version_id; ids and
+        created_at come from the column defaults, so nothing is read back.
+        """
+        batch = []
+        for row in rows:
+            batch.append({**row, "version_id": version_id})
+            if len(batch) == cls.INSERT_BATCH_SIZE:
+                await session.execute(insert(cls), batch)
+                batch = []
+        if batch:
+            await session.execute(insert(cls), batch)
@@ -2,19 +2,21 @@
 
 import uuid
 from datetime import datetime
-from sqlalchemy import String, Text, Integer, ForeignKey, DateTime, Boolean
+from sqlalchemy import String, Text, Integer, ForeignKey, DateTime, Boolean, Index, text, FetchedValue
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from app.db.postgres import Base
+from app.db.postgres import Base, UTC_NOW
+from app.utils.ids import uuid7
+from app.models.enums import RunStatus, TestCaseStatus, TestCaseSource, TestRunStatus
 
 
 class TestCase(Base):
     """A test case generated from discovered page analysis."""
     __tablename__ = "test_cases"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    project_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("projects.id"))
-    page_id: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True), ForeignKey("discovered_pages.id"), nullable=True)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    project_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("projects.id", ondelete="CASCADE"), index=True)
+    page_id: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True), ForeignKey("discovered_pages.id", ondelete="SET NULL"), nullable=True, index=True)
 
     # Test info
     name: Mapped[str] = mapped_column(String(255))
@@ -31,34 +33,39 @@ class TestCase(Base):
     test_type: Mapped[str] = mapped_column(String(50), default="positive")  # positive, negative, edge
 
     # Source of the test
-    source: Mapped[str] = mapped_column(String(50), default="suggested")  # suggested, custom, recorded
+    source: Mapped[str] = mapped_column(TestCaseSource, default="suggested")  # suggested, custom, recorded
 
     # Status
-    status: Mapped[str] = mapped_column(String(50), default="pending")  # pending, recording, ready, passing, failing
+    status: Mapped[str] = mapped_column(TestCaseStatus, default="pending")  # pending, recording, ready, passing, failing
 
     # Last run info
     last_run_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
-    last_run_status: Mapped[str | None] = mapped_column(String(50), nullable=True)  # passed, failed, error
+    last_run_status: Mapped[str | None] = mapped_column(RunStatus, nullable=True)  # passed, failed, error
     last_run_duration: Mapped[int | None] = mapped_column(Integer, nullable=True)  # milliseconds
-    last_run_error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    # Not part of any response; deferred (raising if read unloaded)
+    last_run_error: Mapped[str | None] = mapped_column(Text, nullable=True, deferred=True, deferred_raiseload=True)
 
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
-    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=UTC_NOW)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, server_default=UTC_NOW, server_onupdate=FetchedValue())
 
     # Relationships
-    runs: Mapped[list["TestRun"]] = relationship(back_populates="test_case", cascade="all, delete-orphan")
+    runs: Mapped[list["TestRun"]] = relationship(back_populates="test_case", cascade="all, delete-orphan", passive_deletes=True, lazy="raise_on_sql")
 
 
 class TestRun(Base):
     """A single execution of a test case."""
     __tablename__ = "test_runs"
+    __table_args__ = (
+        # Run history per test case, newest first; also serves the test_case_id FK
+        Index("ix_test_runs_case_created", "test_case_id", text("created_at DESC")),
+    )
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    test_case_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("test_cases.id"))
-    project_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("projects.id"))
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    test_case_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("test_cases.id", ondelete="CASCADE"))
+    project_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("projects.id", ondelete="CASCADE"), index=True)
 
     # Run status
-    status: Mapped[str] = mapped_column(String(50), default="queued")  # queued, running, passed, failed, error
+    status: Mapped[str] = mapped_column(TestRunStatus, default="queued")  # queued, running, passed, failed, error
 
     # Execution details
     started_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
@@ -68,14 +75,15 @@ class TestRun(Base):
     # Results
     steps_completed: Mapped[int] = mapped_column(Integer, default=0)
     steps_total: Mapped[int] = mapped_column(Integer, default=0)
-    error_message: Mapped[str | None] = mapped_column(Text, nullable=True)
+    error_message: Mapped[str | None] = mapped_column(Text, nullable=True, deferred=True, deferred_group="artifacts", deferred_raiseload=True)
     error_step: Mapped[int | None] = mapped_column(Integer, nullable=True)
 
-    # Logs and artifacts
-    logs: Mapped[list | None] = mapped_column(JSONB, nullable=True)  # Array of log entries
-    screenshots: Mapped[list | None] = mapped_column(JSONB, nullable=True)  # Array of screenshot URLs
+    # Logs and artifacts grow with run length; deferred (raising if touched
+    # unloaded), undefer_group("artifacts") on the run detail path
+    logs: Mapped[list | None] = mapped_column(JSONB, nullable=True, deferred=True, deferred_group="artifacts", deferred_raiseload=True)  # Array of log entries
+    screenshots: Mapped[list | None] = mapped_column(JSONB, nullable=True, deferred=True, deferred_group="artifacts", deferred_raiseload=True)  # Array of screenshot URLs
 
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=UTC_NOW)
 
     # Relationships
-    test_case: Mapped["TestCase"] = relationship(back_populates="runs")
+    test_case: Mapped["TestCase"] = relationship(back_populates="runs", lazy="raise_on_sql")
@@ -2,22 +2,24 @@
 
 import uuid
 from datetime import datetime
-from sqlalchemy import String, Boolean, DateTime, ForeignKey
+from sqlalchemy import String, Boolean, DateTime, ForeignKey, FetchedValue
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from app.db.postgres import Base
+from app.db.postgres import Base, UTC_NOW
+from app.utils.ids import uuid7
+from app.models.permission_set import PERMISSION_BITS
 
 
 class User(Base):
     __tablename__ = "users"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     email: Mapped[str] = mapped_column(String(255), unique=True, index=True)
     hashed_password: Mapped[str] = mapped_column(String(255))
     name: Mapped[str] = mapped_column(String(255))
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
-    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=UTC_NOW)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, server_default=UTC_NOW, server_onupdate=FetchedValue())
 
     # Organization relationship (nullable for personal workspace)
     org_id: Mapped[uuid.UUID | None] = mapped_column(
@@ -26,7 +28,7 @@ class User(Base):
         nullable=True,
         index=True
     )
-    organization = relationship("Organization", back_populates="users")
+    organization = relationship("Organization", back_populates="users", lazy="raise_on_sql")
 
     # Role relationship
     role_id: Mapped[uuid.UUID | None] = mapped_column(
@@ -35,10 +37,14 @@ class User(Base):
         nullable=True,
         index=True
     )
-    role = relationship("Role", back_populates="users")
+    role = relationship("Role", back_populates="users", lazy="raise_on_sql")
 
     def has_permission(self, permission: str) -> bool:
         """Check if user has a specific permission."""
         if not self.role:
             return False
-        return self.role.permissions.get(permission, False)
+        bit = PERMISSION_BITS.get(permission)
+        if bit is None:
+            # Custom permission outside the bitmap
+            return bool(self.role.permissions.get(permission, False))
+        return bool(self.role.permission_bits & bit)
@@ -1,7 +1,8 @@
 """Pydantic schemas for API test assertions and variable extraction."""
 
-from typing import Literal, Any
-from pydantic import BaseModel, Field
+from dataclasses import dataclass
+from typing import Annotated, Literal, Any, Union
+from pydantic import BaseModel, Field, TypeAdapter
 
 
 class StatusAssertionConfig(BaseModel):
@@ -41,22 +42,75 @@ class BodyContainsAssertionConfig(BaseModel):
     case_sensitive: bool = True
 
 
-class AssertionConfig(BaseModel):
-    """Generic assertion configuration."""
-    type: Literal["status", "jsonpath", "header", "timing", "schema", "body_contains", "body_equals"]
+class BodyEqualsAssertionConfig(BaseModel):
+    """Configuration for exact body match."""
+    expected: str = ""
+    ignore_whitespace: bool = False
+
+
+class _AssertionBase(BaseModel):
+    """Fields shared by every assertion; stored as {type, name, config}."""
     name: str | None = Field(None, description="Optional name for the assertion")
-    config: dict = Field(default_factory=dict)
-    # Config structure depends on type:
-    # - status: StatusAssertionConfig
-    # - jsonpath: JSONPathAssertionConfig
-    # - header: HeaderAssertionConfig
-    # - timing: TimingAssertionConfig
-    # - schema: SchemaAssertionConfig
-    # - body_contains: BodyContainsAssertionConfig
-    # - body_equals: {"expected": "..."}
-
-
-class AssertionResult(BaseModel):
+
+    model_config = {"frozen": True}
+
+
+class StatusAssertion(_AssertionBase):
+    type: Literal["status"]
+    config: StatusAssertionConfig
+
+
+class JSONPathAssertion(_AssertionBase):
+    type: Literal["jsonpath"]
+    config: JSONPathAssertionConfig
+
+
+class HeaderAssertion(_AssertionBase):
+    type: Literal["header"]
+    config: HeaderAssertionConfig
+
+
+class TimingAssertion(_AssertionBase):
+    type: Literal["timing"]
+    config: TimingAssertionConfig
+
+
+class SchemaAssertion(_AssertionBase):
+    type: Literal["schema"]
+    config: SchemaAssertionConfig
+
+
+class BodyContainsAssertion(_AssertionBase):
+    type: Literal["body_contains"]
+    config: BodyContainsAssertionConfig
+
+
+class BodyEqualsAssertion(_AssertionBase):
+    type: Literal["body_equals"]
+    config: BodyEqualsAssertionConfig = Field(default_factory=BodyEqualsAssertionConfig)
+
+
+# Assertion configuration, dispatched on "type" so each config is validated
+# against its own model
+AssertionConfig = Annotated[
+    Union[
+        StatusAssertion,
+        JSONPathAssertion,
+        HeaderAssertion,
+        TimingAssertion,
+        SchemaAssertion,
+        BodyContainsAssertion,
+        BodyEqualsAssertion,
+    ],
+    Field(discriminator="type"),
+]
+
+
+# Result types are built server-side and emitted once per row of run results;
+# slotted dataclasses skip BaseModel's per-instance __dict__ and field-set tracking
+
+@dataclass(slots=True, kw_only=True)
+class AssertionResult:
     """Result of a single assertion execution."""
     type: str
     name: str | None = None
@@ -65,6 +119,18 @@ class AssertionResult(BaseModel):
     actual: Any = None
     message: str | None = None
 
+    @classmethod
+    def from_dict(cls, data: dict) -> "AssertionResult":
+        """Build from a stored assertion result dict, ignoring unknown keys."""
+        return cls(
+            type=data.get("type") or "",
+            name=data.get("name"),
+            passed=bool(data.get("passed", False)),
+            expected=data.get("expected"),
+            actual=data.get("actual"),
+            message=data.get("message"),
+        )
+
 
 class VariableExtraction(BaseModel):
     """Configuration for extracting variables from response."""
@@ -74,9 +140,15 @@ class VariableExtraction(BaseModel):
     default: Any = None  # Default value if extraction fails
 
 
-class ExtractedVariable(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class ExtractedVariable:
     """Result of variable extraction."""
     name: str
     value: Any
     source: str
     path: str
+
+
+# Built once per process; validate/dump whole lists in a single pydantic-core call
+ASSERTIONS_ADAPTER = TypeAdapter(list[AssertionConfig])
+EXTRACTIONS_ADAPTER = TypeAdapter(list[VariableExtraction])
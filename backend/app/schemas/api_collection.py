@@ -60,7 +60,7 @@ class APICollectionResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    model_config = {"from_attributes": True}
+    model_config = {"from_attributes": True, "frozen": True}
 
 
 class APICollectionSummary(BaseModel):
@@ -81,8 +81,8 @@ class APICollectionSummary(BaseModel):
 
 class APICollectionDetailResponse(APICollectionResponse):
     """Detailed API collection response with related data."""
-    requests: list["APIRequestResponse"] = []
-    environments: list["APIEnvironmentResponse"] = []
+    requests: list["APIRequestResponse"] = Field(default_factory=list)
+    environments: list["APIEnvironmentResponse"] = Field(default_factory=list)
 
     model_config = {"from_attributes": True}
 
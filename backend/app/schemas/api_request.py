@@ -3,7 +3,7 @@
 from datetime import datetime
 from uuid import UUID
 from typing import Literal, Any
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
 from app.schemas.api_assertions import AssertionConfig, VariableExtraction
 
@@ -85,7 +85,10 @@ class APIRequestResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    model_config = {"from_attributes": True}
+    model_config = {"from_attributes": True, "frozen": True}
+
+
+REQUEST_LIST_ADAPTER = TypeAdapter(list[APIRequestResponse])
 
 
 class ReorderRequestsRequest(BaseModel):
@@ -3,9 +3,11 @@
 from datetime import datetime
 from uuid import UUID
 from typing import Literal, Any
-from pydantic import BaseModel, Field
+import msgspec
+from pydantic import BaseModel, Field, TypeAdapter
 
 from app.schemas.api_assertions import AssertionResult
+from app.schemas.base import TrustedFromORM
 
 
 class ExecuteCollectionRequest(BaseModel):
@@ -32,8 +34,10 @@ class TimingBreakdown(BaseModel):
     ttfb_ms: int | None = None  # Time to first byte
     download_ms: int | None = None
 
+    model_config = {"frozen": True}
 
-class APIRequestResultResponse(BaseModel):
+
+class APIRequestResultResponse(TrustedFromORM, BaseModel):
     """Schema for API request result response."""
     id: UUID
     test_run_id: UUID
@@ -44,12 +48,12 @@ class APIRequestResultResponse(BaseModel):
     # Request details (resolved)
     resolved_url: str | None = None
     resolved_method: str | None = None
-    resolved_headers: dict | None = None
+    resolved_headers: dict[str, str] | None = None
     resolved_body: str | None = None
 
     # Response details
     response_status: int | None = None
-    response_headers: dict | None = None
+    response_headers: dict[str, str | list[str]] | None = None  # Karate reports multi-value headers as lists
     response_body: str | None = None
     response_size_bytes: int | None = None
 
@@ -63,7 +67,7 @@ class APIRequestResultResponse(BaseModel):
     assertion_results: list[AssertionResult] | None = None
 
     # Extracted variables
-    extracted_variables: dict | None = None
+    extracted_variables: dict[str, Any] | None = None
 
     # Errors
     error_message: str | None = None
@@ -79,6 +83,20 @@ class APIRequestResultResponse(BaseModel):
 
     model_config = {"from_attributes": True}
 
+    @classmethod
+    def from_orm_trusted(cls, obj) -> "APIRequestResultResponse":
+        result = super().from_orm_trusted(obj)
+        # JSONB columns come back as plain dicts; build the nested types too
+        if obj.timing_breakdown is not None:
+            result.timing_breakdown = TimingBreakdown.model_construct(**obj.timing_breakdown)
+        if obj.assertion_results is not None:
+            result.assertion_results = [AssertionResult.from_dict(a) for a in obj.assertion_results]
+        return result
+
+
+# Serializes a run's result rows straight to JSON bytes in one pydantic-core call
+RESULT_LIST_ADAPTER = TypeAdapter(list[APIRequestResultResponse])
+
 
 class APITestRunResponse(BaseModel):
     """Schema for API test run response."""
@@ -110,7 +128,7 @@ class APITestRunResponse(BaseModel):
     error_type: str | None = None
 
     # Karate-specific
-    karate_job_id: str | None = None
+    karate_job_id: UUID | None = None
 
     created_at: datetime
 
@@ -137,9 +155,42 @@ class APITestRunSummary(BaseModel):
     model_config = {"from_attributes": True}
 
 
+class APITestRunSummaryRow(msgspec.Struct, kw_only=True):
+    """msgspec twin of APITestRunSummary; the run list is encoded from these."""
+    id: UUID
+    collection_id: UUID | None = None
+    collection_name: str | None = None
+    name: str | None = None
+    trigger_type: str
+    engine: str
+    status: str
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+    total_duration_ms: int | None = None
+    total_requests: int
+    passed_requests: int
+    failed_requests: int
+    created_at: datetime
+
+
+class CollectionDailyStatsResponse(BaseModel):
+    """One day of run totals for a collection (from mv_collection_daily_stats)."""
+    collection_id: UUID
+    day: datetime
+    runs: int
+    passed_runs: int
+    failed_runs: int
+    total_requests: int
+    passed_requests: int
+    failed_requests: int
+    avg_duration_ms: int | None = None
+
+    model_config = {"from_attributes": True}
+
+
 class APITestRunDetailResponse(APITestRunResponse):
     """Detailed test run response with results."""
-    results: list[APIRequestResultResponse] = []
+    results: list[APIRequestResultResponse] = Field(default_factory=list)
     run_context: dict | None = None
 
     model_config = {"from_attributes": True}
@@ -151,6 +202,8 @@ class WSExecutionMessage(BaseModel):
     type: Literal["start", "request_start", "request_complete", "assertion", "variable", "status", "complete", "error"]
     data: dict = Field(default_factory=dict)
 
+    model_config = {"frozen": True}
+
 
 class WSStartCommand(BaseModel):
     """WebSocket command to start execution."""
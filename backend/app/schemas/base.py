@@ -0,0 +1,16 @@
+"""Shared schema helpers."""
+
+from typing import Any, Self
+
+
+class TrustedFromORM:
+    """Build a response model from an ORM row without validating it.
+
+    Only for values that came out of the database through typed columns;
+    FastAPI still validates the response against ``response_model`` on the
+    way out. Never mix into request/input schemas.
+    """
+
+    @classmethod
+    def from_orm_trusted(cls, obj: Any) -> Self:
+        return cls.model_construct(**{name: getattr(obj, name) for name in cls.model_fields})
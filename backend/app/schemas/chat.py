@@ -7,6 +7,8 @@ class ChatMessage(BaseModel):
     role: Literal["user", "assistant", "system"]
     content: str
 
+    model_config = {"frozen": True}
+
 
 class ChatRequest(BaseModel):
     message: str
@@ -25,6 +27,8 @@ class AgentAction(BaseModel):
     screenshot: str | None = None  # base64 encoded
     timestamp: str
 
+    model_config = {"frozen": True}
+
 
 class BrowserUpdate(BaseModel):
     type: Literal["screenshot", "action", "status", "error", "complete"]
@@ -25,5 +25,4 @@ class CollectionResponse(CollectionBase):
     updated_at: datetime
     test_count: int = 0
 
-    class Config:
-        from_attributes = True
+    model_config = {"from_attributes": True}
@@ -27,8 +27,7 @@ class HealingSuggestionResponse(BaseModel):
     applied_at: Optional[datetime] = None
     retry_success: Optional[bool] = None
 
-    class Config:
-        from_attributes = True
+    model_config = {"from_attributes": True}
 
 
 class HealingSuggestionApprove(BaseModel):
@@ -44,11 +43,15 @@ class HealingSuggestionBulkAction(BaseModel):
 
 
 class HealingSettingsResponse(BaseModel):
-    """Current healing settings."""
+    """Healing settings; the global defaults or a user's own (see app.api.settings)."""
     enabled: bool
     auto_approve_threshold: float
     mode: str  # inline, batch, both
-    default_provider: str
+    default_provider: Optional[str] = None  # global defaults only
+    auto_approve: Optional[bool] = None  # per-user settings only
+    provider: Optional[str] = None  # per-user settings only
+
+    model_config = {"from_attributes": True}
 
 
 class HealingSettingsUpdate(BaseModel):
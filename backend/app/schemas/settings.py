@@ -5,17 +5,7 @@ from typing import Optional
 from uuid import UUID
 from datetime import datetime
 
-
-class HealingSettingsResponse(BaseModel):
-    """Healing settings for display."""
-    enabled: bool
-    auto_approve: bool
-    auto_approve_threshold: float
-    mode: str
-    provider: str
-
-    class Config:
-        from_attributes = True
+from app.schemas.healing import HealingSettingsResponse  # re-exported for app.api.settings
 
 
 class HealingSettingsUpdate(BaseModel):
@@ -39,8 +29,7 @@ class UserSettingsResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = {"from_attributes": True}
 
 
 class LLMProviderOption(BaseModel):
@@ -1,7 +1,7 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Discriminator, Tag
 from uuid import UUID
 from datetime import datetime
-from typing import Literal
+from typing import Annotated, Any, Literal, Union
 
 
 # Action step types
@@ -28,17 +28,55 @@ StepType = Literal[
 ]
 
 
-class AssertionConfig(BaseModel):
-    """Configuration for assertion steps."""
+class _AssertionConfigBase(BaseModel):
     expected: str | None = None                    # Expected text/value
     operator: str = "equals"                       # equals, contains, matches, gt, lt
-    attribute: str | None = None                   # For assert_attribute (e.g., "disabled", "href")
-    api_method: str | None = None                  # GET, POST, etc. for assert_api
-    api_url_pattern: str | None = None             # URL pattern to match for assert_api
-    api_status: int | None = None                  # Expected status code for assert_api
+
+
+class TextAssertionConfig(_AssertionConfigBase):
+    """Config for text, value, URL, visibility and vision assertions."""
+
+
+class AttributeAssertionConfig(_AssertionConfigBase):
+    """Config for assert_attribute."""
+    attribute: str | None = None                   # e.g., "disabled", "href"
+
+
+class APIAssertionConfig(_AssertionConfigBase):
+    """Config for assert_api."""
+    api_method: str | None = None                  # GET, POST, etc.
+    api_url_pattern: str | None = None             # URL pattern to match
+    api_status: int | None = None                  # Expected status code
     api_body_contains: str | None = None           # Expected content in response body
 
 
+_API_FIELDS = ("api_method", "api_url_pattern", "api_status", "api_body_contains")
+
+
+def _assertion_config_kind(value: Any) -> str:
+    """Pick the config variant from the fields present (stored configs carry no tag)."""
+    if isinstance(value, dict):
+        get = value.get
+    else:
+        def get(name):
+            return getattr(value, name, None)
+    if any(get(name) is not None for name in _API_FIELDS):
+        return "api"
+    if get("attribute") is not None:
+        return "attribute"
+    return "text"
+
+
+AssertionConfig = Annotated[
+    Union[
+        Annotated[TextAssertionConfig, Tag("text")],
+        Annotated[AttributeAssertionConfig, Tag("attribute")],
+        Annotated[APIAssertionConfig, Tag("api")],
+    ],
+    Discriminator(_assertion_config_kind),
+]
+
+
 class StepBase(BaseModel):
     type: StepType
     selector: str | None = None
@@ -65,8 +103,7 @@ class StepResponse(StepBase):
     created_at: datetime
     assertion_config: AssertionConfig | None = None
 
-    class Config:
-        from_attributes = True
+    model_config = {"from_attributes": True}
 
 
 class StepReorder(BaseModel):
@@ -1,4 +1,5 @@
-from pydantic import BaseModel
+import msgspec
+from pydantic import BaseModel, Field
 from uuid import UUID
 from datetime import datetime
 from app.schemas.step import StepResponse, StepCreate
@@ -12,7 +13,7 @@ class TestBase(BaseModel):
 
 
 class TestCreate(TestBase):
-    steps: list[StepCreate] = []
+    steps: list[StepCreate] = Field(default_factory=list)
 
 
 class TestUpdate(BaseModel):
@@ -26,10 +27,9 @@ class TestVersionResponse(BaseModel):
     id: UUID
     version_number: int
     created_at: datetime
-    steps: list[StepResponse] = []
+    steps: list[StepResponse] = Field(default_factory=list)
 
-    class Config:
-        from_attributes = True
+    model_config = {"from_attributes": True}
 
 
 class CollectionBasic(BaseModel):
@@ -37,8 +37,7 @@ class CollectionBasic(BaseModel):
     name: str
     color: str | None
 
-    class Config:
-        from_attributes = True
+    model_config = {"from_attributes": True}
 
 
 class TestResponse(TestBase):
@@ -48,8 +47,7 @@ class TestResponse(TestBase):
     latest_version: TestVersionResponse | None = None
     collection: CollectionBasic | None = None
 
-    class Config:
-        from_attributes = True
+    model_config = {"from_attributes": True}
 
 
 class TestListResponse(BaseModel):
@@ -63,8 +61,26 @@ class TestListResponse(BaseModel):
     version_count: int
     last_run_status: str | None = None
 
-    class Config:
-        from_attributes = True
+    model_config = {"from_attributes": True}
+
+
+class CollectionBasicRow(msgspec.Struct):
+    id: UUID
+    name: str
+    color: str | None
+
+
+class TestListRow(msgspec.Struct, kw_only=True):
+    """msgspec twin of TestListResponse; the test list is encoded from these."""
+    id: UUID
+    name: str
+    description: str | None
+    target_url: str
+    collection_id: UUID | None = None
+    collection: CollectionBasicRow | None = None
+    created_at: datetime
+    version_count: int
+    last_run_status: str | None = None
 
 
 class VariantChangeResponse(BaseModel):
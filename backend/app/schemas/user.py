@@ -1,7 +1,22 @@
-from pydantic import BaseModel, EmailStr
+import re
+from typing import Annotated
+from pydantic import AfterValidator, BaseModel, EmailStr
 from uuid import UUID
 from datetime import datetime
 
+_EMAIL_SHAPE = re.compile(r"[^@\s]+@[^@\s]+\.[^@\s]+", re.ASCII)
+
+
+def _check_email_shape(value: str) -> str:
+    if not _EMAIL_SHAPE.fullmatch(value):
+        raise ValueError("value is not a valid email address")
+    return value
+
+
+# Login only looks the address up, so a shape check is enough; full
+# validation (EmailStr) happens once, when the account is created.
+LoginEmail = Annotated[str, AfterValidator(_check_email_shape)]
+
 
 class UserCreate(BaseModel):
     email: EmailStr
@@ -10,7 +25,7 @@ class UserCreate(BaseModel):
 
 
 class UserLogin(BaseModel):
-    email: EmailStr
+    email: LoginEmail
     password: str
 
 
@@ -20,8 +35,7 @@ class RoleInfo(BaseModel):
     display_name: str
     permissions: dict
 
-    class Config:
-        from_attributes = True
+    model_config = {"from_attributes": True}
 
 
 class UserResponse(BaseModel):
@@ -34,8 +48,7 @@ class UserResponse(BaseModel):
     role_id: UUID | None = None
     role: RoleInfo | None = None
 
-    class Config:
-        from_attributes = True
+    model_config = {"from_attributes": True}
 
 
 class Token(BaseModel):
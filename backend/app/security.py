@@ -1,32 +1,57 @@
+import asyncio
+import hashlib
+import hmac
+import time
 from datetime import datetime, timedelta
-from typing import Annotated, Callable
+from typing import Annotated
 from uuid import UUID
 
 import bcrypt
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from jose import JWTError, jwt
-from sqlalchemy import select
+import jwt
+from jwt import PyJWTError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 
 from app.config import get_settings
-from app.db.postgres import get_db
+from app.db.postgres import get_db, AsyncSessionLocal
+from app.models.role import Role
 from app.models.user import User
+from app.utils.ttl_cache import TTLCache
 
 settings = get_settings()
 
+# Verified tokens, keyed by a digest so raw JWTs are not kept around:
+# digest -> (user id, exp as a unix timestamp)
+_token_cache: TTLCache[bytes, tuple[UUID, float]] = TTLCache(maxsize=10_000, ttl=60)
+
+# Detached User snapshots (without their role, which has its own cache).
+# Short TTL: other workers only see invalidate_user() through expiry.
+_user_cache: TTLCache[UUID, User] = TTLCache(maxsize=1024, ttl=10)
+
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
 
 ALGORITHM = "HS256"
+_ALGORITHMS = [ALGORITHM]
+_SECRET_BYTES = settings.secret_key.encode()
+
+
+# bcrypt is deliberately slow; run it in a worker thread so it does not block the event loop
 
+async def verify_password(plain_password: str, hashed_password: str) -> bool:
+    return await asyncio.to_thread(bcrypt.checkpw, plain_password.encode(), hashed_password.encode())
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return bcrypt.checkpw(plain_password.encode(), hashed_password.encode())
 
+async def get_password_hash(password: str) -> str:
+    salt = bcrypt.gensalt(rounds=settings.bcrypt_rounds)
+    hashed = await asyncio.to_thread(bcrypt.hashpw, password.encode(), salt)
+    return hashed.decode()
 
-def get_password_hash(password: str) -> str:
-    return bcrypt.hashpw(password.encode(), bcrypt.gensalt()).decode()
+
+def hash_token(token: str) -> bytes:
+    """Keyed SHA-256 digest of an opaque token, for storage and lookup without the plaintext."""
+    return hmac.new(_SECRET_BYTES, token.encode(), hashlib.sha256).digest()
 
 
 def create_access_token(data: dict, expires_delta: timedelta | None = None) -> str:
@@ -36,10 +61,59 @@ def create_access_token(data: dict, expires_delta: timedelta | None = None) -> s
     else:
         expire = datetime.utcnow() + timedelta(minutes=settings.access_token_expire_minutes)
     to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, settings.secret_key, algorithm=ALGORITHM)
+    encoded_jwt = jwt.encode(to_encode, _SECRET_BYTES, algorithm=ALGORITHM)
     return encoded_jwt
 
 
+def _decode_token(token: str) -> UUID | None:
+    """Return the user id a token was issued for, or None if it is invalid or expired."""
+    key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    cached = _token_cache.get(key)
+    if cached is not None:
+        user_id, exp = cached
+        if exp > time.time():
+            return user_id
+        _token_cache.pop(key)
+        return None
+
+    try:
+        payload = jwt.decode(token, _SECRET_BYTES, algorithms=_ALGORITHMS)
+    except PyJWTError:
+        return None
+    sub = payload.get("sub")
+    if sub is None:
+        return None
+    user_id = UUID(sub)
+    _token_cache.set(key, (user_id, float(payload["exp"])))
+    return user_id
+
+
+def invalidate_user(user_id: UUID) -> None:
+    """Drop a cached user after changing their role, status or password."""
+    _user_cache.pop(user_id)
+
+
+async def _load_user(db: AsyncSession, user_id: UUID) -> User | None:
+    """
+    Return the user attached to ``db``, with their role set from the role cache.
+
+    The user row itself is served from a short-lived snapshot when possible;
+    it is merged without a SELECT, so every session gets its own instance.
+    """
+    cached = _user_cache.get(user_id)
+    if cached is None:
+        # Load in a throwaway session so the cached instance is never attached
+        async with AsyncSessionLocal() as loader:
+            cached = await loader.get(User, user_id)
+        if cached is None:
+            return None
+        _user_cache.set(user_id, cached)
+    user = await db.merge(cached, load=False)
+    role = await Role.get_cached(db, user.role_id) if user.role_id else None
+    set_committed_value(user, "role", role)
+    return user
+
+
 async def get_current_user(
     token: Annotated[str, Depends(oauth2_scheme)],
     db: AsyncSession = Depends(get_db)
@@ -49,20 +123,11 @@ async def get_current_user(
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
-    try:
-        payload = jwt.decode(token, settings.secret_key, algorithms=[ALGORITHM])
-        user_id: str = payload.get("sub")
-        if user_id is None:
-            raise credentials_exception
-    except JWTError:
+    user_id = _decode_token(token)
+    if user_id is None:
         raise credentials_exception
 
-    result = await db.execute(
-        select(User)
-        .options(selectinload(User.role))
-        .where(User.id == UUID(user_id))
-    )
-    user = result.scalar_one_or_none()
+    user = await _load_user(db, user_id)
     if user is None:
         raise credentials_exception
     if not user.is_active:
@@ -70,7 +135,29 @@ async def get_current_user(
     return user
 
 
-def require_permission(permission: str) -> Callable:
+class RequirePermission:
+    """Dependency that returns the current user if they hold ``permission``."""
+
+    __slots__ = ("permission",)
+
+    def __init__(self, permission: str):
+        self.permission = permission
+
+    async def __call__(self, current_user: User = Depends(get_current_user)) -> User:
+        if not current_user.role:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="No role assigned"
+            )
+        if not current_user.has_permission(self.permission):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail=f"Permission denied: {self.permission}"
+            )
+        return current_user
+
+
+def require_permission(permission: str) -> RequirePermission:
     """
     Dependency factory that checks if user has a specific permission.
 
@@ -82,24 +169,10 @@ def require_permission(permission: str) -> Callable:
         ):
             ...
     """
-    async def permission_checker(
-        current_user: User = Depends(get_current_user)
-    ) -> User:
-        if not current_user.role:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="No role assigned"
-            )
-        if not current_user.role.permissions.get(permission, False):
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail=f"Permission denied: {permission}"
-            )
-        return current_user
-    return permission_checker
+    return RequirePermission(permission)
 
 
-def require_admin() -> Callable:
+def require_admin() -> RequirePermission:
     """Dependency that requires admin role."""
     return require_permission("view_admin_dashboard")
 
@@ -112,20 +185,11 @@ async def get_user_from_token(token: str, db: AsyncSession) -> User | None:
     if not token:
         return None
 
-    try:
-        payload = jwt.decode(token, settings.secret_key, algorithms=[ALGORITHM])
-        user_id: str = payload.get("sub")
-        if user_id is None:
-            return None
-    except JWTError:
+    user_id = _decode_token(token)
+    if user_id is None:
         return None
 
-    result = await db.execute(
-        select(User)
-        .options(selectinload(User.role))
-        .where(User.id == UUID(user_id))
-    )
-    user = result.scalar_one_or_none()
+    user = await _load_user(db, user_id)
     if user is None or not user.is_active:
         return None
     return user
@@ -1,15 +1,28 @@
 import asyncio
-import base64
+import binascii
 import os
 import re
-from datetime import datetime
+import time
+import traceback
+import weakref
+from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Callable, Awaitable, Optional, Tuple
+from urllib.parse import urlparse
 
 from app.config import get_settings
+from app.utils.ttl_cache import TTLCache
 
 settings = get_settings()
 
-# Patterns to detect assertion requests in natural language
+# Skips to the first verb of the task and commits to it (atomic group). For the
+# patterns below where a lazy (.+?) follows the verb, a match from any later
+# verb implies one from the first, so trying the later ones is wasted work that
+# made long tasks quadratic. Requires single-line input (see
+# _parse_assertion_request).
+_FIRST_VERB = r'^(?>.*?(?=(?:verify|check|assert|ensure|confirm|make sure|validate)\s))'
+
+# Patterns to detect assertion requests in natural language, in priority order
 ASSERTION_PATTERNS = [
     # Text assertions
     (r'(?:verify|check|assert|ensure|confirm|make sure|validate)\s+(?:that\s+)?(?:the\s+)?(?:page\s+)?(?:shows?|displays?|contains?|has)\s+["\'](.+?)["\']', 'assert_text'),
@@ -21,15 +34,154 @@ ASSERTION_PATTERNS = [
     (r'(?:verify|check|assert|ensure|confirm|make sure|validate)\s+(?:that\s+)?(?:i\'?m?\s+)?(?:on|at)\s+(?:the\s+)?["\']?(.+?)["\']?\s*(?:page)?\s*$', 'assert_url'),
     (r'url\s+(?:should\s+)?(?:contain|include|be)\s+["\']?(.+?)["\']?\s*$', 'assert_url'),
     # Visibility assertions
-    (r'(?:verify|check|assert|ensure|confirm|make sure|validate)\s+(?:that\s+)?(?:the\s+)?(.+?)\s+(?:is\s+)?visible', 'assert_visible'),
-    (r'(?:verify|check|assert|ensure|confirm|make sure|validate)\s+(?:that\s+)?(?:the\s+)?(.+?)\s+(?:is\s+)?(?:hidden|not visible|invisible|gone)', 'assert_hidden'),
-    (r'(?:the\s+)?(.+?)\s+(?:should\s+)?(?:be\s+)?(?:visible|shown|displayed)', 'assert_visible'),
-    (r'(?:the\s+)?(.+?)\s+(?:should\s+)?(?:not\s+)?(?:be\s+)?(?:hidden|invisible|gone)', 'assert_hidden'),
+    (_FIRST_VERB + r'(?:verify|check|assert|ensure|confirm|make sure|validate)\s+(?:that\s+)?(?:the\s+)?(.+?)\s+(?:is\s+)?visible', 'assert_visible'),
+    (_FIRST_VERB + r'(?:verify|check|assert|ensure|confirm|make sure|validate)\s+(?:that\s+)?(?:the\s+)?(.+?)\s+(?:is\s+)?(?:hidden|not visible|invisible|gone)', 'assert_hidden'),
+    (r'^(?:the\s+)?(.+?)\s+(?:should\s+)?(?:be\s+)?(?:visible|shown|displayed)', 'assert_visible'),
+    (r'^(?:the\s+)?(.+?)\s+(?:should\s+)?(?:not\s+)?(?:be\s+)?(?:hidden|invisible|gone)', 'assert_hidden'),
     # Value assertions
-    (r'(?:verify|check|assert|ensure|confirm|make sure|validate)\s+(?:that\s+)?(?:the\s+)?(.+?)\s+(?:has\s+)?value\s+["\'](.+?)["\']', 'assert_value'),
-    (r'(?:verify|check|assert|ensure|confirm|make sure|validate)\s+(?:that\s+)?(?:the\s+)?(.+?)\s+(?:equals?|is|contains?)\s+["\'](.+?)["\']', 'assert_value'),
+    (_FIRST_VERB + r'(?:verify|check|assert|ensure|confirm|make sure|validate)\s+(?:that\s+)?(?:the\s+)?(.+?)\s+(?:has\s+)?value\s+["\'](.+?)["\']', 'assert_value'),
+    (_FIRST_VERB + r'(?:verify|check|assert|ensure|confirm|make sure|validate)\s+(?:that\s+)?(?:the\s+)?(.+?)\s+(?:equals?|is|contains?)\s+["\'](.+?)["\']', 'assert_value'),
 ]
 
+
+def _combine_patterns(patterns: list[tuple[str, str]]) -> tuple[re.Pattern, list[tuple[str, int, int]]]:
+    """
+    Fold (pattern, label) pairs into one regex plus (label, first_group, group_count) per branch.
+
+    Each branch is a named group b<i> prefixed with a lazy (?s:.*?) and the
+    result is used with match(), so every branch is anchored at position 0 and
+    tried in list order: the first pattern that would have matched anywhere
+    wins, exactly as when searching them one at a time.
+    """
+    branches = []
+    parts = []
+    next_group = 1
+    for i, (pattern, label) in enumerate(patterns):
+        count = re.compile(pattern).groups
+        branches.append((label, next_group + 1, count))
+        parts.append(f"(?P<b{i}>(?s:.*?)(?:{pattern}))")
+        next_group += 1 + count
+    return re.compile("|".join(parts), re.IGNORECASE), branches
+
+
+ASSERTION_REGEX, ASSERTION_BRANCHES = _combine_patterns(ASSERTION_PATTERNS)
+
+# Every assertion pattern contains at least one of these literals; keep in
+# sync with ASSERTION_PATTERNS
+ASSERTION_TRIGGERS = (
+    'verify', 'check', 'assert', 'ensure', 'confirm', 'make sure', 'validate',
+    'see', 'url', 'visible', 'shown', 'displayed', 'hidden', 'gone',
+)
+
+HOVER_PATTERNS = [re.compile(pattern, re.IGNORECASE) for pattern in [
+    r'hover\s+(?:over\s+)?(?:the\s+)?(?:on\s+)?["\']?(.+?)["\']?\s*$',
+    r'hover\s+(?:over\s+)?(?:the\s+)?(.+?)(?:\s+icon|\s+button|\s+element|\s+menu)?$',
+    r'mouse\s*over\s+(?:the\s+)?["\']?(.+?)["\']?\s*$',
+]]
+
+# Common element descriptions -> Playwright selector builders
+ELEMENT_PATTERNS = [(re.compile(pattern, re.IGNORECASE), selector_fn) for pattern, selector_fn in [
+    # Buttons
+    (r'(?:the\s+)?(\w+)\s+button', lambda m: f"button:has-text('{m.group(1)}')"),
+    (r'button\s+(?:labeled|named|called)\s+["\']?(\w+)["\']?', lambda m: f"button:has-text('{m.group(1)}')"),
+    # Links
+    (r'(?:the\s+)?(\w+)\s+link', lambda m: f"a:has-text('{m.group(1)}')"),
+    # Inputs
+    (r'(?:the\s+)?(\w+)\s+(?:input|field)', lambda m: f"input[name='{m.group(1)}'], input[placeholder*='{m.group(1)}']"),
+    # Generic text
+    (r'["\'](.+?)["\']', lambda m: f"text='{m.group(1)}'"),
+]]
+
+# Text the agent reports having SEEN (not text it entered)
+OBSERVATION_PATTERNS = [re.compile(pattern, re.IGNORECASE) for pattern in [
+    r"(?:displays?|shows?|showing|see|saw|found|appeared?|message|notification|text)\s+['\"]([^'\"]{3,50})['\"]",
+    r"['\"]([^'\"]{3,50})['\"]\s+(?:appeared|displayed|shown|visible|message|notification)",
+]]
+
+# Backslash-escapes quotes in selector attribute values, in one pass
+_SELECTOR_ESCAPE = str.maketrans({"'": "\\'", '"': '\\"'})
+
+
+# Ids generated by UI frameworks change between renders; never select on them
+_GENERATED_ID = re.compile(r'react-|ember-|:r|radix-', re.IGNORECASE)
+
+
+# browser-use action fields we record, in lookup order, and their recorded step type
+STEP_ACTIONS = ('click', 'input', 'navigate', 'wait', 'done', 'scroll', 'hover')
+STEP_TYPE_MAP = {'input': 'fill', 'goto': 'navigate'}
+# Gemini 2.5 Flash pricing for the run cost report
+# Input: $0.15/1M, Output: $0.60/1M (under 128k context)
+INPUT_COST_PER_TOKEN = 0.15 / 1_000_000
+OUTPUT_COST_PER_TOKEN = 0.60 / 1_000_000
+# Element attributes worth printing when a step's selector is found
+LOGGED_ATTRS = frozenset({
+    'id', 'name', 'data-testid', 'placeholder', 'aria-label', 'type', 'role', 'title', 'class', 'text',
+})
+
+
+def _escape_attr(val: str) -> str:
+    if not val:
+        return val
+    return val.translate(_SELECTOR_ESCAPE)
+
+
+def _element_text(elem, attrs: dict) -> str:
+    """Visible text of a DOM node from a browser-use snapshot, stripped and capped at 100 chars."""
+    for method in ('get_all_children_text', 'get_meaningful_text_for_llm'):
+        get_text = getattr(elem, method, None)
+        if get_text:
+            try:
+                text = get_text()
+                if text and (text := str(text).strip()[:100]):
+                    return text
+            except Exception:
+                pass
+
+    # Fallback: check standard properties
+    for text_attr in ('text', 'text_content', 'inner_text', 'textContent'):
+        val = getattr(elem, text_attr, None)
+        if val:
+            if text := str(val).strip()[:100]:
+                return text
+            break
+
+    # Also check if text is in attributes
+    return attrs.get('text', '') or attrs.get('innerText', '')
+
+
+# Attributes the hover action locates its target by, in priority order. Unlike
+# _build_selector this only has to find the element now, not on a later run.
+HOVER_SELECTOR_ATTRS = (
+    ('id', "#{}"),
+    ('data-testid', "[data-testid='{}']"),
+    ('aria-label', "[aria-label='{}']"),
+)
+
+
+def _hover_selector(element) -> str | None:
+    """Selector for a DOM node from a browser-use snapshot, falling back to its xpath."""
+    attrs = getattr(element, 'attributes', None) or {}
+    for attr, template in HOVER_SELECTOR_ATTRS:
+        val = attrs.get(attr)
+        if val:
+            return template.format(_escape_attr(val))
+    xpath = getattr(element, 'xpath', None)
+    return f"xpath={xpath}" if xpath else None
+
+
+@lru_cache(maxsize=None)
+def _browser_use_llm(provider: str, model: str):
+    """Chat model for the browser-use agent, shared across runs so its HTTP connections are reused."""
+    if provider == "openai":
+        from langchain_openai import ChatOpenAI
+        return ChatOpenAI(model=model, api_key=settings.openai_api_key)
+    if provider == "anthropic":
+        from langchain_anthropic import ChatAnthropic
+        return ChatAnthropic(model=model, api_key=settings.anthropic_api_key)
+    from browser_use.llm import ChatGoogle
+    return ChatGoogle(model=model)
+
+
 # Set env var for browser-use
 os.environ["GOOGLE_API_KEY"] = settings.google_api_key
 
@@ -48,10 +200,53 @@ class BrowserAgent:
         self.browser_session = None  # Persistent browser session
         self.running = False
         self.screenshot_task = None
+        # Page dialogs are handled one at a time by _consume_dialogs
+        self._dialog_queue: asyncio.Queue = asyncio.Queue()
+        self._dialog_task = None
+        # One CDP session per page for the hover fallback, dropped with the page
+        self._cdp_sessions: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        # Agent steps waiting for selector extraction in _consume_steps
+        self._step_queue: asyncio.Queue = asyncio.Queue()
+        self._step_task = None
+        # Latest (monotonic time, base64 JPEG); the lock keeps captures from overlapping
+        self._last_screenshot: tuple[float, str] | None = None
+        self._screenshot_lock = asyncio.Lock()
+        # (page url, description) -> selector found by _find_element_by_description
+        self._description_selectors: TTLCache[tuple[str, str], str] = TTLCache(maxsize=128, ttl=30)
         # Auto-assertion tracking
         self.last_url = None
         self.initial_url = None
 
+    async def _get_screenshot(self, max_age: float = 0.0) -> str | None:
+        """
+        Return the current page as base64 JPEG.
+
+        Reuses the last capture if it is younger than ``max_age`` seconds,
+        otherwise takes a new one (which then becomes the cached capture).
+        """
+        async with self._screenshot_lock:
+            if self._last_screenshot and time.monotonic() - self._last_screenshot[0] < max_age:
+                return self._last_screenshot[1]
+            screenshot_data = await self.browser_session.take_screenshot(
+                format='jpeg', quality=settings.browser_use_screenshot_quality
+            )
+            if not screenshot_data:
+                return None
+            if isinstance(screenshot_data, bytes):
+                screenshot_b64 = binascii.b2a_base64(screenshot_data, newline=False).decode('ascii')
+            else:
+                screenshot_b64 = screenshot_data
+            self._last_screenshot = (time.monotonic(), screenshot_b64)
+            return screenshot_b64
+
+    async def _get_cdp_session(self, page):
+        """Return the CDP session for ``page``, opening it on first use."""
+        cdp = self._cdp_sessions.get(page)
+        if cdp is None:
+            cdp = await page.context.new_cdp_session(page)
+            self._cdp_sessions[page] = cdp
+        return cdp
+
     async def _stream_screenshots(self):
         """Stream screenshots from browser-use's browser at regular intervals."""
         print("[Screenshot] Starting screenshot stream, waiting for browser...")
@@ -60,20 +255,33 @@ class BrowserAgent:
         while self.running:
             try:
                 if self.browser_session:
-                    screenshot_data = await self.browser_session.take_screenshot()
-                    if screenshot_data:
-                        if isinstance(screenshot_data, bytes):
-                            screenshot_b64 = base64.b64encode(screenshot_data).decode('utf-8')
-                        else:
-                            screenshot_b64 = screenshot_data
-
-                        if self.on_screenshot:
-                            await self.on_screenshot(screenshot_b64)
+                    # A frame captured for an action moments ago is fresh enough
+                    screenshot_b64 = await self._get_screenshot(max_age=0.25)
+                    if screenshot_b64 and self.on_screenshot:
+                        await self.on_screenshot(screenshot_b64)
                 await asyncio.sleep(0.5)  # ~2 fps
             except Exception as e:
                 print(f"[Screenshot] Error: {e}")
                 await asyncio.sleep(1)
 
+    async def _consume_dialogs(self):
+        """Accept page dialogs (alert/confirm/prompt) and report each as an action."""
+        while True:
+            dialog = await self._dialog_queue.get()
+            print(f"[Agent] Dialog captured: {dialog.type} - {dialog.message}")
+            try:
+                # The page is blocked until the dialog is dismissed, so do that first
+                await dialog.accept()
+                if self.on_action:
+                    await self.on_action({
+                        "type": "dialog",
+                        "value": dialog.message,
+                        "selector": dialog.type,  # alert/confirm/prompt
+                        "timestamp": datetime.now(timezone.utc).isoformat(timespec='milliseconds')
+                    })
+            except Exception as e:
+                print(f"[Agent] Dialog handling failed: {e}")
+
     def _build_selector(self, selector_info: dict, fallback_index: int = None) -> str:
         """Build a Playwright-compatible selector from element info.
 
@@ -82,30 +290,24 @@ class BrowserAgent:
         if not selector_info:
             return f"[data-index='{fallback_index}']" if fallback_index else None
 
-        attrs = selector_info.get('attributes', {})
+        attrs = selector_info.get('attributes') or {}
         tag = selector_info.get('tag', '').lower()
 
-        # Helper to escape selector values
-        def escape_attr(val: str) -> str:
-            if not val:
-                return val
-            return val.replace("'", "\\'").replace('"', '\\"')
-
         # Strategy: Build compound selectors for uniqueness
         # Combine multiple attributes when available
 
         # 1. Unique id is always best (if it doesn't look auto-generated)
         elem_id = attrs.get('id', '')
-        if elem_id and not any(x in elem_id.lower() for x in ['react-', 'ember-', ':r', 'radix-']):
-            return f"#{escape_attr(elem_id)}"
+        if elem_id and not _GENERATED_ID.search(elem_id):
+            return f"#{_escape_attr(elem_id)}"
 
         # 2. name attribute - usually unique for form fields
         name = attrs.get('name', '')
         if name:
             # Combine with tag for specificity
             if tag:
-                return f"{tag}[name='{escape_attr(name)}']"
-            return f"[name='{escape_attr(name)}']"
+                return f"{tag}[name='{_escape_attr(name)}']"
+            return f"[name='{_escape_attr(name)}']"
 
         # 3. Compound selector: data-testid + other distinguishing attributes
         testid = attrs.get('data-testid', '')
@@ -116,25 +318,25 @@ class BrowserAgent:
         if testid:
             # Try to make it unique with additional attributes
             if placeholder:
-                return f"[data-testid='{escape_attr(testid)}'][placeholder='{escape_attr(placeholder)}']"
+                return f"[data-testid='{_escape_attr(testid)}'][placeholder='{_escape_attr(placeholder)}']"
             if aria_label:
-                return f"[data-testid='{escape_attr(testid)}'][aria-label='{escape_attr(aria_label)}']"
+                return f"[data-testid='{_escape_attr(testid)}'][aria-label='{_escape_attr(aria_label)}']"
             if input_type and tag == 'input':
-                return f"input[data-testid='{escape_attr(testid)}'][type='{escape_attr(input_type)}']"
+                return f"input[data-testid='{_escape_attr(testid)}'][type='{_escape_attr(input_type)}']"
             # data-testid alone might match multiple, but it's still useful
-            return f"[data-testid='{escape_attr(testid)}']"
+            return f"[data-testid='{_escape_attr(testid)}']"
 
         # 4. placeholder (for inputs) - often unique
         if placeholder:
             if tag:
-                return f"{tag}[placeholder='{escape_attr(placeholder)}']"
-            return f"[placeholder='{escape_attr(placeholder)}']"
+                return f"{tag}[placeholder='{_escape_attr(placeholder)}']"
+            return f"[placeholder='{_escape_attr(placeholder)}']"
 
         # 5. aria-label (accessibility)
         if aria_label:
             if tag:
-                return f"{tag}[aria-label='{escape_attr(aria_label)}']"
-            return f"[aria-label='{escape_attr(aria_label)}']"
+                return f"{tag}[aria-label='{_escape_attr(aria_label)}']"
+            return f"[aria-label='{_escape_attr(aria_label)}']"
 
         # 6. Text content or title for buttons/links
         text = attrs.get('text', '').strip()
@@ -142,9 +344,9 @@ class BrowserAgent:
         if tag in ['button', 'a', 'span']:
             # For buttons, prefer title attribute (more stable than inner text)
             if title:
-                return f"{tag}[title='{escape_attr(title)}']"
+                return f"{tag}[title='{_escape_attr(title)}']"
             if text:
-                safe_text = escape_attr(text[:50])
+                safe_text = _escape_attr(text[:50])
                 return f"{tag}:has-text('{safe_text}')"
 
         # 7. role - but MUST combine with text/title to avoid generic selectors
@@ -153,12 +355,12 @@ class BrowserAgent:
             # Role alone is TOO GENERIC (e.g., [role='menuitem'] matches all menu items)
             # Must combine with text or title
             if text:
-                safe_text = escape_attr(text[:50])
-                return f"[role='{escape_attr(role)}']:has-text('{safe_text}')"
+                safe_text = _escape_attr(text[:50])
+                return f"[role='{_escape_attr(role)}']:has-text('{safe_text}')"
             if title:
-                return f"[role='{escape_attr(role)}'][title='{escape_attr(title)}']"
+                return f"[role='{_escape_attr(role)}'][title='{_escape_attr(title)}']"
             if aria_label:
-                return f"[role='{escape_attr(role)}'][aria-label='{escape_attr(aria_label)}']"
+                return f"[role='{_escape_attr(role)}'][aria-label='{_escape_attr(aria_label)}']"
             # Don't return role alone - it's too generic, fall through to other options
 
         # 8. type alone - but only for specific input types, not generic button[type='button']
@@ -167,14 +369,14 @@ class BrowserAgent:
             if tag == 'button' and input_type == 'button':
                 # Need text content for buttons
                 if text:
-                    safe_text = escape_attr(text[:50])
+                    safe_text = _escape_attr(text[:50])
                     return f"button:has-text('{safe_text}')"
                 if title:
-                    return f"button[title='{escape_attr(title)}']"
+                    return f"button[title='{_escape_attr(title)}']"
                 # Don't return generic button[type='button'], fall through
             elif tag == 'input':
                 # input[type='text'], input[type='email'] etc. are more specific
-                return f"{tag}[type='{escape_attr(input_type)}']"
+                return f"{tag}[type='{_escape_attr(input_type)}']"
 
         # 9. XPath as fallback - most reliable but verbose
         if selector_info.get('xpath'):
@@ -183,23 +385,105 @@ class BrowserAgent:
         # 10. Index fallback (last resort)
         return f"[data-index='{fallback_index}']" if fallback_index else None
 
+    async def _record_step(self, browser_state, agent_output):
+        """Record the actions of one agent step, with selectors from its DOM snapshot."""
+        if agent_output and hasattr(agent_output, 'action'):
+            for action_model in agent_output.action:
+                if hasattr(action_model, 'root'):
+                    inner = action_model.root
+
+                    action_data = None
+                    action_type = None
+                    for attr in STEP_ACTIONS:
+                        action_data = getattr(inner, attr, None)
+                        if action_data is not None:
+                            action_type = attr
+                            break
+
+                    if action_data and action_type:
+                        index = getattr(action_data, 'index', None)
+                        value = getattr(action_data, 'text', None) or getattr(action_data, 'url', None)
+
+                        # Try to get real selector from browser state
+                        selector_info = {}
+                        if index is not None and browser_state:
+                            try:
+                                # BrowserStateSummary has dom_state: SerializedDOMState
+                                # SerializedDOMState has selector_map: dict[int, EnhancedDOMTreeNode]
+                                dom_state = getattr(browser_state, 'dom_state', None)
+                                if dom_state:
+                                    selector_map = getattr(dom_state, 'selector_map', None)
+                                    if selector_map and index in selector_map:
+                                        elem = selector_map[index]
+                                        # EnhancedDOMTreeNode has:
+                                        # - attributes: dict[str, str]
+                                        # - node_name: str (tag name)
+                                        # - xpath: str property
+                                        attrs = getattr(elem, 'attributes', None) or {}
+                                        if not isinstance(attrs, dict):
+                                            attrs = dict(attrs)
+
+                                        xpath = elem.xpath if hasattr(elem, 'xpath') else None
+                                        tag_name = elem.node_name if hasattr(elem, 'node_name') else None
+
+                                        # Copy before adding text; attrs may be the snapshot node's own dict
+                                        text_content = _element_text(elem, attrs)
+                                        if text_content:
+                                            attrs = {**attrs, 'text': text_content}
+
+                                        selector_info = {
+                                            'xpath': xpath,
+                                            'attributes': attrs,
+                                            'tag': tag_name,
+                                        }
+                                        # Log useful attributes for debugging
+                                        useful_attrs = {k: v for k, v in attrs.items() if k in LOGGED_ATTRS}
+                                        print(f"[Step] Found selector: tag={tag_name}, attrs={useful_attrs}")
+                            except Exception as e:
+                                print(f"[Step] Selector extraction error: {e}")
+                                traceback.print_exc()
+
+                        mapped_type = STEP_TYPE_MAP.get(action_type, action_type)
+
+                        playwright_selector = self._build_selector(selector_info, index)
+
+                        print(f"[Step] Captured: {mapped_type}, selector={playwright_selector}, value={value}")
+                        await self._capture_action_with_selector(
+                            mapped_type,
+                            selector=playwright_selector,
+                            value=value,
+                            selector_info=selector_info
+                        )
+
+    async def _consume_steps(self):
+        """Record agent steps queued by the step callback, in order."""
+        while True:
+            browser_state, agent_output = await self._step_queue.get()
+            try:
+                await self._record_step(browser_state, agent_output)
+            except Exception as e:
+                print(f"[Step] Error: {e}")
+                traceback.print_exc()
+            finally:
+                self._step_queue.task_done()
+
     async def _capture_action(self, action_type: str, selector: str = None, value: str = None):
         """Capture and emit an action."""
         await self._capture_action_with_selector(action_type, selector, value, {})
 
-    async def _capture_action_with_selector(self, action_type: str, selector: str = None, value: str = None, selector_info: dict = None, assertion_config: dict = None):
-        """Capture and emit an action with full selector info."""
+    async def _capture_action_with_selector(self, action_type: str, selector: str = None, value: str = None, selector_info: dict = None, assertion_config: dict = None, screenshot_max_age: float = 0.6):
+        """Capture and emit an action with full selector info.
+
+        The screenshot may be the stream's latest frame if it is younger than
+        ``screenshot_max_age``; pass 0 when the action itself changed the page.
+        """
         if not self.on_action:
             return
 
         screenshot = None
         try:
             if self.browser_session:
-                screenshot_data = await self.browser_session.take_screenshot()
-                if isinstance(screenshot_data, bytes):
-                    screenshot = base64.b64encode(screenshot_data).decode('utf-8')
-                else:
-                    screenshot = screenshot_data
+                screenshot = await self._get_screenshot(max_age=screenshot_max_age)
         except Exception:
             pass
 
@@ -208,7 +492,7 @@ class BrowserAgent:
             "selector": selector,
             "value": value,
             "screenshot": screenshot,
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec='milliseconds'),
             "selector_info": selector_info or {},  # Full info for Playwright generation
             "assertion_config": assertion_config,  # For assertion steps
         }
@@ -219,24 +503,27 @@ class BrowserAgent:
         Parse task for assertion language.
         Returns (assertion_type, target, expected_value) or None if not an assertion.
         """
-        task_lower = task.lower().strip()
-
-        for pattern, assertion_type in ASSERTION_PATTERNS:
-            match = re.search(pattern, task_lower, re.IGNORECASE)
-            if match:
-                groups = match.groups()
-                if len(groups) >= 2:
-                    # For value/attribute assertions: (target_element, expected_value)
-                    target = groups[0].strip()
-                    expected = groups[1].strip()
-                else:
-                    # For text/url/visibility: single capture
-                    target = groups[0].strip()
-                    expected = target
-                print(f"[Agent] Detected assertion: type={assertion_type}, target='{target}', expected='{expected}'")
-                return (assertion_type, target, expected)
-
-        return None
+        # One line, single spaces: keeps the patterns' worst case linear
+        task_lower = " ".join(task.lower().split())
+        if not any(trigger in task_lower for trigger in ASSERTION_TRIGGERS):
+            return None
+
+        match = ASSERTION_REGEX.match(task_lower)
+        if not match:
+            return None
+
+        assertion_type, first_group, group_count = ASSERTION_BRANCHES[int(match.lastgroup[1:])]
+        groups = [match.group(i) for i in range(first_group, first_group + group_count)]
+        if len(groups) >= 2:
+            # For value/attribute assertions: (target_element, expected_value)
+            target = groups[0].strip()
+            expected = groups[1].strip()
+        else:
+            # For text/url/visibility: single capture
+            target = groups[0].strip()
+            expected = target
+        print(f"[Agent] Detected assertion: type={assertion_type}, target='{target}', expected='{expected}'")
+        return (assertion_type, target, expected)
 
     def _parse_hover_request(self, task: str) -> Optional[str]:
         """
@@ -244,15 +531,12 @@ class BrowserAgent:
         Returns the target element description or None if not a hover request.
         """
         task_lower = task.lower().strip()
+        # Every hover pattern contains one of these words; most tasks have neither
+        if 'hover' not in task_lower and 'mouse' not in task_lower:
+            return None
 
-        hover_patterns = [
-            r'hover\s+(?:over\s+)?(?:the\s+)?(?:on\s+)?["\']?(.+?)["\']?\s*$',
-            r'hover\s+(?:over\s+)?(?:the\s+)?(.+?)(?:\s+icon|\s+button|\s+element|\s+menu)?$',
-            r'mouse\s*over\s+(?:the\s+)?["\']?(.+?)["\']?\s*$',
-        ]
-
-        for pattern in hover_patterns:
-            match = re.search(pattern, task_lower, re.IGNORECASE)
+        for pattern in HOVER_PATTERNS:
+            match = pattern.search(task_lower)
             if match:
                 target = match.group(1).strip()
                 print(f"[Agent] Detected hover request for: '{target}'")
@@ -305,12 +589,32 @@ class BrowserAgent:
                 f'[data-testid*="{target}" i]',
                 f'text="{target}"',
             ])
+            # The target can repeat one of the icon selectors above
+            selectors_to_try = list(dict.fromkeys(selectors_to_try))
 
             # Try each selector in main frame first, then iframes
             all_frames = [playwright_page] + list(playwright_page.frames)
 
-            for frame in all_frames:
-                for selector in selectors_to_try:
+            # One query for the union of the CSS selectors tells us whether any
+            # of them can match in a frame; most frames have none, and then only
+            # the text= selectors (another engine) are left to try one by one
+            text_selectors = [s for s in selectors_to_try if s.startswith('text=')]
+            css_union = ", ".join(s for s in selectors_to_try if not s.startswith('text='))
+
+            async def union_count(frame) -> int | None:
+                try:
+                    return await frame.locator(css_union).count()
+                except Exception:
+                    return None  # e.g. a target with quotes breaks the union; try them all
+
+            # Probe every frame at once; frames are still visited in order below
+            union_counts = await asyncio.gather(*(union_count(frame) for frame in all_frames))
+
+            for frame, union_hits in zip(all_frames, union_counts):
+                candidates = text_selectors if union_hits == 0 else selectors_to_try
+
+                # Keep the per-selector loop so the most specific selector wins
+                for selector in candidates:
                     try:
                         locator = frame.locator(selector)
                         count = await locator.count()
@@ -326,7 +630,8 @@ class BrowserAgent:
                                         "hover",
                                         selector=selector,
                                         value=None,
-                                        selector_info={'selector': selector}
+                                        selector_info={'selector': selector},
+                                        screenshot_max_age=0  # show the hover state
                                     )
 
                                     frame_info = f" (in iframe: {frame.url[:50]})" if frame != playwright_page else ""
@@ -355,7 +660,8 @@ class BrowserAgent:
                                             "hover",
                                             selector=f"xpath={elem.xpath}",
                                             value=None,
-                                            selector_info={'xpath': elem.xpath}
+                                            selector_info={'xpath': elem.xpath},
+                                            screenshot_max_age=0  # show the hover state
                                         )
                                         print(f"[Agent] Hovered over element {idx} via xpath")
                                         return {"success": True, "message": f"Hovered over {target}"}
@@ -367,7 +673,6 @@ class BrowserAgent:
             return {"success": False, "message": f"Could not find element to hover: {target}"}
 
         except Exception as e:
-            import traceback
             traceback.print_exc()
             return {"success": False, "message": str(e)}
 
@@ -484,26 +789,18 @@ class BrowserAgent:
     async def _find_element_by_description(self, page, description: str) -> Optional[str]:
         """Try to find an element matching a natural language description."""
         description_lower = description.lower()
+        cache_key = (page.url, description_lower)
+        cached = self._description_selectors.get(cache_key)
+        if cached is not None:
+            return cached
 
-        # Common element patterns
-        patterns = [
-            # Buttons
-            (r'(?:the\s+)?(\w+)\s+button', lambda m: f"button:has-text('{m.group(1)}')"),
-            (r'button\s+(?:labeled|named|called)\s+["\']?(\w+)["\']?', lambda m: f"button:has-text('{m.group(1)}')"),
-            # Links
-            (r'(?:the\s+)?(\w+)\s+link', lambda m: f"a:has-text('{m.group(1)}')"),
-            # Inputs
-            (r'(?:the\s+)?(\w+)\s+(?:input|field)', lambda m: f"input[name='{m.group(1)}'], input[placeholder*='{m.group(1)}']"),
-            # Generic text
-            (r'["\'](.+?)["\']', lambda m: f"text='{m.group(1)}'"),
-        ]
-
-        for pattern, selector_fn in patterns:
-            match = re.search(pattern, description_lower, re.IGNORECASE)
+        for pattern, selector_fn in ELEMENT_PATTERNS:
+            match = pattern.search(description_lower)
             if match:
                 selector = selector_fn(match)
                 try:
                     if await page.locator(selector).count() > 0:
+                        self._description_selectors.set(cache_key, selector)
                         return selector
                 except Exception:
                     pass
@@ -512,6 +809,7 @@ class BrowserAgent:
         try:
             text_selector = f"text='{description}'"
             if await page.locator(text_selector).count() > 0:
+                self._description_selectors.set(cache_key, text_selector)
                 return text_selector
         except Exception:
             pass
@@ -545,7 +843,6 @@ class BrowserAgent:
 
             # 1. URL changed significantly (different path) → add assert_url
             if self.initial_url and current_url:
-                from urllib.parse import urlparse
                 initial_parsed = urlparse(self.initial_url)
                 current_parsed = urlparse(current_url)
 
@@ -570,15 +867,9 @@ class BrowserAgent:
             # NOT: "entered 'X'", "typed 'X'", "credentials 'X'"
 
             # Find text that agent SAW (observation patterns)
-            observation_patterns = [
-                r"(?:displays?|shows?|showing|see|saw|found|appeared?|message|notification|text)\s+['\"]([^'\"]{3,50})['\"]",
-                r"['\"]([^'\"]{3,50})['\"]\s+(?:appeared|displayed|shown|visible|message|notification)",
-            ]
-
-            for pattern in observation_patterns:
-                matches = re.findall(pattern, result_message, re.IGNORECASE)
-                for text in matches:
-                    text = text.strip()
+            for pattern in OBSERVATION_PATTERNS:
+                for match in pattern.finditer(result_message):
+                    text = match.group(1).strip()
                     # Skip if it looks like credentials or input data
                     if '@' in text or text.isdigit() or len(text) < 4:
                         continue
@@ -628,20 +919,16 @@ class BrowserAgent:
             # Select LLM based on config - custom actions only work with OpenAI/Anthropic
             provider = settings.browser_use_llm_provider.lower()
             if provider == "openai" and settings.openai_api_key:
-                from langchain_openai import ChatOpenAI
                 model = settings.browser_use_model or settings.openai_model
-                llm = ChatOpenAI(model=model, api_key=settings.openai_api_key)
                 print(f"[Agent] Using OpenAI: {model} (custom actions supported)")
             elif provider == "anthropic" and settings.anthropic_api_key:
-                from langchain_anthropic import ChatAnthropic
                 model = settings.browser_use_model or settings.anthropic_model
-                llm = ChatAnthropic(model=model, api_key=settings.anthropic_api_key)
                 print(f"[Agent] Using Anthropic: {model} (custom actions supported)")
             else:
-                from browser_use.llm import ChatGoogle
+                provider = "gemini"
                 model = settings.browser_use_model or settings.gemini_model
-                llm = ChatGoogle(model=model)
                 print(f"[Agent] Using Gemini: {model} (WARNING: custom actions like hover may not work)")
+            llm = _browser_use_llm(provider, model)
 
             # Create controller with custom hover action
             controller = Controller()
@@ -657,19 +944,7 @@ class BrowserAgent:
 
                 if dom_state and dom_state.selector_map and index in dom_state.selector_map:
                     element = dom_state.selector_map[index]
-                    # Try to build a selector from element attributes
-                    attrs = element.attributes if hasattr(element, 'attributes') else {}
-
-                    # Priority: id > data-testid > other attributes > xpath
-                    selector = None
-                    if attrs.get('id'):
-                        selector = f"#{attrs['id']}"
-                    elif attrs.get('data-testid'):
-                        selector = f"[data-testid='{attrs['data-testid']}']"
-                    elif attrs.get('aria-label'):
-                        selector = f"[aria-label='{attrs['aria-label']}']"
-                    elif hasattr(element, 'xpath') and element.xpath:
-                        selector = f"xpath={element.xpath}"
+                    selector = _hover_selector(element)
 
                     if selector:
                         await page.locator(selector).hover(timeout=10000)
@@ -677,7 +952,7 @@ class BrowserAgent:
 
                 # Fallback: use CDP to hover by backend node id
                 try:
-                    cdp = await page.context.new_cdp_session(page)
+                    cdp = await self._get_cdp_session(page)
                     # Get the center point of the element
                     box_model = await cdp.send("DOM.getBoxModel", {"backendNodeId": index})
                     if box_model and "model" in box_model:
@@ -688,6 +963,8 @@ class BrowserAgent:
                         await page.mouse.move(center_x, center_y)
                         return f"Hovered over element {index} at ({center_x}, {center_y})"
                 except Exception as e:
+                    # Don't keep reusing a session that may have gone stale
+                    self._cdp_sessions.pop(page, None)
                     print(f"[Hover] CDP fallback failed: {e}")
 
                 return f"Could not hover over element {index}"
@@ -703,18 +980,8 @@ class BrowserAgent:
                 try:
                     page = await self.browser_session.get_current_page()
                     if page:
-                        async def handle_dialog(dialog):
-                            print(f"[Agent] Dialog captured: {dialog.type} - {dialog.message}")
-                            # Report dialog as an action
-                            if self.on_action:
-                                await self.on_action({
-                                    "type": "dialog",
-                                    "value": dialog.message,
-                                    "selector": dialog.type,  # alert/confirm/prompt
-                                    "timestamp": datetime.utcnow().isoformat()
-                                })
-                            await dialog.accept()
-                        page.on('dialog', lambda d: asyncio.create_task(handle_dialog(d)))
+                        page.on('dialog', self._dialog_queue.put_nowait)
+                        self._dialog_task = asyncio.create_task(self._consume_dialogs())
                 except Exception as e:
                     print(f"[Agent] Warning: Could not set up dialog handler: {e}")
 
@@ -730,113 +997,12 @@ class BrowserAgent:
                 # Just the task, no URL needed - we're already on the page
                 full_task = task
 
-            # Callback to capture each step/action with proper selectors
+            # Selector extraction and capture happen in _consume_steps, off the agent loop
+            if self._step_task is None:
+                self._step_task = asyncio.create_task(self._consume_steps())
+
             def on_step(browser_state, agent_output, step_num):
-                try:
-                    if agent_output and hasattr(agent_output, 'action'):
-                        for action_model in agent_output.action:
-                            if hasattr(action_model, 'root'):
-                                inner = action_model.root
-
-                                action_data = None
-                                action_type = None
-                                for attr in ['click', 'input', 'navigate', 'wait', 'done', 'scroll', 'hover']:
-                                    if hasattr(inner, attr):
-                                        action_data = getattr(inner, attr)
-                                        action_type = attr
-                                        break
-
-                                if action_data and action_type:
-                                    index = getattr(action_data, 'index', None)
-                                    value = getattr(action_data, 'text', None) or getattr(action_data, 'url', None)
-
-                                    # Try to get real selector from browser state
-                                    selector_info = {}
-                                    if index is not None and browser_state:
-                                        try:
-                                            # BrowserStateSummary has dom_state: SerializedDOMState
-                                            # SerializedDOMState has selector_map: dict[int, EnhancedDOMTreeNode]
-                                            dom_state = getattr(browser_state, 'dom_state', None)
-                                            if dom_state:
-                                                selector_map = getattr(dom_state, 'selector_map', None)
-                                                if selector_map and index in selector_map:
-                                                    elem = selector_map[index]
-                                                    # EnhancedDOMTreeNode has:
-                                                    # - attributes: dict[str, str]
-                                                    # - node_name: str (tag name)
-                                                    # - xpath: str property
-                                                    attrs = elem.attributes if hasattr(elem, 'attributes') else {}
-                                                    if not isinstance(attrs, dict):
-                                                        attrs = dict(attrs) if attrs else {}
-
-                                                    xpath = elem.xpath if hasattr(elem, 'xpath') else None
-                                                    tag_name = elem.node_name if hasattr(elem, 'node_name') else None
-
-                                                    text_content = None
-
-                                                    if hasattr(elem, 'get_all_children_text'):
-                                                        try:
-                                                            text_content = elem.get_all_children_text()
-                                                            if text_content:
-                                                                text_content = str(text_content).strip()[:100]
-                                                        except:
-                                                            pass
-
-                                                    if not text_content and hasattr(elem, 'get_meaningful_text_for_llm'):
-                                                        try:
-                                                            text_content = elem.get_meaningful_text_for_llm()
-                                                            if text_content:
-                                                                text_content = str(text_content).strip()[:100]
-                                                        except:
-                                                            pass
-
-                                                    # Fallback: check standard properties
-                                                    if not text_content:
-                                                        for text_attr in ['text', 'text_content', 'inner_text', 'textContent']:
-                                                            if hasattr(elem, text_attr):
-                                                                val = getattr(elem, text_attr, None)
-                                                                if val:
-                                                                    text_content = str(val).strip()[:100]
-                                                                    break
-
-                                                    # Also check if text is in attributes
-                                                    if not text_content:
-                                                        text_content = attrs.get('text', '') or attrs.get('innerText', '')
-
-                                                    if text_content:
-                                                        attrs['text'] = text_content
-
-                                                    selector_info = {
-                                                        'xpath': xpath,
-                                                        'attributes': attrs,
-                                                        'tag': tag_name,
-                                                    }
-                                                    # Log useful attributes for debugging
-                                                    useful_attrs = {k: v for k, v in attrs.items()
-                                                                    if k in ['id', 'name', 'data-testid', 'placeholder',
-                                                                             'aria-label', 'type', 'role', 'title', 'class', 'text']}
-                                                    print(f"[Step] Found selector: tag={tag_name}, attrs={useful_attrs}")
-                                        except Exception as e:
-                                            import traceback
-                                            print(f"[Step] Selector extraction error: {e}")
-                                            traceback.print_exc()
-
-                                    type_map = {'input': 'fill', 'goto': 'navigate'}
-                                    mapped_type = type_map.get(action_type, action_type)
-
-                                    playwright_selector = self._build_selector(selector_info, index)
-
-                                    print(f"[Step] Captured: {mapped_type}, selector={playwright_selector}, value={value}")
-                                    asyncio.create_task(self._capture_action_with_selector(
-                                        mapped_type,
-                                        selector=playwright_selector,
-                                        value=value,
-                                        selector_info=selector_info
-                                    ))
-                except Exception as e:
-                    import traceback
-                    print(f"[Step] Error: {e}")
-                    traceback.print_exc()
+                self._step_queue.put_nowait((browser_state, agent_output))
 
             self.agent = Agent(
                 task=full_task,
@@ -866,9 +1032,10 @@ class BrowserAgent:
             try:
                 result = await self.agent.run()
                 print(f"[Agent] agent.run() completed, result type: {type(result)}")
+                # Let the last steps land before assertions are added after them
+                await self._step_queue.join()
             except Exception as run_error:
                 print(f"[Agent] agent.run() raised exception: {run_error}")
-                import traceback
                 traceback.print_exc()
                 raise
 
@@ -876,11 +1043,9 @@ class BrowserAgent:
             result_message = final_result if final_result else ""
             print(f"[Agent] final_result: {final_result[:100] if final_result else 'None'}...")
 
-            # Log token usage for cost analysis
+            # Log token usage for cost analysis, as one write
             # result is AgentHistoryList which has .usage directly
-            print("\n" + "="*60)
-            print("[TOKEN USAGE] End-to-end flow cost breakdown:")
-            print("="*60)
+            report = ["", "="*60, "[TOKEN USAGE] End-to-end flow cost breakdown:", "="*60]
 
             usage = getattr(result, 'usage', None)
 
@@ -892,33 +1057,34 @@ class BrowserAgent:
                 total_tokens = getattr(usage, 'total_tokens', 0) or (input_tokens + output_tokens)
                 num_invocations = getattr(usage, 'entry_count', 0) or 0
 
-                # Gemini 2.5 Flash pricing (per 1M tokens)
-                # Input: $0.15/1M, Output: $0.60/1M (under 128k context)
-                input_cost = (input_tokens / 1_000_000) * 0.15
-                output_cost = (output_tokens / 1_000_000) * 0.60
+                input_cost = input_tokens * INPUT_COST_PER_TOKEN
+                output_cost = output_tokens * OUTPUT_COST_PER_TOKEN
                 total_cost = input_cost + output_cost
 
-                print(f"  Input tokens:    {input_tokens:,}")
-                print(f"  Output tokens:   {output_tokens:,}")
-                print(f"  Cached tokens:   {cached_tokens:,}")
-                print(f"  Total tokens:    {total_tokens:,}")
-                print(f"  LLM calls:       {num_invocations}")
-                print("-"*40)
-                print(f"  Input cost:      ${input_cost:.4f}")
-                print(f"  Output cost:     ${output_cost:.4f}")
-                print(f"  TOTAL COST:      ${total_cost:.4f}")
+                report += [
+                    f"  Input tokens:    {input_tokens:,}",
+                    f"  Output tokens:   {output_tokens:,}",
+                    f"  Cached tokens:   {cached_tokens:,}",
+                    f"  Total tokens:    {total_tokens:,}",
+                    f"  LLM calls:       {num_invocations}",
+                    "-"*40,
+                    f"  Input cost:      ${input_cost:.4f}",
+                    f"  Output cost:     ${output_cost:.4f}",
+                    f"  TOTAL COST:      ${total_cost:.4f}",
+                ]
                 if num_invocations > 0:
-                    print(f"  Avg cost/call:   ${total_cost/num_invocations:.4f}")
+                    report.append(f"  Avg cost/call:   ${total_cost/num_invocations:.4f}")
             else:
-                print("  No usage data in result")
+                report.append("  No usage data in result")
                 # Try to get from agent's token_cost_service
                 if self.agent and hasattr(self.agent, 'token_cost_service'):
                     try:
                         usage_summary = await self.agent.token_cost_service.get_usage_summary()
-                        print(f"  From token_cost_service: {usage_summary}")
+                        report.append(f"  From token_cost_service: {usage_summary}")
                     except Exception as e:
-                        print(f"  Could not get from token_cost_service: {e}")
-            print("="*60 + "\n")
+                        report.append(f"  Could not get from token_cost_service: {e}")
+            report += ["="*60, ""]
+            print("\n".join(report))
 
             # Auto-add assertions based on success signals
             print("[Agent] Calling _auto_add_assertions...")
@@ -938,7 +1104,6 @@ class BrowserAgent:
             }
 
         except Exception as e:
-            import traceback
             traceback.print_exc()
             return {
                 "success": False,
@@ -956,6 +1121,22 @@ class BrowserAgent:
             except asyncio.CancelledError:
                 pass
 
+        if self._dialog_task:
+            self._dialog_task.cancel()
+            try:
+                await self._dialog_task
+            except asyncio.CancelledError:
+                pass
+            self._dialog_task = None
+
+        if self._step_task:
+            self._step_task.cancel()
+            try:
+                await self._step_task
+            except asyncio.CancelledError:
+                pass
+            self._step_task = None
+
         if self.browser_session:
             try:
                 await self.browser_session.stop()
@@ -1,13 +1,51 @@
 """AI-powered API test generation using LLM."""
 
+import asyncio
 import json
+import re
 import uuid
 from typing import Any
 
+import orjson
+
 from app.services.llm_providers import get_llm_provider
 from app.config import get_settings
 
 
+_DECODER = json.JSONDecoder()
+_JSON_START = re.compile(r"[\[{]")
+# A JSON string or a bracket, for skipping over a value that fails to decode
+_JSON_TOKEN = re.compile(r'"(?:[^"\\]|\\.)*"|[\[\]{}]')
+
+
+def _as_tests(value: Any) -> list[dict]:
+    """The candidate test objects in a decoded JSON value."""
+    if isinstance(value, dict):
+        if "name" not in value:
+            # A wrapper such as {"tests": [...]}
+            for inner in value.values():
+                if isinstance(inner, list) and (tests := [item for item in inner if isinstance(item, dict)]):
+                    return tests
+        return [value]
+    if isinstance(value, list):
+        return [item for item in value if isinstance(item, dict)]
+    return []
+
+
+def _skip_value(content: str, start: int) -> int | None:
+    """Index just past the bracket that closes the one at ``start``, or None if it never closes."""
+    depth = 0
+    for token in _JSON_TOKEN.finditer(content, start):
+        char = token.group()
+        if char in ("[", "{"):
+            depth += 1
+        elif char in ("]", "}"):
+            depth -= 1
+            if not depth:
+                return token.end()
+    return None
+
+
 class APITestGenerator:
     """
     Generate API tests using LLM.
@@ -188,35 +226,65 @@ Output ONLY a JSON array of test objects."""
         response = await self.llm.ainvoke(prompt)
         return self._parse_response(response.content)
 
-    def _parse_response(self, content: str) -> list[dict]:
-        """Parse LLM response to extract JSON."""
-        content = content.strip()
+    async def generate_negative_tests_batch(
+        self,
+        positive_tests: list[dict],
+        max_tests: int = 3,
+        concurrency: int | None = None,
+    ) -> list[list[dict] | BaseException]:
+        """
+        Generate negative test cases for several positive tests concurrently.
 
-        # Try to find JSON array in response
-        start_idx = content.find("[")
-        end_idx = content.rfind("]")
+        Args:
+            positive_tests: Working positive test cases
+            max_tests: Maximum negative tests to generate per positive test
+            concurrency: Parallel LLM calls (defaults to settings.llm_max_concurrency)
 
-        if start_idx != -1 and end_idx != -1:
-            json_str = content[start_idx:end_idx + 1]
-            try:
-                result = json.loads(json_str)
-                if isinstance(result, list):
-                    return self._normalize_tests(result)
-            except json.JSONDecodeError:
-                pass
+        Returns:
+            One entry per positive test, in order: its negative tests, or the
+            exception raised while generating them
+        """
+        semaphore = asyncio.Semaphore(concurrency or get_settings().llm_max_concurrency)
+
+        async def generate(test: dict) -> list[dict]:
+            async with semaphore:
+                return await self.generate_negative_tests(test, max_tests)
 
-        # Try to find single JSON object
-        start_idx = content.find("{")
-        end_idx = content.rfind("}")
+        return await asyncio.gather(
+            *(generate(test) for test in positive_tests),
+            return_exceptions=True,
+        )
 
-        if start_idx != -1 and end_idx != -1:
-            json_str = content[start_idx:end_idx + 1]
+    def _parse_response(self, content: str) -> list[dict]:
+        """Parse LLM response to extract JSON.
+
+        Decodes the first JSON value in the text that holds tests: an
+        object, an array of objects, or an object wrapping such an array
+        (``{"tests": [...]}``). Prose, markdown fences and bracketed asides
+        around it are skipped; truncated JSON yields no tests.
+        """
+        # Fast path: the response is just the JSON we asked for
+        try:
+            tests = self._normalize_tests(_as_tests(orjson.loads(content)))
+        except orjson.JSONDecodeError:
+            tests = []
+        if tests:
+            return tests
+
+        pos = 0
+        while match := _JSON_START.search(content, pos):
             try:
-                result = json.loads(json_str)
-                if isinstance(result, dict):
-                    return self._normalize_tests([result])
+                result, pos = _DECODER.raw_decode(content, match.start())
             except json.JSONDecodeError:
-                pass
+                # Skip the whole broken value rather than decode pieces of it;
+                # if it never closes (truncated output) there is nothing usable
+                pos = _skip_value(content, match.start())
+                if pos is None:
+                    return []
+                continue
+            tests = self._normalize_tests(_as_tests(result))
+            if tests:
+                return tests
 
         return []
 
@@ -1,12 +1,17 @@
 """Background scheduler that runs scheduled tests."""
 
 import asyncio
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
+from functools import lru_cache
 from uuid import UUID
+from croniter import croniter
 from sqlalchemy import select
 from sqlalchemy.orm import selectinload
 
 from app.db.postgres import AsyncSessionLocal
+from app.db.partitions import ensure_request_result_partitions
+from app.db.views import refresh_collection_daily_stats
+from app.models.response_body import ResponseBody
 from app.models.schedule import Schedule
 from app.models.schedule_run import ScheduleRun
 from app.models.test import Test, TestVersion, Step, Collection
@@ -14,6 +19,12 @@ from app.models.run import Run
 from app.services.test_runner import PlaywrightTestRunner
 
 
+@lru_cache(maxsize=4096)
+def _compile_cron(expression: str) -> croniter:
+    """Parse a cron expression once; schedules sharing an expression share the result."""
+    return croniter(expression)
+
+
 def calculate_next_run(schedule: Schedule) -> datetime:
     """Calculate the next run time based on schedule settings."""
     now = datetime.utcnow()
@@ -36,7 +47,7 @@ def calculate_next_run(schedule: Schedule) -> datetime:
         return next_run
 
     elif schedule.frequency == 'weekly':
-        run_days = [int(d) for d in (schedule.run_on_days or "1,2,3,4,5").split(",")]
+        run_days = {d % 7 for d in (schedule.run_on_days or [1, 2, 3, 4, 5])}
         next_run = now.replace(
             hour=schedule.run_at_hour or 9,
             minute=schedule.run_at_minute or 0,
@@ -46,12 +57,16 @@ def calculate_next_run(schedule: Schedule) -> datetime:
 
         for i in range(8):
             check_date = next_run + timedelta(days=i)
-            if check_date.weekday() in [d % 7 for d in run_days]:
+            if check_date.weekday() in run_days:
                 if check_date > now:
                     return check_date
 
         return next_run + timedelta(days=1)
 
+    elif schedule.frequency == 'custom' and schedule.cron_expression:
+        # start_time makes the shared iterator stateless across calls
+        return _compile_cron(schedule.cron_expression).get_next(datetime, start_time=now)
+
     else:
         next_run = now.replace(hour=9, minute=0, second=0, microsecond=0)
         if next_run <= now:
@@ -241,6 +256,9 @@ async def check_and_run_schedules():
             .where(Schedule.next_run_at <= now)
         )
         due_schedules = result.scalars().all()
+        # End the read transaction so the connection goes back to the pool
+        # while the runs below check out their own
+        await db.commit()
 
         for schedule in due_schedules:
             print(f"[Scheduler] Schedule '{schedule.name}' is due to run")
@@ -265,10 +283,16 @@ async def check_and_run_schedules():
                 schedule.next_run_at = calculate_next_run(schedule)
                 await db.commit()
 
+            # Done with this schedule; don't keep it in the identity map
+            db.expunge(schedule)
+
 
 class BackgroundScheduler:
     """Background scheduler that periodically checks and runs due schedules."""
 
+    # How often mv_collection_daily_stats is recomputed
+    STATS_REFRESH_INTERVAL = timedelta(minutes=15)
+
     def __init__(self, check_interval: int = 60):
         """
         Initialize the scheduler.
@@ -279,6 +303,8 @@ class BackgroundScheduler:
         self.check_interval = check_interval
         self.running = False
         self.task = None
+        self._maintenance_ran_on: date | None = None
+        self._stats_refreshed_at: datetime | None = None
 
     async def _run_loop(self):
         """Main scheduler loop."""
@@ -290,6 +316,30 @@ class BackgroundScheduler:
             except Exception as e:
                 print(f"[Scheduler] Error in scheduler loop: {e}")
 
+            # Daily maintenance: create upcoming api_request_results partitions,
+            # drop response bodies no result references any more
+            today = date.today()
+            if self._maintenance_ran_on != today:
+                try:
+                    await ensure_request_result_partitions()
+                    async with AsyncSessionLocal() as db:
+                        pruned = await ResponseBody.delete_orphans(db)
+                        await db.commit()
+                    if pruned:
+                        print(f"[Scheduler] Pruned {pruned} orphaned response bodies")
+                    self._maintenance_ran_on = today
+                except Exception as e:
+                    print(f"[Scheduler] Error in daily maintenance: {e}")
+
+            # Refresh dashboard rollups
+            now = datetime.utcnow()
+            if not self._stats_refreshed_at or now - self._stats_refreshed_at >= self.STATS_REFRESH_INTERVAL:
+                try:
+                    await refresh_collection_daily_stats()
+                    self._stats_refreshed_at = now
+                except Exception as e:
+                    print(f"[Scheduler] Error refreshing daily stats: {e}")
+
             await asyncio.sleep(self.check_interval)
 
     async def start(self):
@@ -395,7 +395,7 @@ Return ONLY valid JSON, no markdown or explanation."""
             pass
         return None
 
-    def _compute_state_hash(self, url: str, dom_markers: list) -> str:
+    def _compute_state_hash(self, url: str, dom_markers: list) -> bytes:
         """Compute a hash representing the current page state."""
         # Combine URL path with key DOM markers for state identification
         parsed = urlparse(url)
@@ -403,7 +403,7 @@ Return ONLY valid JSON, no markdown or explanation."""
         path = re.sub(r'/\d+(?=/|$)', '/:id', parsed.path.rstrip('/'))
 
         content = f"{parsed.netloc}{path}:{','.join(sorted(dom_markers[:10]))}"
-        return hashlib.sha256(content.encode()).hexdigest()[:16]
+        return hashlib.sha256(content.encode()).digest()
 
     def _detect_pattern(self, url: str, page_type: str) -> Optional[str]:
         """Detect if this page is part of a pattern (e.g., product/:id)."""
@@ -583,7 +583,7 @@ Return ONLY valid JSON, no markdown or explanation."""
     async def _save_page(self, page_data: dict) -> str:
         """Save a discovered page to the database."""
         async with AsyncSessionLocal() as db:
-            page = DiscoveredPage(
+            page_id = await DiscoveredPage.upsert(db, dict(
                 project_id=self.project_id,
                 url=page_data["url"],
                 path=page_data["path"],
@@ -607,11 +607,9 @@ Return ONLY valid JSON, no markdown or explanation."""
                 is_feature=page_data.get("is_feature", False),
                 feature_name=page_data.get("feature_name"),
                 feature_description=page_data.get("feature_description"),
-            )
-            db.add(page)
+            ))
             await db.commit()
-            await db.refresh(page)
-            return str(page.id)
+            return str(page_id)
 
     async def _save_connection(self, source_id: str, target_id: str, action: dict):
         """Save a connection between pages."""
@@ -917,6 +915,7 @@ Return ONLY valid JSON, no markdown or explanation."""
                 await self.on_page_discovered({
                     "id": page_id,
                     **page_data,
+                    "state_hash": state_hash.hex(),
                 })
 
             await self._emit_activity(f"Discovered: {title or url}", "success")
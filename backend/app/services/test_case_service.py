@@ -5,9 +5,14 @@ from datetime import datetime
 from typing import Optional
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import undefer_group, raiseload
 
 from app.models.test_case import TestCase, TestRun
 from app.models.project import Project, DiscoveredPage
+from app.utils.ids import uuid7
+
+# Deferred DiscoveredPage columns read by _build_instruction
+PAGE_DETAIL_OPTIONS = [undefer_group("analysis"), undefer_group("content")]
 
 
 class TestCaseService:
@@ -24,7 +29,7 @@ class TestCaseService:
         test_type: str = "positive",
     ) -> TestCase:
         """Create a test case from a suggested scenario."""
-        page = await self.db.get(DiscoveredPage, page_id)
+        page = await self.db.get(DiscoveredPage, page_id, options=PAGE_DETAIL_OPTIONS)
         if not page:
             raise ValueError(f"Page {page_id} not found")
 
@@ -32,7 +37,7 @@ class TestCaseService:
         instruction = await self._build_instruction(page, scenario, project)
 
         test_case = TestCase(
-            id=uuid.uuid4(),
+            id=uuid7(),
             project_id=project_id,
             page_id=page_id,
             name=scenario[:100],  # Truncate for name
@@ -59,7 +64,7 @@ class TestCaseService:
     ) -> TestCase:
         """Create a custom test case from user-provided instruction."""
         test_case = TestCase(
-            id=uuid.uuid4(),
+            id=uuid7(),
             project_id=project_id,
             page_id=page_id,
             name=name,
@@ -82,7 +87,7 @@ class TestCaseService:
         page_id: uuid.UUID,
     ) -> list[TestCase]:
         """Create test cases for all suggested scenarios on a page."""
-        page = await self.db.get(DiscoveredPage, page_id)
+        page = await self.db.get(DiscoveredPage, page_id, options=PAGE_DETAIL_OPTIONS)
         if not page:
             raise ValueError(f"Page {page_id} not found")
 
@@ -131,6 +136,7 @@ class TestCaseService:
         result = await self.db.execute(
             select(TestCase)
             .where(TestCase.project_id == project_id)
+            .options(raiseload("*"))
             .order_by(TestCase.created_at.desc())
         )
         return list(result.scalars().all())
@@ -143,6 +149,7 @@ class TestCaseService:
         result = await self.db.execute(
             select(TestCase)
             .where(TestCase.page_id == page_id)
+            .options(raiseload("*"))
             .order_by(TestCase.created_at.desc())
         )
         return list(result.scalars().all())
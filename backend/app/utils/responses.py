@@ -0,0 +1,20 @@
+"""Fast JSON responses for read-only list endpoints."""
+
+import msgspec
+from fastapi import Response
+
+_encoder = msgspec.json.Encoder()
+
+
+def json_response(content: bytes | str) -> Response:
+    """Wrap already-encoded JSON.
+
+    The route keeps its Pydantic ``response_model`` for the OpenAPI schema;
+    returning a Response bypasses its validation and serialization.
+    """
+    return Response(content=content, media_type="application/json")
+
+
+def struct_response(rows: list[msgspec.Struct]) -> Response:
+    """Encode msgspec Structs straight to a JSON response, skipping Pydantic."""
+    return json_response(_encoder.encode(rows))
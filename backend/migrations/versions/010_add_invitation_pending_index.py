@@ -0,0 +1,29 @@
+"""add_invitation_pending_index
+
+Revision ID: 010_add_invitation_pending_index
+Revises: 009_add_api_testing
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision = '010_add_invitation_pending_index'
+down_revision = '009_add_api_testing'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Partial index: only pending invitations are ever looked up by validity
+    op.create_index(
+        'ix_inv_pending_active',
+        'invitations',
+        ['expires_at'],
+        postgresql_where=sa.text("status = 'pending'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_inv_pending_active', table_name='invitations')
@@ -0,0 +1,45 @@
+"""hash_invitation_tokens
+
+Revision ID: 011_hash_invitation_tokens
+Revises: 010_add_invitation_pending_index
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from app.security import hash_token
+
+# revision identifiers
+revision = '011_hash_invitation_tokens'
+down_revision = '010_add_invitation_pending_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('invitations', sa.Column('token_hash', postgresql.BYTEA(), nullable=True))
+
+    # Backfill digests of the existing plaintext tokens so outstanding links keep working
+    conn = op.get_bind()
+    rows = conn.execute(sa.text("SELECT id, token FROM invitations")).fetchall()
+    for row in rows:
+        conn.execute(
+            sa.text("UPDATE invitations SET token_hash = :token_hash WHERE id = :id"),
+            {"token_hash": hash_token(row.token), "id": row.id},
+        )
+
+    op.alter_column('invitations', 'token_hash', nullable=False)
+    op.create_index('ix_invitations_token_hash', 'invitations', ['token_hash'], unique=True)
+    op.drop_column('invitations', 'token')
+
+
+def downgrade() -> None:
+    # Plaintext tokens cannot be recovered; outstanding links are invalidated
+    op.add_column('invitations', sa.Column('token', sa.String(64), nullable=True))
+    op.execute("UPDATE invitations SET token = encode(token_hash, 'hex')")
+    op.alter_column('invitations', 'token', nullable=False)
+    op.create_index('ix_invitations_token', 'invitations', ['token'], unique=True)
+    op.drop_index('ix_invitations_token_hash', table_name='invitations')
+    op.drop_column('invitations', 'token_hash')
@@ -0,0 +1,35 @@
+"""add_counter_triggers
+
+Revision ID: 012_add_counter_triggers
+Revises: 011_hash_invitation_tokens
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+
+from app.db.triggers import (
+    ARR_BUMP_COUNTERS_FUNCTION,
+    ARR_BUMP_COUNTERS_TRIGGER,
+    PAGE_BUMP_COUNTERS_FUNCTION,
+    PAGE_BUMP_COUNTERS_TRIGGER,
+)
+
+# revision identifiers
+revision = '012_add_counter_triggers'
+down_revision = '011_hash_invitation_tokens'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(ARR_BUMP_COUNTERS_FUNCTION)
+    op.execute(ARR_BUMP_COUNTERS_TRIGGER)
+    op.execute(PAGE_BUMP_COUNTERS_FUNCTION)
+    op.execute(PAGE_BUMP_COUNTERS_TRIGGER)
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS trg_page_bump_counters ON discovered_pages")
+    op.execute("DROP FUNCTION IF EXISTS page_bump_counters()")
+    op.execute("DROP TRIGGER IF EXISTS trg_arr_bump_counters ON api_request_results")
+    op.execute("DROP FUNCTION IF EXISTS arr_bump_counters()")
@@ -0,0 +1,90 @@
+"""partition_api_request_results
+
+Revision ID: 013_partition_arr
+Revises: 012_add_counter_triggers
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.db.partitions import ENSURE_ARR_PARTITION_FUNCTION, ARR_DEFAULT_PARTITION
+from app.db.triggers import ARR_BUMP_COUNTERS_TRIGGER
+
+# revision identifiers
+revision = '013_partition_arr'
+down_revision = '012_add_counter_triggers'
+branch_labels = None
+depends_on = None
+
+COLUMNS = """
+    id, test_run_id, request_id, execution_order, status,
+    resolved_url, resolved_method, resolved_headers, resolved_body,
+    response_status, response_headers, response_body, response_size_bytes,
+    started_at, finished_at, duration_ms, timing_breakdown, assertion_results,
+    extracted_variables, error_message, error_type,
+    pre_script_executed, pre_script_error, post_script_executed, post_script_error,
+    created_at
+"""
+
+
+def upgrade() -> None:
+    op.rename_table('api_request_results', 'api_request_results_old')
+    op.execute("ALTER INDEX api_request_results_pkey RENAME TO api_request_results_old_pkey")
+    op.execute("ALTER INDEX ix_api_request_results_test_run_id RENAME TO ix_api_request_results_old_test_run_id")
+    op.execute("ALTER INDEX ix_api_request_results_request_id RENAME TO ix_api_request_results_old_request_id")
+
+    # Parent table: (id, created_at) primary key since the partition key must be included
+    op.execute("""
+        CREATE TABLE api_request_results (
+            LIKE api_request_results_old INCLUDING DEFAULTS,
+            PRIMARY KEY (id, created_at)
+        ) PARTITION BY RANGE (created_at)
+    """)
+    op.execute(ENSURE_ARR_PARTITION_FUNCTION)
+    op.execute(ARR_DEFAULT_PARTITION)
+
+    # Monthly partitions covering existing data plus the next two months
+    op.execute("""
+        SELECT ensure_api_request_results_partition(m::date)
+        FROM generate_series(
+            date_trunc('month', LEAST(COALESCE((SELECT min(created_at) FROM api_request_results_old), now()), now())),
+            date_trunc('month', now()) + interval '2 months',
+            interval '1 month'
+        ) AS m
+    """)
+
+    # Copy before the counter trigger exists so run totals are not double-counted
+    op.execute(f"INSERT INTO api_request_results ({COLUMNS}) SELECT {COLUMNS} FROM api_request_results_old")
+    op.drop_table('api_request_results_old')
+
+    # Indexes on the parent are created on every partition
+    op.create_index('ix_api_request_results_test_run_id', 'api_request_results', ['test_run_id'])
+    op.create_index('ix_api_request_results_request_id', 'api_request_results', ['request_id'])
+    op.create_foreign_key('fk_api_request_results_test_run_id', 'api_request_results', 'api_test_runs', ['test_run_id'], ['id'], ondelete='CASCADE')
+    op.create_foreign_key('fk_api_request_results_request_id', 'api_request_results', 'api_requests', ['request_id'], ['id'], ondelete='CASCADE')
+
+    op.execute(ARR_BUMP_COUNTERS_TRIGGER)
+
+
+def downgrade() -> None:
+    op.rename_table('api_request_results', 'api_request_results_partitioned')
+    op.execute("ALTER INDEX api_request_results_pkey RENAME TO api_request_results_partitioned_pkey")
+    op.execute("ALTER INDEX ix_api_request_results_test_run_id RENAME TO ix_api_request_results_partitioned_test_run_id")
+    op.execute("ALTER INDEX ix_api_request_results_request_id RENAME TO ix_api_request_results_partitioned_request_id")
+    op.execute("""
+        CREATE TABLE api_request_results (
+            LIKE api_request_results_partitioned INCLUDING DEFAULTS,
+            PRIMARY KEY (id)
+        )
+    """)
+    op.execute(f"INSERT INTO api_request_results ({COLUMNS}) SELECT {COLUMNS} FROM api_request_results_partitioned")
+    op.drop_table('api_request_results_partitioned')
+    op.execute("DROP FUNCTION IF EXISTS ensure_api_request_results_partition(date)")
+
+    op.create_index('ix_api_request_results_test_run_id', 'api_request_results', ['test_run_id'])
+    op.create_index('ix_api_request_results_request_id', 'api_request_results', ['request_id'])
+    op.create_foreign_key('fk_api_request_results_test_run_id', 'api_request_results', 'api_test_runs', ['test_run_id'], ['id'], ondelete='CASCADE')
+    op.create_foreign_key('fk_api_request_results_request_id', 'api_request_results', 'api_requests', ['request_id'], ['id'], ondelete='CASCADE')
+
+    op.execute(ARR_BUMP_COUNTERS_TRIGGER)
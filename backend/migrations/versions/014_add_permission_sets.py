@@ -0,0 +1,71 @@
+"""add_permission_sets
+
+Revision ID: 014_add_permission_sets
+Revises: 013_partition_arr
+Create Date: 2026-10-16
+"""
+
+import hashlib
+import json
+import uuid
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers
+revision = '014_add_permission_sets'
+down_revision = '013_partition_arr'
+branch_labels = None
+depends_on = None
+
+
+def _digest(perms: dict) -> bytes:
+    # Frozen copy of PermissionSet.digest as of this revision: SHA-256 of the
+    # canonical JSON encoding, the key the app looks permission sets up by
+    canonical = json.dumps(perms, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode()).digest()
+
+
+def upgrade() -> None:
+    op.create_table(
+        'permission_sets',
+        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column('sha', postgresql.BYTEA(), nullable=False, unique=True),
+        sa.Column('perms', postgresql.JSONB(), nullable=False, server_default='{}'),
+    )
+    op.add_column('roles', sa.Column('permission_set_id', postgresql.UUID(as_uuid=True), nullable=True))
+
+    # Intern each distinct permissions dict once and point roles at it
+    conn = op.get_bind()
+    set_ids: dict[bytes, uuid.UUID] = {}
+    for role in conn.execute(sa.text("SELECT id, permissions FROM roles")).fetchall():
+        sha = _digest(role.permissions or {})
+        if sha not in set_ids:
+            set_ids[sha] = uuid.uuid4()
+            conn.execute(
+                sa.text("INSERT INTO permission_sets (id, sha, perms) VALUES (:id, :sha, :perms)")
+                .bindparams(sa.bindparam('perms', type_=postgresql.JSONB())),
+                {"id": set_ids[sha], "sha": sha, "perms": role.permissions or {}},
+            )
+        conn.execute(
+            sa.text("UPDATE roles SET permission_set_id = :set_id WHERE id = :id"),
+            {"set_id": set_ids[sha], "id": role.id},
+        )
+
+    op.alter_column('roles', 'permission_set_id', nullable=False)
+    op.create_index('ix_roles_permission_set_id', 'roles', ['permission_set_id'])
+    op.create_foreign_key('fk_roles_permission_set_id', 'roles', 'permission_sets', ['permission_set_id'], ['id'])
+    op.drop_column('roles', 'permissions')
+
+
+def downgrade() -> None:
+    op.add_column('roles', sa.Column('permissions', postgresql.JSONB(), nullable=False, server_default='{}'))
+    op.execute(
+        "UPDATE roles SET permissions = permission_sets.perms "
+        "FROM permission_sets WHERE roles.permission_set_id = permission_sets.id"
+    )
+    op.drop_constraint('fk_roles_permission_set_id', 'roles', type_='foreignkey')
+    op.drop_index('ix_roles_permission_set_id', table_name='roles')
+    op.drop_column('roles', 'permission_set_id')
+    op.drop_table('permission_sets')
@@ -0,0 +1,43 @@
+"""binary_hash_columns
+
+Revision ID: 015_binary_hash_columns
+Revises: 014_add_permission_sets
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers
+revision = '015_binary_hash_columns'
+down_revision = '014_add_permission_sets'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Hex text -> raw bytes; ALTER TYPE rebuilds ix_discovered_pages_state_hash
+    op.alter_column(
+        'discovered_pages', 'state_hash',
+        type_=postgresql.BYTEA(),
+        postgresql_using="decode(state_hash, 'hex')",
+    )
+    op.alter_column(
+        'api_test_runs', 'karate_job_id',
+        type_=postgresql.UUID(as_uuid=True),
+        postgresql_using='karate_job_id::uuid',
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        'api_test_runs', 'karate_job_id',
+        type_=sa.String(100),
+        postgresql_using='karate_job_id::text',
+    )
+    op.alter_column(
+        'discovered_pages', 'state_hash',
+        type_=sa.String(64),
+        postgresql_using="encode(state_hash, 'hex')",
+    )
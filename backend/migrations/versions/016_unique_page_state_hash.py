@@ -0,0 +1,37 @@
+"""unique_page_state_hash
+
+Revision ID: 016_unique_page_state_hash
+Revises: 015_binary_hash_columns
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+
+# revision identifiers
+revision = '016_unique_page_state_hash'
+down_revision = '015_binary_hash_columns'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Keep the earliest page per (project_id, state_hash); later duplicates lose
+    # their hash rather than their row, since connections reference them by id.
+    op.execute("""
+        UPDATE discovered_pages dp
+        SET state_hash = NULL
+        WHERE state_hash IS NOT NULL
+          AND EXISTS (
+              SELECT 1 FROM discovered_pages older
+              WHERE older.project_id = dp.project_id
+                AND older.state_hash = dp.state_hash
+                AND (older.discovered_at, older.id) < (dp.discovered_at, dp.id)
+          )
+    """)
+    op.create_unique_constraint(
+        'uq_page_project_hash', 'discovered_pages', ['project_id', 'state_hash']
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint('uq_page_project_hash', 'discovered_pages', type_='unique')
@@ -0,0 +1,25 @@
+"""add_collection_daily_stats
+
+Revision ID: 017_add_collection_daily_stats
+Revises: 016_unique_page_state_hash
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+
+from app.db.views import COLLECTION_DAILY_STATS_VIEW, COLLECTION_DAILY_STATS_INDEX
+
+# revision identifiers
+revision = '017_add_collection_daily_stats'
+down_revision = '016_unique_page_state_hash'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(COLLECTION_DAILY_STATS_VIEW)
+    op.execute(COLLECTION_DAILY_STATS_INDEX)
+
+
+def downgrade() -> None:
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS mv_collection_daily_stats")
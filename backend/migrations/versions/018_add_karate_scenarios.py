@@ -0,0 +1,60 @@
+"""add_karate_scenarios
+
+Revision ID: 018_add_karate_scenarios
+Revises: 017_add_collection_daily_stats
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from app.models.karate_feature import FEATURE_CONTENT_LZ4
+
+# revision identifiers
+revision = '018_add_karate_scenarios'
+down_revision = '017_add_collection_daily_stats'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'karate_scenarios',
+        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column('feature_id', postgresql.UUID(as_uuid=True),
+                  sa.ForeignKey('karate_feature_files.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('name', sa.String(500), nullable=False),
+        sa.Column('tags', postgresql.ARRAY(sa.Text()), nullable=False),
+        sa.Column('line_number', sa.Integer(), nullable=True),
+        sa.Column('step_count', sa.Integer(), nullable=False),
+        sa.Column('is_outline', sa.Boolean(), nullable=False),
+    )
+    op.create_index('ix_karate_scenarios_feature_id', 'karate_scenarios', ['feature_id'])
+    op.create_index('ix_karate_scenarios_tags', 'karate_scenarios', ['tags'], postgresql_using='gin')
+
+    # Backfill from the scenarios already captured in parsed_metadata
+    op.execute("""
+        INSERT INTO karate_scenarios (id, feature_id, name, tags, line_number, step_count, is_outline)
+        SELECT
+            gen_random_uuid(),
+            f.id,
+            s ->> 'name',
+            COALESCE(ARRAY(SELECT jsonb_array_elements_text(s -> 'tags')), '{}'),
+            (s ->> 'line_number')::integer,
+            COALESCE((s ->> 'step_count')::integer, 0),
+            COALESCE((s ->> 'is_outline')::boolean, false)
+        FROM karate_feature_files f
+        CROSS JOIN LATERAL jsonb_array_elements(f.parsed_metadata -> 'scenarios') AS s
+        WHERE jsonb_typeof(f.parsed_metadata -> 'scenarios') = 'array'
+    """)
+
+    # Applies to values written from now on
+    op.execute(FEATURE_CONTENT_LZ4)
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE karate_feature_files ALTER COLUMN feature_content SET COMPRESSION default")
+    op.drop_index('ix_karate_scenarios_tags', table_name='karate_scenarios')
+    op.drop_index('ix_karate_scenarios_feature_id', table_name='karate_scenarios')
+    op.drop_table('karate_scenarios')
@@ -0,0 +1,63 @@
+"""cascade_foreign_keys
+
+Revision ID: 019_cascade_foreign_keys
+Revises: 018_add_karate_scenarios
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision = '019_cascade_foreign_keys'
+down_revision = '018_add_karate_scenarios'
+branch_labels = None
+depends_on = None
+
+# (table, column, referenced table, ON DELETE action). The API testing tables
+# already got ON DELETE CASCADE in 009; these were created with default FKs.
+CASCADES = [
+    ('discovered_pages', 'project_id', 'projects', 'CASCADE'),
+    ('page_connections', 'project_id', 'projects', 'CASCADE'),
+    ('page_connections', 'source_page_id', 'discovered_pages', 'CASCADE'),
+    ('page_connections', 'target_page_id', 'discovered_pages', 'CASCADE'),
+    ('test_cases', 'project_id', 'projects', 'CASCADE'),
+    ('test_cases', 'page_id', 'discovered_pages', 'SET NULL'),
+    ('test_runs', 'test_case_id', 'test_cases', 'CASCADE'),
+    ('test_runs', 'project_id', 'projects', 'CASCADE'),
+    ('test_versions', 'test_id', 'tests', 'CASCADE'),
+    ('steps', 'version_id', 'test_versions', 'CASCADE'),
+    ('runs', 'version_id', 'test_versions', 'CASCADE'),
+    ('healing_suggestions', 'run_id', 'runs', 'CASCADE'),
+    ('healing_suggestions', 'step_id', 'steps', 'CASCADE'),
+]
+
+
+def _existing(entries: list[tuple]) -> list[tuple]:
+    # No migration creates page_connections; on a fresh chain it doesn't exist
+    # yet and create_all builds it later, with these FKs, at startup
+    conn = op.get_bind()
+    return [
+        entry for entry in entries
+        if conn.execute(sa.text("SELECT to_regclass(:t)"), {"t": entry[0]}).scalar() is not None
+    ]
+
+
+def _replace_fk(table: str, column: str, ref: str, action: str | None) -> None:
+    # Unnamed FKs from create_table/create_all use Postgres' default <table>_<column>_fkey
+    name = f'{table}_{column}_fkey'
+    on_delete = f' ON DELETE {action}' if action else ''
+    op.execute(
+        f'ALTER TABLE {table} DROP CONSTRAINT IF EXISTS {name}, '
+        f'ADD CONSTRAINT {name} FOREIGN KEY ({column}) REFERENCES {ref} (id){on_delete}'
+    )
+
+
+def upgrade() -> None:
+    for table, column, ref, action in _existing(CASCADES):
+        _replace_fk(table, column, ref, action)
+
+
+def downgrade() -> None:
+    for table, column, ref, _ in _existing(CASCADES):
+        _replace_fk(table, column, ref, None)
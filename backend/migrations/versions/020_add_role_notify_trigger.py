@@ -0,0 +1,26 @@
+"""add_role_notify_trigger
+
+Revision ID: 020_add_role_notify_trigger
+Revises: 019_cascade_foreign_keys
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+
+from app.db.triggers import ROLE_NOTIFY_FUNCTION, ROLE_NOTIFY_TRIGGER
+
+# revision identifiers
+revision = '020_add_role_notify_trigger'
+down_revision = '019_cascade_foreign_keys'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(ROLE_NOTIFY_FUNCTION)
+    op.execute(ROLE_NOTIFY_TRIGGER)
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS trg_notify_role_changed ON roles")
+    op.execute("DROP FUNCTION IF EXISTS notify_role_changed()")
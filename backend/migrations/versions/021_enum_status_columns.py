@@ -0,0 +1,75 @@
+"""enum_status_columns
+
+Revision ID: 021_enum_status_columns
+Revises: 020_add_role_notify_trigger
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+
+from app.db.views import COLLECTION_DAILY_STATS_VIEW, COLLECTION_DAILY_STATS_INDEX
+from app.models.enums import (
+    RUN_STATUSES,
+    RESULT_STATUSES,
+    TRIGGER_TYPES,
+    EXECUTION_ENGINES,
+    API_ERROR_TYPES,
+)
+
+# revision identifiers
+revision = '021_enum_status_columns'
+down_revision = '020_add_role_notify_trigger'
+branch_labels = None
+depends_on = None
+
+ENUMS = {
+    'run_status': RUN_STATUSES,
+    'result_status': RESULT_STATUSES,
+    'trigger_type': TRIGGER_TYPES,
+    'execution_engine': EXECUTION_ENGINES,
+    'api_error_type': API_ERROR_TYPES,
+}
+
+# (table, column, enum type, previous varchar type, server default)
+COLUMNS = [
+    ('api_test_runs', 'status', 'run_status', 'varchar(50)', 'pending'),
+    ('api_test_runs', 'trigger_type', 'trigger_type', 'varchar(50)', None),
+    ('api_test_runs', 'engine', 'execution_engine', 'varchar(20)', 'python'),
+    ('api_test_runs', 'error_type', 'api_error_type', 'varchar(100)', None),
+    ('api_request_results', 'status', 'result_status', 'varchar(50)', None),
+    ('api_request_results', 'error_type', 'api_error_type', 'varchar(100)', None),
+    ('api_collections', 'default_engine', 'execution_engine', 'varchar(20)', 'python'),
+    ('api_requests', 'engine', 'execution_engine', 'varchar(20)', None),
+    ('api_requests', 'pre_request_script_type', 'execution_engine', 'varchar(20)', None),
+    ('api_requests', 'post_response_script_type', 'execution_engine', 'varchar(20)', None),
+]
+
+
+def _retype(to_enum: bool) -> None:
+    # The rollup view reads api_test_runs.status; Postgres refuses to retype it underneath
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS mv_collection_daily_stats")
+    for table, column, enum_name, varchar, default in COLUMNS:
+        new_type = enum_name if to_enum else varchar
+        if default:
+            op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} DROP DEFAULT")
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} TYPE {new_type} "
+            f"USING {column}::text::{new_type}"
+        )
+        if default:
+            op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} SET DEFAULT '{default}'")
+    op.execute(COLLECTION_DAILY_STATS_VIEW)
+    op.execute(COLLECTION_DAILY_STATS_INDEX)
+
+
+def upgrade() -> None:
+    for name, values in ENUMS.items():
+        labels = ", ".join(f"'{v}'" for v in values)
+        op.execute(f"CREATE TYPE {name} AS ENUM ({labels})")
+    _retype(to_enum=True)
+
+
+def downgrade() -> None:
+    _retype(to_enum=False)
+    for name in ENUMS:
+        op.execute(f"DROP TYPE {name}")
@@ -0,0 +1,63 @@
+"""dedupe_response_bodies
+
+Revision ID: 022_dedupe_response_bodies
+Revises: 021_enum_status_columns
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers
+revision = '022_dedupe_response_bodies'
+down_revision = '021_enum_status_columns'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'response_bodies',
+        sa.Column('sha', postgresql.BYTEA(), primary_key=True),
+        sa.Column('body', sa.Text(), nullable=False),
+    )
+    op.add_column('api_request_results', sa.Column('response_body_sha', postgresql.BYTEA(), nullable=True))
+
+    # Same digest as ResponseBody.digest: SHA-256 of the UTF-8 text
+    op.execute("""
+        INSERT INTO response_bodies (sha, body)
+        SELECT DISTINCT ON (sha256(convert_to(response_body, 'UTF8')))
+               sha256(convert_to(response_body, 'UTF8')), response_body
+        FROM api_request_results
+        WHERE response_body IS NOT NULL
+    """)
+    op.execute("""
+        UPDATE api_request_results
+        SET response_body_sha = sha256(convert_to(response_body, 'UTF8'))
+        WHERE response_body IS NOT NULL
+    """)
+    op.drop_column('api_request_results', 'response_body')
+
+    op.create_foreign_key(
+        'fk_api_request_results_response_body_sha', 'api_request_results', 'response_bodies',
+        ['response_body_sha'], ['sha'],
+    )
+    op.create_index(
+        'ix_arr_response_body_sha', 'api_request_results', ['response_body_sha'],
+        postgresql_where=sa.text('response_body_sha IS NOT NULL'),
+    )
+
+
+def downgrade() -> None:
+    op.add_column('api_request_results', sa.Column('response_body', sa.Text(), nullable=True))
+    op.execute("""
+        UPDATE api_request_results r
+        SET response_body = b.body
+        FROM response_bodies b
+        WHERE b.sha = r.response_body_sha
+    """)
+    op.drop_index('ix_arr_response_body_sha', table_name='api_request_results')
+    op.drop_constraint('fk_api_request_results_response_body_sha', 'api_request_results', type_='foreignkey')
+    op.drop_column('api_request_results', 'response_body_sha')
+    op.drop_table('response_bodies')
@@ -0,0 +1,35 @@
+"""add_schedule_polling_indexes
+
+Revision ID: 023_add_schedule_polling_indexes
+Revises: 022_dedupe_response_bodies
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision = '023_add_schedule_polling_indexes'
+down_revision = '022_dedupe_response_bodies'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside the migration transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_schedules_due', 'schedules', ['next_run_at'],
+            postgresql_where=sa.text('enabled = true'),
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_schedule_runs_schedule_started', 'schedule_runs', ['schedule_id', 'started_at'],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_schedule_runs_schedule_started', table_name='schedule_runs', postgresql_concurrently=True)
+        op.drop_index('ix_schedules_due', table_name='schedules', postgresql_concurrently=True)
@@ -0,0 +1,66 @@
+"""index_foreign_keys
+
+Revision ID: 024_index_foreign_keys
+Revises: 023_add_schedule_polling_indexes
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision = '024_index_foreign_keys'
+down_revision = '023_add_schedule_polling_indexes'
+branch_labels = None
+depends_on = None
+
+# FK columns that had no index. test_cases/test_runs FKs and
+# healing_suggestions.run_id were already indexed by earlier migrations.
+FK_COLUMNS = [
+    ('schedules', 'test_id'),
+    ('schedules', 'collection_id'),
+    ('tests', 'collection_id'),
+    ('test_versions', 'test_id'),
+    ('steps', 'version_id'),
+    ('runs', 'version_id'),
+    ('runs', 'schedule_run_id'),
+    ('healing_suggestions', 'step_id'),
+    ('page_connections', 'project_id'),
+    ('page_connections', 'source_page_id'),
+    ('page_connections', 'target_page_id'),
+    ('api_test_runs', 'environment_id'),
+    ('invitations', 'role_id'),
+    ('invitations', 'org_id'),
+    ('invitations', 'invited_by_id'),
+]
+
+
+def _existing(entries: list[tuple]) -> list[tuple]:
+    # No migration creates page_connections; on a fresh chain it doesn't exist
+    # yet and create_all builds it later, with these indexes, at startup
+    conn = op.get_bind()
+    return [
+        entry for entry in entries
+        if conn.execute(sa.text("SELECT to_regclass(:t)"), {"t": entry[0]}).scalar() is not None
+    ]
+
+
+def upgrade() -> None:
+    columns = _existing(FK_COLUMNS)
+    # CONCURRENTLY cannot run inside the migration transaction
+    with op.get_context().autocommit_block():
+        for table, column in columns:
+            op.create_index(
+                f'ix_{table}_{column}', table, [column],
+                postgresql_concurrently=True, if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    columns = _existing(FK_COLUMNS)
+    with op.get_context().autocommit_block():
+        for table, column in reversed(columns):
+            op.drop_index(
+                f'ix_{table}_{column}', table_name=table,
+                postgresql_concurrently=True, if_exists=True,
+            )
@@ -0,0 +1,35 @@
+"""test_runs_history_index
+
+Revision ID: 025_test_runs_history_index
+Revises: 024_index_foreign_keys
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision = '025_test_runs_history_index'
+down_revision = '024_index_foreign_keys'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside the migration transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_test_runs_case_created', 'test_runs', ['test_case_id', sa.text('created_at DESC')],
+            postgresql_concurrently=True,
+        )
+        # Covered by the leading column of the new index
+        op.drop_index('ix_test_runs_test_case_id', table_name='test_runs', postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_test_runs_test_case_id', 'test_runs', ['test_case_id'],
+            postgresql_concurrently=True,
+        )
+        op.drop_index('ix_test_runs_case_created', table_name='test_runs', postgresql_concurrently=True)
@@ -0,0 +1,64 @@
+"""enum_test_case_schedule_columns
+
+Revision ID: 026_enum_test_case_schedule
+Revises: 025_test_runs_history_index
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+
+from app.models.enums import (
+    TEST_CASE_STATUSES,
+    TEST_CASE_SOURCES,
+    TEST_RUN_STATUSES,
+    SCHEDULE_FREQUENCIES,
+)
+
+# revision identifiers
+revision = '026_enum_test_case_schedule'
+down_revision = '025_test_runs_history_index'
+branch_labels = None
+depends_on = None
+
+ENUMS = {
+    'test_case_status': TEST_CASE_STATUSES,
+    'test_case_source': TEST_CASE_SOURCES,
+    'test_run_status': TEST_RUN_STATUSES,
+    'schedule_frequency': SCHEDULE_FREQUENCIES,
+}
+
+# (table, column, enum type, previous varchar type, server default)
+COLUMNS = [
+    ('test_cases', 'status', 'test_case_status', 'varchar(50)', 'pending'),
+    ('test_cases', 'source', 'test_case_source', 'varchar(50)', 'suggested'),
+    ('test_cases', 'last_run_status', 'run_status', 'varchar(50)', None),
+    ('test_runs', 'status', 'test_run_status', 'varchar(50)', 'queued'),
+    ('schedules', 'frequency', 'schedule_frequency', 'varchar(50)', None),
+    ('schedules', 'last_run_status', 'run_status', 'varchar(20)', None),
+]
+
+
+def _retype(to_enum: bool) -> None:
+    for table, column, enum_name, varchar, default in COLUMNS:
+        new_type = enum_name if to_enum else varchar
+        if default:
+            op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} DROP DEFAULT")
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} TYPE {new_type} "
+            f"USING {column}::text::{new_type}"
+        )
+        if default:
+            op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} SET DEFAULT '{default}'")
+
+
+def upgrade() -> None:
+    for name, values in ENUMS.items():
+        labels = ", ".join(f"'{v}'" for v in values)
+        op.execute(f"CREATE TYPE {name} AS ENUM ({labels})")
+    _retype(to_enum=True)
+
+
+def downgrade() -> None:
+    _retype(to_enum=False)
+    for name in ENUMS:
+        op.execute(f"DROP TYPE {name}")
@@ -0,0 +1,78 @@
+"""server_side_timestamps
+
+Revision ID: 027_server_side_timestamps
+Revises: 026_enum_test_case_schedule
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.db.triggers import SET_UPDATED_AT_FUNCTION, updated_at_trigger
+
+# revision identifiers
+revision = '027_server_side_timestamps'
+down_revision = '026_enum_test_case_schedule'
+branch_labels = None
+depends_on = None
+
+# Tables with created_at + updated_at
+TIMESTAMPED_TABLES = [
+    'organizations',
+    'users',
+    'roles',
+    'user_settings',
+    'collections',
+    'tests',
+    'schedules',
+    'projects',
+    'test_cases',
+    'api_collections',
+    'api_environments',
+    'api_requests',
+    'karate_feature_files',
+]
+
+# Other insert-time timestamp columns
+INSERT_TIMESTAMPS = [
+    ('test_versions', 'created_at'),
+    ('steps', 'created_at'),
+    ('runs', 'started_at'),
+    ('schedule_runs', 'started_at'),
+    ('discovered_pages', 'discovered_at'),
+    ('page_connections', 'created_at'),
+    ('test_runs', 'created_at'),
+    ('healing_suggestions', 'created_at'),
+    ('invitations', 'created_at'),
+    ('api_test_runs', 'created_at'),
+]
+
+
+def _columns():
+    # No migration creates page_connections; on a fresh chain it doesn't exist
+    # yet and create_all builds it later, with the server default, at startup
+    conn = op.get_bind()
+    for table, column in [
+        *((table, column) for table in TIMESTAMPED_TABLES for column in ('created_at', 'updated_at')),
+        *INSERT_TIMESTAMPS,
+    ]:
+        if conn.execute(sa.text("SELECT to_regclass(:t)"), {"t": table}).scalar() is not None:
+            yield table, column
+
+
+def upgrade() -> None:
+    for table, column in _columns():
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} SET DEFAULT timezone('utc', now())")
+
+    op.execute(SET_UPDATED_AT_FUNCTION)
+    for table in TIMESTAMPED_TABLES:
+        op.execute(updated_at_trigger(table))
+
+
+def downgrade() -> None:
+    for table in TIMESTAMPED_TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS trg_{table}_set_updated_at ON {table}")
+    op.execute("DROP FUNCTION IF EXISTS set_updated_at()")
+
+    for table, column in _columns():
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} DROP DEFAULT")
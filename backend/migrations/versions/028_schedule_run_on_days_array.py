@@ -0,0 +1,34 @@
+"""schedule_run_on_days_array
+
+Revision ID: 028_schedule_run_on_days_array
+Revises: 027_server_side_timestamps
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers
+revision = '028_schedule_run_on_days_array'
+down_revision = '027_server_side_timestamps'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.alter_column(
+        'schedules', 'run_on_days',
+        type_=postgresql.ARRAY(sa.SmallInteger()),
+        postgresql_using="string_to_array(NULLIF(replace(run_on_days, ' ', ''), ''), ',')::smallint[]",
+    )
+    op.create_index('ix_schedules_run_on_days', 'schedules', ['run_on_days'], postgresql_using='gin')
+
+
+def downgrade() -> None:
+    op.drop_index('ix_schedules_run_on_days', table_name='schedules')
+    op.alter_column(
+        'schedules', 'run_on_days',
+        type_=sa.String(50),
+        postgresql_using="array_to_string(run_on_days, ',')",
+    )
@@ -0,0 +1,58 @@
+"""permission_set_bits
+
+Revision ID: 029_permission_set_bits
+Revises: 028_schedule_run_on_days_array
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision = '029_permission_set_bits'
+down_revision = '028_schedule_run_on_days_array'
+branch_labels = None
+depends_on = None
+
+# Frozen copy of app.models.permission_set.PERMISSION_BITS as of this revision,
+# so the backfill never changes if that table grows
+PERMISSION_BITS = {
+    name: 1 << i
+    for i, name in enumerate((
+        "manage_users",
+        "manage_org",
+        "manage_roles",
+        "manage_tests",
+        "run_tests",
+        "view_tests",
+        "manage_schedules",
+        "view_schedules",
+        "manage_settings",
+        "view_dashboard",
+        "view_admin_dashboard",
+    ))
+}
+
+
+def _encode_bits(perms: dict) -> int:
+    bits = 0
+    for name, granted in perms.items():
+        if granted and name in PERMISSION_BITS:
+            bits |= PERMISSION_BITS[name]
+    return bits
+
+
+def upgrade() -> None:
+    op.add_column('permission_sets', sa.Column('bits', sa.BigInteger(), nullable=False, server_default='0'))
+
+    # Project each set's flags onto the bitmap
+    conn = op.get_bind()
+    for row in conn.execute(sa.text("SELECT id, perms FROM permission_sets")).fetchall():
+        conn.execute(
+            sa.text("UPDATE permission_sets SET bits = :bits WHERE id = :id"),
+            {"bits": _encode_bits(row.perms or {}), "id": row.id},
+        )
+
+
+def downgrade() -> None:
+    op.drop_column('permission_sets', 'bits')
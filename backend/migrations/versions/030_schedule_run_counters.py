@@ -0,0 +1,50 @@
+"""schedule_run_counters
+
+Revision ID: 030_schedule_run_counters
+Revises: 029_permission_set_bits
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.db.triggers import SCHEDULE_RUN_BUMP_COUNTERS_FUNCTION, SCHEDULE_RUN_BUMP_COUNTERS_TRIGGER
+
+# revision identifiers
+revision = '030_schedule_run_counters'
+down_revision = '029_permission_set_bits'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('schedules', sa.Column('total_runs', sa.Integer(), nullable=False, server_default='0'))
+    op.add_column('schedules', sa.Column('total_passed', sa.Integer(), nullable=False, server_default='0'))
+    op.add_column('schedules', sa.Column('total_failed', sa.Integer(), nullable=False, server_default='0'))
+
+    # Backfill from existing history, then let the trigger keep them current
+    op.execute("""
+        UPDATE schedules SET
+            total_runs = s.runs,
+            total_passed = s.passed,
+            total_failed = s.failed
+        FROM (
+            SELECT schedule_id,
+                   count(*) AS runs,
+                   count(*) FILTER (WHERE status = 'passed') AS passed,
+                   count(*) FILTER (WHERE status = 'failed') AS failed
+            FROM schedule_runs
+            GROUP BY schedule_id
+        ) AS s
+        WHERE schedules.id = s.schedule_id
+    """)
+    op.execute(SCHEDULE_RUN_BUMP_COUNTERS_FUNCTION)
+    op.execute(SCHEDULE_RUN_BUMP_COUNTERS_TRIGGER)
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS trg_schedule_run_bump_counters ON schedule_runs")
+    op.execute("DROP FUNCTION IF EXISTS schedule_run_bump_counters()")
+    op.drop_column('schedules', 'total_failed')
+    op.drop_column('schedules', 'total_passed')
+    op.drop_column('schedules', 'total_runs')